@@ -0,0 +1,66 @@
+# app/api/v1/analytics/router.py
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.connection import get_async_db
+from app.services.hiring_analytics import hiring_analytics
+
+# ----------------------------------------------------------------------
+# Prefix "/api/v1/analytics" is added in main.py
+# Answers come from in-process rollups, at most ANALYTICS_REFRESH_SECONDS old
+# ----------------------------------------------------------------------
+router = APIRouter()
+
+
+@router.get("/funnel")
+async def get_funnel(
+    job_id: Optional[int] = Query(None),
+    source: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Applications reaching each stage (applied → shortlisted → interview_scheduled → offered → hired)
+    with stage-to-stage conversion, for all jobs or one job and/or source.
+    """
+    await hiring_analytics.refresh(db)
+    return hiring_analytics.funnel(job_id, source)
+
+
+@router.get("/funnel/breakdown", response_model=List[dict])
+async def get_funnel_breakdown(
+    by: Literal["job", "source"] = Query("job"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Funnel counts per job or per source, largest first.
+    """
+    await hiring_analytics.refresh(db)
+    return hiring_analytics.breakdown(by)
+
+
+@router.get("/time-in-stage")
+async def get_time_in_stage(
+    job_id: Optional[int] = Query(None),
+    source: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Average days current applications have spent in their status, and per completed stay.
+    """
+    await hiring_analytics.refresh(db)
+    return hiring_analytics.time_in_stage(job_id, source)
+
+
+@router.get("/scores")
+async def get_scores(
+    job_id: Optional[int] = Query(None),
+    source: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Average resume score and interview final rating.
+    """
+    await hiring_analytics.refresh(db)
+    return hiring_analytics.scores(job_id, source)
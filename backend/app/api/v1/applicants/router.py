@@ -1,11 +1,24 @@
 # app/api/v1/applicants/router.py
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from datetime import datetime
 from typing import Optional, List
 
-from app.db.connection import get_db
-from app.services.applicant_service import create_applicant, get_all_applicants
-from app.api.v1.applicants.schemas import ApplicantCreate   # keep if you need the schema later
+from app.db.connection import get_async_db, get_db
+from app.services.applicant_service import create_applicant, list_applicants, stream_applicants
+from app.services.application_status_service import (
+    get_status_history,
+    transition_application,
+    transition_applications,
+)
+from app.services.bulk_import import bulk_import_applicants
+from app.services.score_export import SCORE_EXPORT_FORMATS, require_pyarrow, stream_score_snapshot
+from app.services.scoring_queue import get_scoring_task
+from app.services.resume_upload import save_resume
+from app.services.vector_index import top_candidates_for_job, similar_applicants
+from app.api.v1.applicants.schemas import ApplicantCreate, ApplicantFilters, StatusChange, StatusTransitionRequest
 
 # ----------------------------------------------------------------------
 # IMPORTANT: the variable **must** be named `router`
@@ -14,7 +27,7 @@ router = APIRouter()          # <-- this is what main.py imports as `applicants_
 # ----------------------------------------------------------------------
 
 
-@router.post("/applicants", status_code=201)
+@router.post("/applicants", status_code=202)
 async def add_applicant(
     job_id: int = Form(...),
     source: str = Form(...),
@@ -35,10 +48,11 @@ async def add_applicant(
     location: Optional[str] = Form(None),
 
     resume: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create a new applicant (multipart/form-data).
+    Resume scoring runs in the background; poll `/scoring-tasks/{task_id}` for the result.
     """
     applicant_data = {
         "first_name": first_name,
@@ -56,33 +70,204 @@ async def add_applicant(
         "location": location,
     }
 
+    # Streamed to disk in chunks, hashed and de-duplicated before any DB work
+    stored_resume = await save_resume(resume)
+
     try:
-        applicant_id = create_applicant(
+        created = await create_applicant(
             db,
             applicant_data,
-            resume,
+            stored_resume,
+            job_id,
+            source,
+            application_status,
+        )
+    except HTTPException:
+        raise
+    except Exception as exc:          # pragma: no cover
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    return {
+        "message": "Applicant created successfully, resume scoring queued",
+        "applicant_id": created["applicant_id"],
+        "application_id": created["application_id"],
+        "scoring_task_id": created["scoring_task_id"],
+        "resume_deduplicated": stored_resume.deduplicated,
+    }
+
+
+@router.post("/applicants/bulk")
+def bulk_add_applicants(
+    job_id: int = Form(...),
+    source: str = Form("bulk_import"),
+    application_status: str = Form("applied"),
+    applicants_csv: UploadFile = File(..., description="One row per applicant; resume_filename names a file in the ZIP"),
+    resumes_zip: Optional[UploadFile] = File(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk-create applicants for a job from a CSV plus a ZIP of resumes.
+    Inserts run in batches; scoring is queued for every applicant with a resume.
+    Returns a per-row report. Sync handler: CSV/ZIP parsing and the batched
+    fast_executemany inserts run on the threadpool with a sync session.
+    """
+    try:
+        return bulk_import_applicants(
+            db,
+            applicants_csv.file,
+            resumes_zip.file if resumes_zip else None,
             job_id,
             source,
             application_status,
         )
+    except HTTPException as exc:
+        raise exc
+    except Exception as exc:          # pragma: no cover
+        raise HTTPException(status_code=500, detail=f"Bulk import failed: {str(exc)}") from exc
+
+
+@router.get("/scoring-tasks/{task_id}")
+async def read_scoring_task(task_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Poll the status of a background resume scoring task.
+    """
+    try:
+        return await get_scoring_task(db, task_id)
+    except HTTPException as exc:
+        raise exc
     except Exception as exc:          # pragma: no cover
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    return {"message": "Applicant created successfully", "applicant_id": applicant_id}
+
+def applicant_filters(
+    job_id: Optional[int] = Query(None),
+    status: Optional[List[str]] = Query(None, description="Repeat to match several statuses"),
+    min_score: Optional[float] = Query(None, description="Minimum resume_overall_score"),
+    max_score: Optional[float] = Query(None, description="Maximum resume_overall_score"),
+    location: Optional[str] = Query(None, description="Substring of the applicant's location"),
+) -> ApplicantFilters:
+    return ApplicantFilters(job_id=job_id, status=status, min_score=min_score, max_score=max_score, location=location)
 
 
 @router.get("/applicants", response_model=List[dict])
-async def get_applicants(db: Session = Depends(get_db)):
+async def get_applicants(
+    response: Response,
+    filters: ApplicantFilters = Depends(applicant_filters),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db),
+):
     """
-    Return **all** applicants.
+    One page of applicants, newest first.
+    The cursor for the next page is returned in the `X-Next-Cursor` header (absent on the last page).
     """
     try:
-        applicants = get_all_applicants(db)
-        if not applicants:
-            raise HTTPException(status_code=404, detail="No applicants found")
-        return applicants
+        applicants, next_cursor = await list_applicants(db, filters, cursor, limit)
+    except HTTPException as exc:
+        raise exc
     except Exception as exc:          # pragma: no cover
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching applicants: {str(exc)}",
-        ) from exc
\ No newline at end of file
+        ) from exc
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return applicants
+
+
+@router.get("/applicants/export")
+async def export_applicants(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    filters: ApplicantFilters = Depends(applicant_filters),
+):
+    """
+    Stream every matching applicant as NDJSON or CSV, straight from a server-side cursor.
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_applicants(filters, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="applicants.{format}"'},
+    )
+
+
+@router.post("/applications/status")
+async def bulk_change_status(request: StatusTransitionRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Move many applications to one status (e.g. shortlist after scoring) in a single
+    database round trip. Moves the lifecycle doesn't allow are reported, not applied.
+    """
+    return await transition_applications(
+        db, request.application_ids, request.to_status, request.reason, request.changed_by
+    )
+
+
+@router.patch("/applications/{application_id}/status")
+async def change_status(application_id: int, change: StatusChange, db: AsyncSession = Depends(get_async_db)):
+    """
+    Move one application to a new status; 409 if the lifecycle doesn't allow it.
+    """
+    return await transition_application(db, application_id, change.to_status, change.reason, change.changed_by)
+
+
+@router.get("/applications/{application_id}/status-history", response_model=List[dict])
+async def read_status_history(application_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Every status transition of an application, oldest first.
+    """
+    return await get_status_history(db, application_id)
+
+
+@router.get("/scores/export")
+async def export_score_snapshot(
+    format: str = Query("parquet", pattern="^(parquet|arrow)$"),
+    job_id: Optional[int] = Query(None),
+    status: Optional[List[str]] = Query(None, description="Repeat to match several statuses"),
+    updated_since: Optional[datetime] = Query(None, description="Only applications changed since then"),
+):
+    """
+    Stream application scores with their interview ratings as Parquet or Arrow IPC
+    (stream format), one row group per cursor batch, for offline ranking analysis.
+    """
+    require_pyarrow()
+    extension, media_type = SCORE_EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream_score_snapshot(format, job_id, status, updated_since),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="application_scores.{extension}"'},
+    )
+
+
+@router.get("/search/top-for-job/{job_id}", response_model=List[dict])
+async def get_top_candidates_for_job(
+    job_id: int,
+    k: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Top-k applicants across the whole pool for a job, by resume/JD similarity.
+    """
+    try:
+        return await top_candidates_for_job(db, job_id, k)
+    except HTTPException as exc:
+        raise exc
+    except Exception as exc:          # pragma: no cover
+        raise HTTPException(status_code=500, detail=f"Error searching candidates: {str(exc)}") from exc
+
+
+@router.get("/search/similar/{applicant_id}", response_model=List[dict])
+async def get_similar_applicants(
+    applicant_id: int,
+    k: int = Query(10, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Applicants whose resumes are most similar to the given applicant's resume.
+    """
+    try:
+        return await similar_applicants(db, applicant_id, k)
+    except HTTPException as exc:
+        raise exc
+    except Exception as exc:          # pragma: no cover
+        raise HTTPException(status_code=500, detail=f"Error searching candidates: {str(exc)}") from exc
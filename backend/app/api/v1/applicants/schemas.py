@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, constr, condecimal
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field, constr, condecimal
+from typing import List, Literal, Optional
 
 class ApplicantCreate(BaseModel):
     first_name: str
@@ -19,5 +19,54 @@ class ApplicantCreate(BaseModel):
     source: str  # This will be part of the schema
     application_status: str  # This will be part of the schema
 
-   
 
+class ApplicantFilters(BaseModel):
+    """Server-side filters for the applicants listing and export."""
+    job_id: Optional[int] = None
+    status: Optional[List[str]] = None
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    location: Optional[str] = None
+
+
+APPLICATION_STATUSES = (
+    "applied", "shortlisted", "under_review", "interview_scheduled", "offered", "rejected", "hired",
+)
+
+
+class BulkApplicantRow(BaseModel):
+    """One CSV row of a bulk import; `resume_filename` names a file inside the uploaded ZIP.
+
+    Bounds follow the column types, so an out-of-range cell fails its own row here
+    instead of the whole insert batch in the database.
+    """
+    first_name: constr(min_length=1, max_length=50)
+    last_name: constr(min_length=1, max_length=50)
+    email: EmailStr = Field(..., max_length=100)                              # VARCHAR(100)
+    phone: Optional[constr(max_length=20)] = None
+    linkedin_url: Optional[constr(max_length=255)] = None
+    experience_years: Optional[float] = Field(None, ge=0, le=999.9)           # DECIMAL(4,1)
+    education: Optional[constr(max_length=255)] = None
+    current_company: Optional[constr(max_length=255)] = None
+    current_role: Optional[constr(max_length=100)] = None
+    expected_ctc: Optional[float] = Field(None, ge=0, le=99_999_999.99)       # DECIMAL(10,2)
+    notice_period_days: Optional[int] = Field(None, ge=0, le=2_147_483_647)  # INT
+    skills: Optional[str] = None
+    location: Optional[constr(max_length=100)] = None
+    comments: Optional[str] = None
+    resume_filename: Optional[str] = None
+
+
+class StatusTransitionRequest(BaseModel):
+    """Move many applications to one status; each is checked against the lifecycle."""
+    # Each id is bound twice in the batch; SQL Server accepts at most 2100 parameters
+    application_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    to_status: Literal[APPLICATION_STATUSES]
+    reason: Optional[constr(max_length=500)] = None
+    changed_by: Optional[int] = None
+
+
+class StatusChange(BaseModel):
+    to_status: Literal[APPLICATION_STATUSES]
+    reason: Optional[constr(max_length=500)] = None
+    changed_by: Optional[int] = None
@@ -0,0 +1,17 @@
+# app/api/v1/auth/router.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.connection import get_async_db
+from app.services.auth_service import authenticate
+from app.api.v1.auth.schemas import LoginRequest, LoginResponse
+
+router = APIRouter()
+
+
+@router.post("/login", response_model=LoginResponse)
+async def login(credentials: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Verify an email and password; returns a bearer token and the user's profile.
+    """
+    return await authenticate(db, credentials.email, credentials.password)
@@ -0,0 +1,28 @@
+# app/api/v1/auth/schemas.py
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, EmailStr, constr
+
+
+class LoginRequest(BaseModel):
+    email: EmailStr
+    password: constr(min_length=1, max_length=255)
+
+
+class AuthenticatedUser(BaseModel):
+    emp_id: int
+    username: str
+    email: str
+    role: Optional[str] = None
+    full_name: Optional[str] = None
+    department: Optional[str] = None
+    designation: Optional[str] = None
+    status: Optional[str] = None
+    last_login: Optional[datetime] = None
+
+
+class LoginResponse(BaseModel):
+    token: str
+    token_type: str = "bearer"
+    user: AuthenticatedUser
@@ -1,16 +1,23 @@
 # app/api/v1/hr/job.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from app.db.connection import get_db
-from app.api.v1.hr.schemas import JobCreate, JobResponse
+from app.db.connection import get_async_db, get_db
+from app.api.v1.hr.schemas import JobCreate, JobUpdate, JobResponse, JobListResponse, WhatIfWeights
+from app.core.cache import CachedEntry, etag_matches
 from app.services.job_service import (
     create_job,
-    get_active_jobs,
-    get_job_by_id,
+    get_active_jobs_cached,
+    get_job_by_id_cached,
+    resolve_job_fields,
+    update_job,
 )
+from app.services.batch_scoring import rescore_job
+from app.services.score_reranking import component_score_cache, what_if_ranking
+from app.services.scoring_weights import ScoringWeights
 
 
 # ----------------------------------------------------------------------
@@ -20,13 +27,25 @@ from app.services.job_service import (
 router = APIRouter(tags=["HR Jobs"])
 
 
+def conditional_response(request: Request, entry: CachedEntry) -> Response:
+    """Answer 304 when the client's If-None-Match still matches, else send the cached body.
+
+    The body was encoded once when it was cached, so large text columns are not
+    re-validated against the response model or re-serialized on every hit.
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
 @router.post("/", status_code=201, response_model=Dict[str, Any])
-def add_job(job: JobCreate, db: Session = Depends(get_db)):
+async def add_job(job: JobCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new job posting.
     """
     try:
-        result = create_job(db, job)
+        result = await create_job(db, job)
         return {"message": "Job created successfully", "data": result}
     except HTTPException as exc:
         raise exc
@@ -36,28 +55,82 @@ def add_job(job: JobCreate, db: Session = Depends(get_db)):
 
 # app/api/v1/hr/job.py
 
-@router.get("/", response_model=dict)
-def list_active_jobs(db: Session = Depends(get_db)):
+@router.get("/", response_model=JobListResponse)
+async def list_active_jobs(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated columns, e.g. title,location,key_skills"),
+    include_jd: bool = Query(False, description="Also return the full job description"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Open jobs, newest first, as a summary projection (no full JD unless asked for).
+    Served from the job cache; supports If-None-Match.
+    """
+    columns = resolve_job_fields(fields, include_jd)
     try:
-        jobs = get_active_jobs(db)
-        return {"active_jobs": jobs}
+        entry = await get_active_jobs_cached(db, columns)
+        return conditional_response(request, entry)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def read_job(job_id: int, db: Session = Depends(get_db)):
+async def read_job(job_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Get a single job by ID.
     Used by frontend: http://localhost:8000/api/v1/hr/jobs/2
+    Served from the job cache; supports If-None-Match.
     """
     try:
-        job = get_job_by_id(db, job_id)
-        return job
+        entry = await get_job_by_id_cached(db, job_id)
+        return conditional_response(request, entry)
     except HTTPException as exc:
         raise exc
     except Exception as exc:
         raise HTTPException(
             status_code=500,
             detail=f"Database error: {str(exc)}"
-        ) from exc
\ No newline at end of file
+        ) from exc
+
+
+@router.put("/{job_id}", response_model=JobResponse)
+async def edit_job(job_id: int, job: JobUpdate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Update a job posting. Only the fields sent in the body are changed.
+    """
+    try:
+        return await update_job(db, job_id, job)
+    except HTTPException as exc:
+        raise exc
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=f"Failed to update job: {str(exc)}") from exc
+
+
+@router.post("/{job_id}/rescore", response_model=Dict[str, Any])
+def rescore_job_applicants(job_id: int, db: Session = Depends(get_db)):
+    """
+    Re-score every applicant of a job, e.g. after its JD or skills were edited.
+    Reports throughput in resumes per second. Long-running and CPU-bound, so this
+    stays a sync handler on the threadpool with a sync session.
+    """
+    try:
+        return rescore_job(db, job_id)
+    except HTTPException as exc:
+        raise exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to rescore job: {str(exc)}") from exc
+
+
+@router.post("/{job_id}/what-if", response_model=Dict[str, Any])
+async def what_if_job_ranking(job_id: int, body: WhatIfWeights, db: AsyncSession = Depends(get_async_db)):
+    """
+    Preview how the job's applicants would rank under other scoring weights, without
+    changing anything. Weights left out keep the job's current value. Re-ranks the
+    stored component scores in memory; no resume is re-parsed or re-encoded.
+    """
+    current = (await component_score_cache.get_or_load(db, job_id)).weights
+    weights = ScoringWeights(
+        semantic=body.semantic_weight if body.semantic_weight is not None else current.semantic,
+        high_skill=body.high_skill_weight if body.high_skill_weight is not None else current.high_skill,
+    )
+    return await what_if_ranking(db, job_id, weights, body.limit)
@@ -1,6 +1,6 @@
 # app/api/v1/hr/schemas.py
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class JobCreate(BaseModel):
@@ -17,6 +17,8 @@ class JobCreate(BaseModel):
     jd: Optional[str] = None
     key_skills: Optional[str] = None
     additional_skills: Optional[str] = None
+    semantic_weight: Optional[float] = Field(None, ge=0, le=1, description="Default: SCORING_SEMANTIC_WEIGHT")
+    high_skill_weight: Optional[float] = Field(None, ge=0, le=1, description="Default: SCORING_HIGH_SKILL_WEIGHT")
     openings: Optional[int] = 1
     posted_date: Optional[datetime] = None
     closing_date: Optional[datetime] = None
@@ -28,6 +30,29 @@ class JobCreate(BaseModel):
         from_attributes = True
 
 
+class JobUpdate(BaseModel):
+    title: Optional[str] = None
+    job_code: Optional[str] = None
+    department: Optional[str] = None
+    location: Optional[str] = None
+    employment_type: Optional[str] = Field(
+        None, pattern="^(Full-time|Part-time|Contract|Internship)$"
+    )
+    experience_required: Optional[str] = None
+    salary_range: Optional[str] = None
+    jd: Optional[str] = None
+    key_skills: Optional[str] = None
+    additional_skills: Optional[str] = None
+    semantic_weight: Optional[float] = Field(None, ge=0, le=1)
+    high_skill_weight: Optional[float] = Field(None, ge=0, le=1)
+    openings: Optional[int] = None
+    posted_date: Optional[datetime] = None
+    closing_date: Optional[datetime] = None
+    status: Optional[str] = Field(None, pattern="^(open|on_hold|closed)$")
+    approved_by: Optional[int] = None
+    approved_date: Optional[datetime] = None
+
+
 # app/api/v1/hr/schemas.py
 
 class JobResponse(BaseModel):
@@ -43,6 +68,8 @@ class JobResponse(BaseModel):
     jd: Optional[str] = None
     key_skills: Optional[str] = None
     additional_skills: Optional[str] = None
+    semantic_weight: Optional[float] = None
+    high_skill_weight: Optional[float] = None
     openings: Optional[int] = 1
     posted_date: Optional[datetime] = None
     closing_date: Optional[datetime] = None
@@ -51,4 +78,29 @@ class JobResponse(BaseModel):
     approved_date: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class JobSummary(BaseModel):
+    """Job list item. Only the projected fields are present; `jd` only with include_jd=true."""
+    job_id: int
+    title: Optional[str] = None
+    job_code: Optional[str] = None
+    department: Optional[str] = None
+    location: Optional[str] = None
+    employment_type: Optional[str] = None
+    openings: Optional[int] = None
+    posted_date: Optional[datetime] = None
+    closing_date: Optional[datetime] = None
+    status: Optional[str] = None
+    jd_preview: Optional[str] = None
+
+
+class JobListResponse(BaseModel):
+    active_jobs: List[JobSummary]
+
+
+class WhatIfWeights(BaseModel):
+    """Weights to try for a job; an omitted weight keeps the job's current one."""
+    semantic_weight: Optional[float] = Field(None, ge=0, le=1)
+    high_skill_weight: Optional[float] = Field(None, ge=0, le=1)
+    limit: int = Field(50, ge=1, le=1000, description="How many of the re-ranked applicants to return")
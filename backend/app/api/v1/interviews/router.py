@@ -0,0 +1,100 @@
+# app/api/v1/interviews/router.py
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.connection import get_async_db
+from app.services.interview_calendar import parse_interviewer_ids
+from app.services.interview_service import (
+    find_conflicts,
+    find_free_slots,
+    list_interviews,
+    schedule_interview,
+    update_interview,
+)
+from app.api.v1.interviews.schemas import (
+    MAX_DURATION_MINUTES,
+    InterviewScheduleCreate,
+    InterviewScheduleUpdate,
+    to_server_time,
+)
+
+# ----------------------------------------------------------------------
+# Prefix "/api/v1/interviews" is added in main.py
+# ----------------------------------------------------------------------
+router = APIRouter()
+
+
+def _interviewer_ids(interviewer_ids: str) -> List[int]:
+    ids = parse_interviewer_ids(interviewer_ids)
+    if not ids:
+        raise HTTPException(status_code=400, detail="interviewer_ids must be a comma-separated list of ids")
+    return ids
+
+
+def server_time_query(name: str, required: bool = False, description: Optional[str] = None):
+    """Query parameter dependency giving a datetime in naive server-local time (see ``to_server_time``)."""
+    def dependency(value: Optional[datetime] = Query(... if required else None, alias=name, description=description)):
+        return to_server_time(value)
+    return dependency
+
+
+@router.post("/schedule", status_code=201)
+async def create_schedule(schedule: InterviewScheduleCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Book an interview round; 409 with the clashing bookings and suggested slots on a conflict.
+    """
+    return await schedule_interview(db, schedule)
+
+
+@router.put("/schedule/{schedule_id}")
+async def edit_schedule(schedule_id: int, changes: InterviewScheduleUpdate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Reschedule, reassign, complete or cancel an interview round.
+    """
+    return await update_interview(db, schedule_id, changes)
+
+
+@router.get("/schedule", response_model=List[dict])
+async def get_schedule(application_id: int = Query(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    All interview rounds of an application.
+    """
+    return await list_interviews(db, application_id)
+
+
+@router.get("/conflicts", response_model=List[dict])
+async def get_conflicts(
+    interviewer_ids: str = Query(..., description="Comma-separated interviewer ids"),
+    start: datetime = Depends(server_time_query("start", required=True)),
+    duration_minutes: int = Query(60, gt=0, le=MAX_DURATION_MINUTES),
+    manager_id: Optional[int] = Query(None),
+    exclude_schedule_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Existing bookings that would clash with the proposed interview.
+    """
+    return await find_conflicts(
+        db, _interviewer_ids(interviewer_ids), manager_id, start, duration_minutes, exclude_schedule_id
+    )
+
+
+@router.get("/free-slots", response_model=List[dict])
+async def get_free_slots(
+    interviewer_ids: str = Query(..., description="Comma-separated interviewer ids"),
+    duration_minutes: int = Query(60, gt=0, le=MAX_DURATION_MINUTES),
+    manager_id: Optional[int] = Query(None),
+    window_start: Optional[datetime] = Depends(server_time_query("window_start", description="Default: now")),
+    window_end: Optional[datetime] = Depends(server_time_query("window_end")),
+    limit: int = Query(5, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Earliest slots, within working hours, where all interviewers and the manager are free.
+    """
+    return await find_free_slots(
+        db, _interviewer_ids(interviewer_ids), manager_id, duration_minutes, window_start, window_end, limit
+    )
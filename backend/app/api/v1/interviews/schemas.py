@@ -0,0 +1,46 @@
+# app/api/v1/interviews/schemas.py
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+MAX_DURATION_MINUTES = 8 * 60
+
+
+def to_server_time(value: Optional[datetime]) -> Optional[datetime]:
+    """Naive server-local time, like the DATETIME columns and the calendar index.
+
+    Offsets such as the ``Z`` of JS ``toISOString()`` are converted, not dropped.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+class InterviewScheduleCreate(BaseModel):
+    application_id: int
+    round_number: int = 1
+    round_type: Optional[str] = None
+    scheduled_date: datetime
+    duration_minutes: int = Field(60, gt=0, le=MAX_DURATION_MINUTES)
+    interviewer_ids: List[int] = Field(..., min_length=1)
+    manager_id: Optional[int] = None
+    meeting_link: Optional[str] = None
+    location: Optional[str] = None
+    remarks: Optional[str] = None
+    created_by: Optional[int] = None
+
+    _server_time = field_validator("scheduled_date")(to_server_time)
+
+
+class InterviewScheduleUpdate(BaseModel):
+    scheduled_date: Optional[datetime] = None
+    duration_minutes: Optional[int] = Field(None, gt=0, le=MAX_DURATION_MINUTES)
+    interviewer_ids: Optional[List[int]] = Field(None, min_length=1)
+    manager_id: Optional[int] = None
+    meeting_link: Optional[str] = None
+    location: Optional[str] = None
+    remarks: Optional[str] = None
+    schedule_status: Optional[str] = Field(None, pattern="^(scheduled|completed|cancelled|rescheduled)$")
+
+    _server_time = field_validator("scheduled_date")(to_server_time)
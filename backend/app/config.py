@@ -1,6 +1,6 @@
 # app/config.py
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "UBTI Hiring Portal"
@@ -10,10 +10,129 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    DB_DRIVER: str = "ODBC Driver 17 for SQL Server"
+    # Full SQLAlchemy URLs that replace the DB_* parts above (e.g. a local stand-in database)
+    DB_URL: Optional[str] = None
+    DB_ASYNC_URL: Optional[str] = None
+
+    # Connection pool (app/db/connection.py)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    # Lets a request opt into SQL logging (statements and bound parameters) with the
+    # `X-SQL-Trace: 1` header; honoured only with a valid access token whose role is
+    # listed in DB_SQL_TRACE_ROLES (comma-separated)
+    DB_SQL_TRACE_HEADER_ENABLED: bool = False
+    DB_SQL_TRACE_ROLES: str = "Management"
+    # Adds an `X-Query-Count` header (database round trips) to every response
+    DB_QUERY_COUNT_HEADER_ENABLED: bool = True
+
+    # Logging pipeline (app/core/logging.py)
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"            # "json" or "text"
+    LOG_QUEUE_SIZE: int = 10000         # records beyond this are dropped, never waited for
+    LOG_DEBUG_SAMPLE_RATE: float = 0.01  # share of DEBUG records kept
+    LOG_REDACT_PII: bool = True
+
+    # Request metrics and `/metrics` endpoint (app/core/metrics.py)
+    METRICS_ENABLED: bool = True
+    SLOW_REQUEST_THRESHOLD_MS: float = 1000.0   # log a timing breakdown above this
 
     # ← CHANGE: Accept as string from .env
     BACKEND_CORS_ORIGINS: str = ""
 
+    # Background resume scoring (app/services/scoring_queue.py)
+    SCORING_WORKERS: int = 2
+    SCORING_MAX_ATTEMPTS: int = 3
+    SCORING_RETRY_BACKOFF_SECONDS: float = 5.0
+    SCORING_STALE_TASK_MINUTES: int = 15
+
+    # Embedding model (app/services/model_registry.py)
+    EMBEDDING_MODEL_NAME: str = "all-MiniLM-L6-v2"
+    EMBEDDING_MODEL_PATH: Optional[str] = None   # local directory; skips the network entirely
+    EMBEDDING_DEVICE: Optional[str] = None
+    EMBEDDING_WARMUP_ON_STARTUP: bool = True
+
+    # Job-description embedding cache (app/services/jd_embedding_cache.py)
+    JD_EMBEDDING_CACHE_SIZE: int = 256
+    JD_EMBEDDING_PERSIST: bool = True
+    JD_EMBEDDING_CACHE_DIR: str = "uploads/jd_embeddings"
+
+    # Job list / detail read-through cache (app/services/job_service.py)
+    JOB_CACHE_SIZE: int = 1024
+    JOB_CACHE_TTL_SECONDS: float = 30.0
+
+    # Batch re-scoring (app/services/batch_scoring.py)
+    RESCORE_ENCODE_BATCH_SIZE: int = 64
+
+    # Content-addressed store of parsed resumes (app/services/resume_store.py)
+    RESUME_STORE_DIR: str = "uploads/resume_store"
+
+    # Candidate search index (app/services/vector_index.py)
+    VECTOR_INDEX_BLOCK_SIZE: int = 65536
+    VECTOR_INDEX_BUILD_ON_STARTUP: bool = True
+    VECTOR_INDEX_REFRESH_SECONDS: float = 30.0          # load applicants other workers scored; 0 = off
+    VECTOR_INDEX_REFRESH_OVERLAP_SECONDS: float = 60.0  # re-read window for late-committing tasks
+
+    # Compiled per-job skill matchers (app/services/skill_matcher.py)
+    SKILL_MATCHER_CACHE_SIZE: int = 512
+
+    # Resume text extraction pool (app/services/text_extraction.py)
+    EXTRACTION_WORKERS: int = 2
+    EXTRACTION_TIMEOUT_SECONDS: float = 30.0
+    EXTRACTION_CPU_SECONDS: int = 20
+    EXTRACTION_MAX_PAGES: int = 30
+    EXTRACTION_MAX_CHARS: int = 200000
+    RESUME_MAX_FILE_MB: int = 10
+
+    # Resume uploads (app/services/resume_upload.py)
+    RESUME_UPLOAD_DIR: str = "uploads/resumes"
+    RESUME_UPLOAD_CHUNK_BYTES: int = 256 * 1024
+
+    # Password hashing and access tokens (app/core/security.py)
+    PASSWORD_HASH_WORKERS: int = 4
+    # Fixed cost; unset = each process calibrates to BCRYPT_TARGET_MS. Set it when running
+    # several workers or hosts: only a fixed cost upgrades older hashes at login.
+    BCRYPT_ROUNDS: Optional[int] = None
+    BCRYPT_TARGET_MS: float = 250.0
+    BCRYPT_MIN_ROUNDS: int = 10
+    BCRYPT_MAX_ROUNDS: int = 15
+    AUTH_SECRET_KEY: str = ""
+    AUTH_TOKEN_TTL_MINUTES: int = 480
+
+    # Interview scheduling (app/services/interview_calendar.py)
+    INTERVIEW_SLOT_MINUTES: int = 15             # proposed slots start on this grid
+    INTERVIEW_DAY_START_HOUR: int = 9
+    INTERVIEW_DAY_END_HOUR: int = 18
+    INTERVIEW_WEEKDAYS_ONLY: bool = True
+    INTERVIEW_FREE_SLOT_SEARCH_DAYS: int = 14
+    INTERVIEW_CALENDAR_LOOKBACK_DAYS: int = 1    # past bookings loaded at startup
+    INTERVIEW_CALENDAR_REFRESH_SECONDS: float = 2.0
+    INTERVIEW_CALENDAR_REFRESH_OVERLAP_SECONDS: float = 60.0  # re-read window for late-committing writes
+    INTERVIEW_BOOKING_LOCK_TIMEOUT_MS: int = 5000              # wait for another worker's booking of the same people
+
+    # Hiring-funnel rollups (app/services/hiring_analytics.py)
+    ANALYTICS_REFRESH_SECONDS: float = 30.0      # how stale /api/v1/analytics answers may get
+    ANALYTICS_REFRESH_OVERLAP_SECONDS: float = 60.0  # re-read window for late-committing writes
+
+    # Default resume scoring weights; a job's own weights override them (app/services/scoring_weights.py)
+    SCORING_SEMANTIC_WEIGHT: float = 0.6         # keyword weight is 1 - this
+    SCORING_HIGH_SKILL_WEIGHT: float = 0.7       # normal-skill weight is 1 - this
+
+    # Cached component scores for what-if re-ranking (app/services/score_reranking.py)
+    SCORE_COMPONENT_CACHE_SIZE: int = 256        # jobs
+    SCORE_COMPONENT_CACHE_TTL_SECONDS: float = 60.0
+
+    # Score snapshot export (app/services/score_export.py)
+    SCORE_EXPORT_ROW_GROUP_ROWS: int = 50000     # rows per cursor fetch and per Parquet row group
+
+    # Bulk applicant import (app/services/bulk_import.py)
+    BULK_IMPORT_BATCH_SIZE: int = 500
+    BULK_IMPORT_MAX_ROWS: int = 5000
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -28,4 +147,7 @@ class Settings(BaseSettings):
             if origin.strip()
         ]
 
+    def get_sql_trace_roles(self) -> List[str]:
+        return [role.strip() for role in self.DB_SQL_TRACE_ROLES.split(",") if role.strip()]
+
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,173 @@
+# app/core/cache.py
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple
+
+
+class CachedEntry(NamedTuple):
+    value: Any
+    body: bytes
+    etag: str
+
+
+def _json_default(value):
+    # Same representations FastAPI's jsonable_encoder produces
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def encode_json(value) -> bytes:
+    """Serialize a response body once so cache hits skip validation and encoding."""
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag over an encoded response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """True if an If-None-Match header value covers ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Values are stored with their encoded JSON body and its ETag. ``get_or_load`` is
+    read-through: concurrent misses on the same key share one load, and a load that
+    overlaps an ``invalidate`` is not stored, so a write can never be hidden by a slow
+    reader that started before it.
+
+    The cache is per process; with several API workers the TTL bounds how long another
+    worker can serve a value that was invalidated elsewhere.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, entry = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: Hashable, value, generation: int = None) -> CachedEntry:
+        body = encode_json(value)
+        entry = CachedEntry(value, body, compute_etag(body))
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return entry  # invalidated while loading; serve it once, don't keep it
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> CachedEntry:
+        while True:
+            entry = self.get(key)
+            if entry is not None:
+                return entry
+
+            pending = self._loading.get(key)
+            if pending is None:
+                break
+            with self._lock:
+                self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The leading request was cancelled (e.g. its client went away), not this
+                # one: its entry is gone, so look again and load it here if still missing
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            with self._lock:
+                generation = self._generation
+            entry = self.set(key, await loader(), generation)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._loading.pop(key, None)
+
+    def invalidate(self, *keys: Hashable):
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def invalidate_prefix(self, prefix: tuple):
+        """Drop every tuple key that starts with ``prefix`` (e.g. all projections of a list)."""
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._entries if isinstance(k, tuple) and k[:len(prefix)] == prefix]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "coalesced_loads": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
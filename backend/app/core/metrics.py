@@ -0,0 +1,223 @@
+# app/core/metrics.py
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from app.config import settings
+
+slow_request_logger = logging.getLogger("app.slow_requests")
+
+# Seconds; the same buckets are used for request latency and for stage timings
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+STAGES = ("extraction", "embedding")
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense (counts, sum, +Inf)."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> list:
+        out = []
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS + (float("inf"),), self.counts):
+            cumulative += bucket_count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            out.append(f'{name}_bucket{{{labels}{"," if labels else ""}le="{le}"}} {cumulative}')
+        prefix = f"{{{labels}}}" if labels else ""
+        out.append(f"{name}_sum{prefix} {self.total:.6f}")
+        out.append(f"{name}_count{prefix} {self.count}")
+        return out
+
+
+class RequestStats:
+    """Per-request breakdown: seconds spent in each stage (DB figures come from QueryCounter)."""
+
+    def __init__(self):
+        self.stages = {stage: 0.0 for stage in STAGES}
+
+
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class MetricsRegistry:
+    """Process-wide request and stage metrics, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency = {}
+        self._db_seconds = {}
+        self._db_queries = {}
+        self._stages = {stage: Histogram() for stage in STAGES}
+        self._in_flight = 0
+
+    def request_started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, queries):
+        key = (method, route, str(status))
+        with self._lock:
+            self._in_flight -= 1
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram()
+            histogram.observe(seconds)
+            self._db_seconds[key] = self._db_seconds.get(key, 0.0) + queries.seconds
+            self._db_queries[key] = self._db_queries.get(key, 0) + queries.count
+
+    def observe_stage(self, stage: str, seconds: float):
+        with self._lock:
+            self._stages[stage].observe(seconds)
+
+    def render(self, extra_gauges: dict = None) -> str:
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP http_request_duration_seconds Request latency by route",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route, status), histogram in sorted(self._latency.items()):
+                lines += histogram.lines(
+                    "http_request_duration_seconds", f'method="{method}",route="{route}",status="{status}"'
+                )
+            lines += [
+                "# HELP http_request_db_seconds_total Time spent executing SQL, by route",
+                "# TYPE http_request_db_seconds_total counter",
+            ]
+            for (method, route, status), seconds in sorted(self._db_seconds.items()):
+                lines.append(f'http_request_db_seconds_total{{method="{method}",route="{route}",status="{status}"}} {seconds:.6f}')
+            lines += [
+                "# HELP http_request_db_queries_total SQL statements executed, by route",
+                "# TYPE http_request_db_queries_total counter",
+            ]
+            for (method, route, status), count in sorted(self._db_queries.items()):
+                lines.append(f'http_request_db_queries_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+            lines += [
+                "# HELP app_stage_duration_seconds Time spent in resume extraction and embedding",
+                "# TYPE app_stage_duration_seconds histogram",
+            ]
+            for stage, histogram in self._stages.items():
+                lines += histogram.lines("app_stage_duration_seconds", f'stage="{stage}"')
+            lines += [
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self._in_flight}",
+            ]
+        for name, value in (extra_gauges or {}).items():
+            lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+@contextmanager
+def timed_stage(stage: str):
+    """Time a block as extraction or embedding work, for the current request and globally."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        metrics_registry.observe_stage(stage, elapsed)
+        stats = request_stats.get()
+        if stats is not None:
+            stats.stages[stage] += elapsed
+
+
+def route_template(scope) -> str:
+    """Matched route as a template (``/api/v1/hr/jobs/{job_id}``), keeping label cardinality bounded.
+
+    Rebuilt from the request path and its path parameters, because routes of included
+    routers only know their path relative to the router prefix.
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+    by_value = {str(value): name for name, value in (scope.get("path_params") or {}).items()}
+    if not by_value:
+        return scope["path"]
+    return "/".join(
+        f"{{{by_value[segment]}}}" if segment in by_value else segment for segment in scope["path"].split("/")
+    )
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: per-route latency, DB time and query count, stage timings.
+
+    Timing runs until the last body chunk is sent, so streamed responses are measured in
+    full. Adds ``X-Query-Count`` (statements issued before the response started) and logs
+    a breakdown for requests slower than ``SLOW_REQUEST_THRESHOLD_MS``. With
+    ``record=False`` it only counts queries for the header.
+    """
+
+    def __init__(self, app, record: bool = True):
+        # Imported here so scoring code can use timed_stage() without creating the engines
+        from app.db.connection import QueryCounter, query_counter
+
+        self.app = app
+        self.record = record
+        self._query_counter_cls = QueryCounter
+        self._query_counter = query_counter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = self._query_counter_cls()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.DB_QUERY_COUNT_HEADER_ENABLED:
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [
+                        (b"x-query-count", str(queries.count).encode("latin-1"))
+                    ]
+            await send(message)
+
+        if not self.record:
+            queries_token = self._query_counter.set(queries)
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._query_counter.reset(queries_token)
+            return
+
+        stats = RequestStats()
+        stats_token = request_stats.set(stats)
+        queries_token = self._query_counter.set(queries)
+        started = time.perf_counter()
+        metrics_registry.request_started()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._query_counter.reset(queries_token)
+            request_stats.reset(stats_token)
+            route_path = route_template(scope)
+            metrics_registry.observe_request(scope["method"], route_path, status, elapsed, queries)
+            if elapsed * 1000 >= settings.SLOW_REQUEST_THRESHOLD_MS:
+                slow_request_logger.warning(
+                    f"Slow request {scope['method']} {scope['path']} ({route_path}) -> {status} "
+                    f"in {elapsed * 1000:.1f} ms: db={queries.seconds * 1000:.1f} ms over {queries.count} queries, "
+                    f"extraction={stats.stages['extraction'] * 1000:.1f} ms, "
+                    f"embedding={stats.stages['embedding'] * 1000:.1f} ms"
+                )
@@ -0,0 +1,193 @@
+# app/core/security.py
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# bcrypt only looks at the first 72 bytes; bcrypt>=5 raises instead of truncating
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification on a small dedicated thread pool.
+
+    bcrypt releases the GIL, so hashes run in parallel up to ``workers`` at a time
+    while the event loop keeps serving other requests; further hashes queue instead
+    of taking threads from the default executor that sync endpoints share.
+
+    The cost factor is either fixed (``rounds``) or calibrated once, on first use, to
+    the highest cost whose hash takes at most ``target_ms`` on this machine. Only a
+    fixed cost upgrades stored hashes: each process calibrates on its own timing
+    sample, so calibrated costs can differ between workers.
+    """
+
+    def __init__(self, workers: int, rounds: Optional[int], target_ms: float, min_rounds: int, max_rounds: int):
+        self.workers = workers
+        self.target_ms = target_ms
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self._rounds = rounds
+        self._fixed_rounds = rounds
+        self._calibration = None
+        self._dummy_hash = None
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def rounds(self) -> int:
+        if self._rounds is None:
+            with self._lock:
+                if self._rounds is None:
+                    self._rounds = self._calibrate()
+        return self._rounds
+
+    def _calibrate(self) -> int:
+        # Cost doubles per round, so time one hash at the minimum and extrapolate,
+        # then confirm the chosen cost with a real hash
+        sample = b"calibration-password"
+        started = time.perf_counter()
+        bcrypt.hashpw(sample, bcrypt.gensalt(self.min_rounds))
+        base_ms = (time.perf_counter() - started) * 1000
+
+        rounds = self.min_rounds
+        while rounds < self.max_rounds and base_ms * 2 ** (rounds + 1 - self.min_rounds) <= self.target_ms:
+            rounds += 1
+        started = time.perf_counter()
+        bcrypt.hashpw(sample, bcrypt.gensalt(rounds))
+        measured_ms = (time.perf_counter() - started) * 1000
+        if measured_ms > self.target_ms * 1.5 and rounds > self.min_rounds:
+            rounds -= 1
+
+        self._calibration = {"rounds": rounds, "min_rounds_ms": round(base_ms, 2), "chosen_rounds_ms": round(measured_ms, 2)}
+        logger.info(f"bcrypt cost calibrated to {rounds} ({measured_ms:.0f} ms, target {self.target_ms:.0f} ms)")
+        return rounds
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            return self._executor
+
+    def hash_sync(self, password: str) -> str:
+        return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(self.rounds)).decode("utf-8")
+
+    def verify_sync(self, password: str, hashed: str) -> bool:
+        try:
+            return bcrypt.checkpw(_password_bytes(password), hashed.encode("utf-8"))
+        except ValueError:
+            return False  # not a bcrypt hash
+
+    def _verify_dummy(self, password: str) -> bool:
+        # Same cost as a real check, so an unknown account can't be told apart by timing
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hash_sync(secrets.token_urlsafe(16))
+        self.verify_sync(password, self._dummy_hash)
+        return False
+
+    def warm_up(self):
+        """Calibrate on the pool now (no-op when the cost is fixed) instead of in the first request."""
+        if self._rounds is None:
+            self._get_executor().submit(lambda: self.rounds)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True when a stored hash uses a lower cost than the configured ``BCRYPT_ROUNDS``.
+
+        Never with a calibrated cost, and never downwards, so workers that disagree
+        can't re-hash the same password back and forth on every login.
+        """
+        if self._fixed_rounds is None:
+            return False
+        try:
+            return int(hashed.split("$")[2]) < self._fixed_rounds
+        except (IndexError, ValueError):
+            return True
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), self.hash_sync, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self.verify_sync, password, hashed
+        )
+
+    async def verify_unknown_user(self, password: str) -> bool:
+        """Spend one verification's worth of time on a login for an account that doesn't exist."""
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), self._verify_dummy, password)
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "rounds": self._rounds, "target_ms": self.target_ms, "calibration": self._calibration}
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+def _password_bytes(password: str) -> bytes:
+    encoded = password.encode("utf-8")
+    if len(encoded) > BCRYPT_MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password is longer than {BCRYPT_MAX_PASSWORD_BYTES} bytes")
+    return encoded
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    rounds=settings.BCRYPT_ROUNDS,
+    target_ms=settings.BCRYPT_TARGET_MS,
+    min_rounds=settings.BCRYPT_MIN_ROUNDS,
+    max_rounds=settings.BCRYPT_MAX_ROUNDS,
+)
+
+
+# ----------------------------------------------------------------------
+# Signed access tokens (HMAC-SHA256 over a JSON payload, JWT-compatible layout)
+# ----------------------------------------------------------------------
+
+if settings.AUTH_SECRET_KEY:
+    _secret = settings.AUTH_SECRET_KEY.encode("utf-8")
+else:
+    _secret = secrets.token_bytes(32)
+    logger.warning("AUTH_SECRET_KEY is not set; issued tokens stop validating when the process restarts")
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _unb64(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def create_access_token(subject: int, claims: dict = None) -> str:
+    now = int(time.time())
+    payload = {"sub": str(subject), "iat": now, "exp": now + settings.AUTH_TOKEN_TTL_MINUTES * 60, **(claims or {})}
+    signing_input = f"{_b64(json.dumps({'alg': 'HS256', 'typ': 'JWT'}).encode())}.{_b64(json.dumps(payload).encode())}"
+    signature = hmac.new(_secret, signing_input.encode("ascii"), hashlib.sha256).digest()
+    return f"{signing_input}.{_b64(signature)}"
+
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """Payload of a valid, unexpired token; None otherwise."""
+    try:
+        header, payload, signature = token.split(".")
+        expected = hmac.new(_secret, f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _unb64(signature)):
+            return None
+        claims = json.loads(_unb64(payload))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return claims if claims.get("exp", 0) > time.time() else None
@@ -1,13 +1,41 @@
 # app/main.py
-from fastapi import FastAPI
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.logging import setup_logging
+from app.core.logging import RequestIdMiddleware, logging_stats, setup_logging, shutdown_logging
 from app.config import settings
+from app.core.metrics import MetricsMiddleware, metrics_registry
+from app.db.connection import get_pool_metrics, sql_trace_enabled
+from app.services.scoring_queue import scoring_queue
+from app.services.job_service import job_cache
+from app.services.model_registry import model_registry
+from app.services.vector_index import vector_index
+from app.services.interview_calendar import interview_calendar
+from app.services.hiring_analytics import hiring_analytics
+from app.services.score_reranking import component_score_cache
+from app.services.text_extraction import text_extractor
+from app.core.security import decode_access_token, password_hasher
 
 # === CORRECT IMPORTS ===
 from app.api.v1.users.router import router as users_router
 from app.api.v1.hr.job import router as hr_job_router          # ← Fixed
 from app.api.v1.applicants.router import router as applicants_router  # ← Fixed
+from app.api.v1.auth.router import router as auth_router
+from app.api.v1.interviews.router import router as interviews_router
+from app.api.v1.analytics.router import router as analytics_router
+
+logger = logging.getLogger(__name__)
+
+
+def sql_trace_allowed(authorization: str) -> bool:
+    """SQL traces log bound parameters (hashes, personal data), so only trusted roles may ask for one."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    claims = decode_access_token(token.strip())
+    return bool(claims) and claims.get("role") in settings.get_sql_trace_roles()
 
 def create_app() -> FastAPI:
     setup_logging()
@@ -25,12 +53,39 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "X-Query-Count", "X-Request-ID"],
     )
 
+    # === PER-REQUEST SQL TRACE ===
+    @app.middleware("http")
+    async def sql_trace_middleware(request: Request, call_next):
+        if not (
+            settings.DB_SQL_TRACE_HEADER_ENABLED
+            and request.headers.get("x-sql-trace") == "1"
+            and sql_trace_allowed(request.headers.get("authorization"))
+        ):
+            return await call_next(request)
+        token = sql_trace_enabled.set(True)
+        try:
+            return await call_next(request)
+        finally:
+            sql_trace_enabled.reset(token)
+
+    # === REQUEST METRICS (outermost: times everything, adds X-Query-Count) ===
+    # With metrics off it still runs, without recording, when the header is on
+    if settings.METRICS_ENABLED or settings.DB_QUERY_COUNT_HEADER_ENABLED:
+        app.add_middleware(MetricsMiddleware, record=settings.METRICS_ENABLED)
+
+    # === REQUEST ID (outermost, so every log line of the request carries it) ===
+    app.add_middleware(RequestIdMiddleware)
+
     # === ROUTERS ===
     app.include_router(users_router,      prefix="/api/v1/users",      tags=["Users"])
     app.include_router(hr_job_router,    prefix="/api/v1/hr/jobs",   tags=["HR Jobs"])
     app.include_router(applicants_router,prefix="/api/v1/applicants",tags=["Applicants"])
+    app.include_router(auth_router,      prefix="/api/v1/auth",       tags=["Auth"])
+    app.include_router(interviews_router,prefix="/api/v1/interviews", tags=["Interviews"])
+    app.include_router(analytics_router, prefix="/api/v1/analytics",  tags=["Analytics"])
 
     # === TEST ROUTE ===
     @app.get("/test-cors")
@@ -40,16 +95,65 @@ def create_app() -> FastAPI:
             "allowed_origins": settings.get_cors_origins(),
         }
 
+    # === HEALTH ===
+    @app.get("/health")
+    def health():
+        return {
+            "status": "ok",
+            "embedding_model": model_registry.status(),
+            "candidate_index": vector_index.stats(),
+            "password_hasher": password_hasher.stats(),
+            "interview_calendar": interview_calendar.stats(),
+            "hiring_analytics": hiring_analytics.stats(),
+            "score_components": component_score_cache.stats(),
+        }
+
+    @app.get("/health/db")
+    def database_pool_health():
+        return get_pool_metrics()
+
+    @app.get("/health/cache")
+    def cache_health():
+        return {"jobs": job_cache.stats()}
+
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        def metrics():
+            gauges = {}
+            for name, snapshot in get_pool_metrics().items():
+                gauges[f"db_pool_{name}_checked_out"] = snapshot["checked_out"]
+                gauges[f"db_pool_{name}_wait_seconds_total"] = snapshot["wait_seconds_total"]
+                gauges[f"db_pool_{name}_timeouts"] = snapshot["timeouts"]
+            cache_stats = job_cache.stats()
+            gauges["job_cache_entries"] = cache_stats["entries"]
+            gauges["job_cache_hit_ratio"] = cache_stats["hit_ratio"]
+            gauges["log_records_dropped"] = logging_stats()["dropped"]
+            return PlainTextResponse(metrics_registry.render(gauges), media_type="text/plain; version=0.0.4")
+
+    @app.get("/health/ready")
+    def readiness():
+        status = model_registry.status()
+        return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
     # === EVENTS ===
     @app.on_event("startup")
     async def startup_event():
-        print("Starting up UBTI Hiring Portal...")
-        print(f"Project: {settings.PROJECT_NAME}")
-        print(f"CORS Allowed Origins: {settings.get_cors_origins()}")
+        logger.info(f"Starting up {settings.PROJECT_NAME}; CORS allowed origins: {settings.get_cors_origins()}")
+        if settings.EMBEDDING_WARMUP_ON_STARTUP:
+            model_registry.warm_up()
+        scoring_queue.start()
+        password_hasher.warm_up()
+        if settings.VECTOR_INDEX_BUILD_ON_STARTUP:
+            vector_index.build_async()
 
     @app.on_event("shutdown")
     async def shutdown_event():
-        print("Shutting down...")
+        logger.info("Shutting down...")
+        scoring_queue.stop()
+        vector_index.stop()
+        text_extractor.shutdown()
+        password_hasher.shutdown()
+        shutdown_logging()
 
     return app
 
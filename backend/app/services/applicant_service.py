@@ -1,296 +1,285 @@
-import shutil
-import os
+import base64
+import csv
+import io
+import json
 import logging
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import DateTime, bindparam, literal_column, select, text
 from datetime import datetime
-from .aishortlist import evaluate_resume_match  # Ensure this import is correct
-from typing import List
-from fastapi import HTTPException, Depends
-from app.db.connection import get_db
-
-# Setup logging configuration
-logging.basicConfig(
-    level=logging.DEBUG,  # Set to DEBUG to capture all levels of logs
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()]  # Logs will be printed to console
-)
-
-UPLOAD_DIR = "uploads/resumes"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-def save_resume(file, applicant_id: int):
-    """Function to save resume file to the disk."""
-    try:
-        # Validate file type (e.g., only allowing PDF, DOCX, and TXT)
-        allowed_extensions = ['pdf', 'docx', 'txt']
-        file_extension = file.filename.split('.')[-1].lower()
-
-        if file_extension not in allowed_extensions:
-            raise ValueError(f"Invalid file type. Only {', '.join(allowed_extensions)} are allowed.")
-        
-        # Organize files by year and month
-        year_month = datetime.now().strftime("%Y-%m")
-        directory = os.path.join(UPLOAD_DIR, year_month)
-        os.makedirs(directory, exist_ok=True)
-
-        # Create file path
-        file_path = os.path.join(directory, f"{applicant_id}_{file.filename}")
-        logging.info(f"Saving resume for applicant {applicant_id} to {file_path}")
-        
-        # Save the file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)  # Copy the file content to disk
-        
-        logging.info(f"Resume saved successfully for applicant {applicant_id} at {file_path}")
-        return file_path
-    except Exception as e:
-        logging.error(f"Error while saving resume for applicant {applicant_id}: {e}")
-        raise HTTPException(status_code=400, detail=f"Error while saving resume: {str(e)}")
-
+from .scoring_queue import scoring_queue
+from .skill_matcher import parse_skills
+from .resume_upload import StoredResume
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import HTTPException
+from app.db.connection import AsyncSessionLocal
+from app.api.v1.applicants.schemas import ApplicantFilters
+
+logger = logging.getLogger(__name__)
+
+
+# One T-SQL batch, so creating an applicant is a single round trip to the database.
+# OUTPUT ... INTO table variables carries each generated id into the next INSERT
+# (no SCOPE_IDENTITY() round trips), and the final SELECT returns all three ids.
+CREATE_APPLICANT_BATCH = """
+    SET NOCOUNT ON;
+    DECLARE @applicant TABLE (applicant_id INT);
+    DECLARE @application TABLE (application_id INT);
+    DECLARE @task TABLE (task_id INT);
+
+    INSERT INTO applicants (
+        first_name, last_name, email, phone, linkedin_url,
+        experience_years, education, current_company, current_role,
+        expected_ctc, notice_period_days, skills, location, resume_url, created_at, updated_at
+    )
+    OUTPUT INSERTED.applicant_id INTO @applicant
+    VALUES (
+        :first_name, :last_name, :email, :phone, :linkedin_url,
+        :experience_years, :education, :current_company, :current_role,
+        :expected_ctc, :notice_period_days, :skills, :location, :resume_url, :created_at, :updated_at
+    );
+
+    INSERT INTO applications (
+        applicant_id, job_id, application_status, source, assigned_hr,
+        assigned_manager, comments, updated_at
+    )
+    OUTPUT INSERTED.application_id INTO @application
+    SELECT applicant_id, :job_id, :application_status, :source, :assigned_hr,
+        :assigned_manager, :comments, :updated_at
+    FROM @applicant;
+
+    -- Resume evaluation is queued; the scores are filled in by a scoring worker
+    INSERT INTO scoring_tasks (application_id, status, attempts, created_at, updated_at)
+    OUTPUT INSERTED.task_id INTO @task
+    SELECT application_id, 'queued', 0, :created_at, :updated_at
+    FROM @application
+    WHERE :resume_url IS NOT NULL;
+
+    SELECT
+        (SELECT applicant_id FROM @applicant) AS applicant_id,
+        (SELECT application_id FROM @application) AS application_id,
+        (SELECT task_id FROM @task) AS task_id;
+"""
+
+
+async def create_applicant(db: AsyncSession, applicant_data: dict, resume: StoredResume, job_id: int, source: str, application_status: str, assigned_hr: str = None, assigned_manager: str = None, comments: str = None):
+    """Function to create an applicant for an already stored resume (see resume_upload.save_resume)
+    and create an application entry in the applications table.
+
+    Resume scoring is not done here: a scoring task is inserted in the same transaction
+    and handed to the background scoring queue once the transaction has committed.
+    Applicant, application and task are written with one statement batch.
+    """
+    file_path = resume.path if resume else None
+    now = datetime.now()
+    params = {
+        **applicant_data,
+        "resume_url": file_path,
+        "job_id": job_id,
+        "application_status": application_status,
+        "source": source,
+        "assigned_hr": assigned_hr,
+        "assigned_manager": assigned_manager,
+        "comments": comments,
+        "created_at": now,
+        "updated_at": now,
+    }
 
-def create_applicant(db: Session, applicant_data: dict, resume_file, job_id: int, source: str, application_status: str, assigned_hr: str = None, assigned_manager: str = None, comments: str = None):
-    """Function to create an applicant, save their resume, and create an application entry in the applications table."""
     try:
-        # Start a transaction
-        with db.begin():  # This ensures automatic commit or rollback
-            # Generate current timestamp for created_at and updated_at
-            now = datetime.now()
-            params = {**applicant_data, "resume_url": None, "created_at": now, "updated_at": now}
-            
-            # Log applicant data being inserted
-            logging.info(f"Inserting applicant data: {applicant_data}")
-
-            # Insert applicant data into the applicants table
-            db.execute(text(""" 
-                INSERT INTO applicants (
-                    first_name, last_name, email, phone, linkedin_url,
-                    experience_years, education, current_company, current_role,
-                    expected_ctc, notice_period_days, skills, location, resume_url, created_at, updated_at
-                ) VALUES (
-                    :first_name, :last_name, :email, :phone, :linkedin_url,
-                    :experience_years, :education, :current_company, :current_role,
-                    :expected_ctc, :notice_period_days, :skills, :location, :resume_url, :created_at, :updated_at
-                );
-            """), params)
-
-            # Fetch the last inserted applicant_id using SCOPE_IDENTITY()
-            logging.info("Fetching applicant_id of the newly inserted applicant.")
-            result = db.execute(text("SELECT SCOPE_IDENTITY() AS applicant_id;"))
-            applicant_id = result.fetchone()[0]
-            logging.info(f"Applicant ID: {applicant_id} retrieved successfully.")
-
-            # Handle resume file if provided
-            if resume_file:
-                logging.info(f"Resume file found for applicant {applicant_id}, saving the file.")
-                file_path = save_resume(resume_file, applicant_id)
-                logging.info(f"Resume file path: {file_path}")
-                
-                # Update the resume URL in the database for the applicant
-                logging.info(f"Updating applicant record with resume URL: {file_path}")
-                db.execute(text("UPDATE applicants SET resume_url = :resume_url WHERE applicant_id = :applicant_id"),
-                           {"resume_url": file_path, "applicant_id": applicant_id})
-
-            # Insert into applications table with created_at and updated_at
-            application_params = {
-                "applicant_id": applicant_id,
-                "job_id": job_id,
-                "application_status": application_status,
-                "source": source,
-                "assigned_hr": assigned_hr,
-                "assigned_manager": assigned_manager,
-                "comments": comments,
-                "created_at": now,  # Set created_at to current timestamp
-                "updated_at": now   # Set updated_at to current timestamp
-            }
-            
-            logging.info(f"Inserting application for applicant {applicant_id} and job {job_id}.")
-            db.execute(text(""" 
-                INSERT INTO applications (
-                    applicant_id, job_id, application_status, source, assigned_hr,
-                    assigned_manager, comments, updated_at
-                ) VALUES (
-                    :applicant_id, :job_id, :application_status, :source, :assigned_hr,
-                    :assigned_manager, :comments,:updated_at
-                );
-            """), application_params)
-
-            logging.info(f"Application created for applicant {applicant_id} and job {job_id}.")
-
-            # Trigger resume evaluation (passing relevant params)
-            evaluation_result = trigger_evaluate_resume_match(
-                resume_pdf_path=file_path,
-                jd_text=get_jd(job_id, db),
-                high_priority_keywords=get_high_priority_keywords(job_id, db),
-                normal_keywords=get_normal_keywords(job_id, db),
-                job_id=job_id,
-                applicant_id=applicant_id,
-                source=source,
-                application_status=application_status,
-                assigned_hr=assigned_hr,
-                assigned_manager=assigned_manager,
-                comments=comments,
-                db=db
-            )
-
-            logging.info(f"Evaluation result: {evaluation_result}")
-            return {
-                "applicant_id": applicant_id,
-                "resume_url": file_path,
-                "evaluation_result": evaluation_result,
-                **{k: v for k, v in applicant_data.items() if k != 'resume_url'}
-            }
+        async with db.begin():  # This ensures automatic commit or rollback
+            ids = (await db.execute(text(CREATE_APPLICANT_BATCH), params)).mappings().fetchone()
+        applicant_id = int(ids["applicant_id"])
+        application_id = int(ids["application_id"])
+        task_id = int(ids["task_id"]) if ids["task_id"] is not None else None
+        logger.info(
+            f"Applicant {applicant_id}, application {application_id} and scoring task {task_id} "
+            f"created for job {job_id}."
+        )
 
     except Exception as e:
         # Rollback in case of any error
-        logging.error(f"Error while creating applicant and application: {e}")
-        db.rollback()
-        logging.debug("Transaction rolled back.")
+        logger.error(f"Error while creating applicant and application for job {job_id}: {e}")
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create applicant and application: {str(e)}")
 
-
-# Function to evaluate resume match (triggered after creating applicant)
-def trigger_evaluate_resume_match(
-    resume_pdf_path, jd_text, high_priority_keywords, normal_keywords, 
-    job_id, applicant_id, source, application_status, 
-    assigned_hr=None, assigned_manager=None, comments=None, db: Session = Depends(get_db)
-):
-    """Evaluates a resume match against a job description and stores the results in the database."""
-    try:
-        # Assume `evaluate_resume_match` is defined earlier in the system as provided by you earlier.
-        result = evaluate_resume_match(
-            resume_pdf_path=resume_pdf_path,
-            jd_text=jd_text,
-            high_priority_keywords=high_priority_keywords,
-            normal_keywords=normal_keywords,
-            job_id=job_id,
-            applicant_id=applicant_id,
-            source=source,
-            application_status=application_status,
-            assigned_hr=assigned_hr,
-            assigned_manager=assigned_manager,
-            comments=comments,
-            db=db
-        )
-        return result
-    except Exception as e:
-        logging.error(f"Failed to evaluate resume match: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error during resume evaluation: {str(e)}")
-
-
-# Example of helper functions to retrieve job description and keywords
-def get_jd(job_id: int, db: Session) -> str:
-    """Fetch job description from database for the given job_id."""
-    query = text("SELECT jd FROM jobs WHERE job_id = :job_id")
-    result = db.execute(query, {"job_id": job_id}).fetchone()
-    return result[0] if result else ""
+    # Only hand the task to a worker once the transaction has committed
+    if task_id is not None:
+        scoring_queue.enqueue(task_id)
+
+    return {
+        "applicant_id": applicant_id,
+        "application_id": application_id,
+        "scoring_task_id": task_id,
+        "resume_url": file_path,
+        **{k: v for k, v in applicant_data.items() if k != 'resume_url'}
+    }
+
+
+async def get_job_scoring_inputs(job_id: int, db: AsyncSession) -> dict:
+    """Fetch a job's description and its high priority / normal skill phrases in one query."""
+    query = text("SELECT jd, key_skills, additional_skills FROM jobs WHERE job_id = :job_id")
+    result = (await db.execute(query, {"job_id": job_id})).fetchone()
+    if not result:
+        return {"jd": "", "high_priority_keywords": [], "normal_keywords": []}
+    return {
+        "jd": result[0] or "",
+        "high_priority_keywords": parse_skills(result[1]),
+        "normal_keywords": parse_skills(result[2]),
+    }
+
+
+# ----------------------------------------------------------------------
+# Applicant listing: keyset pagination, filters and streaming export
+# ----------------------------------------------------------------------
+
+# (column expression, key in the API response); applicant columns may be NULL
+# because the join is a LEFT JOIN
+APPLICANT_LIST_COLUMNS = (
+    ("app.application_id", "application_id"),
+    ("app.job_id", "job_id"),
+    ("app.applicant_id", "applicant_id"),
+    ("app.applied_date", "applied_date"),
+    ("app.source", "source"),
+    ("app.skills_matching_score", "skills_matching_score"),
+    ("app.jd_matching_score", "jd_matching_score"),
+    ("app.resume_overall_score", "resume_overall_score"),
+    ("COALESCE(app.application_status, 'pending')", "application_status"),
+    ("app.assigned_hr", "assigned_hr"),
+    ("app.assigned_manager", "assigned_manager"),
+    ("app.comments", "comments"),
+    ("app.updated_at", "updated_at"),
+    ("COALESCE(a.first_name, 'Unknown')", "first_name"),
+    ("COALESCE(a.last_name, 'Applicant')", "last_name"),
+    ("COALESCE(a.email, 'N/A')", "email"),
+    ("a.phone", "phone"),
+    ("a.linkedin_url", "linkedin_url"),
+    ("a.resume_url", "resume_url"),
+    ("a.experience_years", "experience_years"),
+    ("a.education", "education"),
+    ("a.current_company", "current_company"),
+    ("a.current_role", "current_role"),
+    ("a.expected_ctc", "expected_ctc"),
+    ("a.notice_period_days", "notice_period_days"),
+    ("a.skills", "skills"),
+    ("a.location", "location"),
+    ("a.created_at", "created_at"),
+    ("a.updated_at", "applicant_updated_at"),
+)
+APPLICANT_EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_BATCH_ROWS = 500
+
+
+# Listing order; applications without an applied_date sort last, as if applied in 1900
+APPLIED_SORT_KEY = "COALESCE(app.applied_date, '19000101')"
+# The cursor row's sort key, read back from the table so ties compare DATETIME to DATETIME
+# (a datetime2 parameter would miss them); the date carried in the cursor is only used
+# if that row has been deleted since
+CURSOR_SORT_KEY = (
+    "COALESCE((SELECT c.applied_date FROM applications c WHERE c.application_id = :cursor_id), "
+    ":cursor_date, '19000101')"
+)
 
 
-def get_high_priority_keywords(job_id: int, db: Session) -> set:
-    """Fetch high priority keywords for the job."""
-    query = text("SELECT key_skills FROM jobs  WHERE job_id = :job_id ")
-    result = db.execute(query, {"job_id": job_id}).fetchall()
-    return {row[0] for row in result}
+def encode_cursor(applied_date, application_id: int) -> str:
+    """Opaque cursor pointing just past the given row in (applied_date, application_id) order."""
+    if isinstance(applied_date, datetime):
+        applied_date = applied_date.isoformat()
+    payload = json.dumps([applied_date, int(application_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
 
 
-def get_normal_keywords(job_id: int, db: Session) -> set:
-    """Fetch normal keywords for the job."""
-    query = text("SELECT additional_skills FROM jobs  WHERE job_id = :job_id ")
-    result = db.execute(query, {"job_id": job_id}).fetchall()
-    return {row[0] for row in result}
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        applied_date, application_id = json.loads(base64.urlsafe_b64decode(padded))
+        if applied_date is not None:
+            applied_date = datetime.fromisoformat(applied_date)
+        return applied_date, int(application_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}") from e
+
+
+def _applicants_query(filters: ApplicantFilters, after=None):
+    """Build the listing SELECT; ``limit`` is added by the caller so each dialect gets TOP/LIMIT."""
+    query = (
+        select(*(literal_column(expression).label(key) for expression, key in APPLICANT_LIST_COLUMNS))
+        .select_from(text("applications app LEFT JOIN applicants a ON a.applicant_id = app.applicant_id"))
+        .order_by(text(f"{APPLIED_SORT_KEY} DESC, app.application_id DESC"))
+    )
+    if filters.job_id is not None:
+        query = query.where(text("app.job_id = :job_id").bindparams(job_id=filters.job_id))
+    if filters.status:
+        query = query.where(
+            text("app.application_status IN :statuses").bindparams(
+                bindparam("statuses", value=list(filters.status), expanding=True)
+            )
+        )
+    if filters.min_score is not None:
+        query = query.where(text("app.resume_overall_score >= :min_score").bindparams(min_score=filters.min_score))
+    if filters.max_score is not None:
+        query = query.where(text("app.resume_overall_score <= :max_score").bindparams(max_score=filters.max_score))
+    if filters.location:
+        query = query.where(text("a.location LIKE :location").bindparams(location=f"%{filters.location}%"))
+    if after is not None:
+        # Keyset predicate: rows strictly after the cursor in (applied_date DESC, application_id DESC)
+        query = query.where(
+            text(
+                f"({APPLIED_SORT_KEY} < {CURSOR_SORT_KEY} "
+                f"OR ({APPLIED_SORT_KEY} = {CURSOR_SORT_KEY} AND app.application_id < :cursor_id))"
+            ).bindparams(
+                bindparam("cursor_date", value=after[0], type_=DateTime),
+                bindparam("cursor_id", value=after[1]),
+            )
+        )
+    return query
 
 
+async def list_applicants(db: AsyncSession, filters: ApplicantFilters, cursor: Optional[str] = None,
+                          limit: int = 100) -> Tuple[List[dict], Optional[str]]:
+    """
+    One page of applications + applicant data (LEFT JOIN, so an application is shown
+    even if its applicant was deleted), newest first.
 
+    Returns the rows and the cursor for the next page (None on the last page).
+    """
+    after = decode_cursor(cursor) if cursor else None
+    try:
+        # Fetch one extra row to know whether another page exists
+        query = _applicants_query(filters, after).limit(limit + 1)
+        rows = [dict(row) for row in (await db.execute(query)).mappings().fetchall()]
+    except Exception as e:
+        logger.error(f"Database error in list_applicants: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch applicants.")
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["applied_date"], rows[-1]["application_id"])
+    return rows, next_cursor
 
 
-def get_all_applicants(db: Session) -> List[dict]:
-    """
-    Fetch ALL applications + applicant data (even if applicant missing)
-    Uses LEFT JOIN to show application even if applicant deleted
+async def stream_applicants(filters: ApplicantFilters, export_format: str) -> AsyncIterator[str]:
     """
-    try:
-        query = text("""
-            SELECT 
-                app.application_id,
-                app.job_id,
-                app.applicant_id,
-                app.applied_date,
-                app.source,
-                app.skills_matching_score,
-                app.jd_matching_score,
-                app.resume_overall_score,
-                app.application_status,
-                app.assigned_hr,
-                app.assigned_manager,
-                app.comments,
-                app.updated_at AS app_updated_at,
-                
-                a.applicant_id AS a_applicant_id,
-                a.first_name,
-                a.last_name,
-                a.email,
-                a.phone,
-                a.linkedin_url,
-                a.resume_url,
-                a.experience_years,
-                a.education,
-                a.current_company,
-                a.current_role,
-                a.expected_ctc,
-                a.notice_period_days,
-                a.skills,
-                a.location,
-                a.created_at AS a_created_at,
-                a.updated_at AS a_updated_at
-            FROM applications app
-            LEFT JOIN applicants a ON app.application_id = a.applicant_id
-            ORDER BY app.applied_date DESC
-        """)
-
-        result = db.execute(query).mappings().fetchall()
-        if not result:
-            return []
-
-        applicants = []
-        for row in result:
-            applicants.append({
-                # Application
-                "application_id": row.get("application_id"),
-                "job_id": row.get("job_id"),
-                "applicant_id": row.get("applicant_id"),
-                "applied_date": row.get("applied_date"),
-                "source": row.get("source"),
-                "skills_matching_score": row.get("skills_matching_score"),
-                "jd_matching_score": row.get("jd_matching_score"),
-                "resume_overall_score": row.get("resume_overall_score"),
-                "application_status": row.get("application_status") or "pending",
-                "assigned_hr": row.get("assigned_hr"),
-                "assigned_manager": row.get("assigned_manager"),
-                "comments": row.get("comments"),
-                "updated_at": row.get("app_updated_at"),
-
-                # Applicant (may be null)
-                "first_name": row.get("first_name") or "Unknown",
-                "last_name": row.get("last_name") or "Applicant",
-                "email": row.get("email") or "N/A",
-                "phone": row.get("phone"),
-                "linkedin_url": row.get("linkedin_url"),
-                "resume_url": row.get("resume_url"),
-                "experience_years": row.get("experience_years", 0),
-                "education": row.get("education"),
-                "current_company": row.get("current_company"),
-                "current_role": row.get("current_role"),
-                "expected_ctc": row.get("expected_ctc", 0.0),
-                "notice_period_days": row.get("notice_period_days", 0),
-                "skills": row.get("skills"),
-                "location": row.get("location"),
-                "created_at": row.get("a_created_at"),
-                "applicant_updated_at": row.get("a_updated_at"),
-            })
-
-        return applicants
+    Yield every matching row as NDJSON lines or CSV text, read from a server-side cursor
+    in batches, so memory use does not grow with the size of the table.
 
-    except Exception as e:
-        logging.error(f"Database error in get_all_applicants: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch applicants.")
\ No newline at end of file
+    Opens its own session: a StreamingResponse keeps iterating after the request's
+    dependencies have been cleaned up.
+    """
+    keys = [key for _, key in APPLICANT_LIST_COLUMNS]
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            _applicants_query(filters), execution_options={"yield_per": EXPORT_BATCH_ROWS}
+        )
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(keys)
+            yield buffer.getvalue()
+            async for batch in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(batch)
+                yield buffer.getvalue()
+        else:
+            async for batch in result.partitions():
+                yield "".join(json.dumps(dict(zip(keys, row)), default=str) + "\n" for row in batch)
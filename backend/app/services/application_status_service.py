@@ -0,0 +1,143 @@
+# app/services/application_status_service.py
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .hiring_analytics import hiring_analytics
+
+logger = logging.getLogger(__name__)
+
+# Application lifecycle: status -> statuses it may move to. hired and rejected are final.
+# Rows with no status yet are treated as 'applied'.
+TRANSITIONS = {
+    "applied": ("shortlisted", "under_review", "rejected"),
+    "shortlisted": ("under_review", "interview_scheduled", "rejected"),
+    "under_review": ("shortlisted", "interview_scheduled", "rejected"),
+    "interview_scheduled": ("under_review", "offered", "rejected"),
+    "offered": ("hired", "rejected"),
+    "hired": (),
+    "rejected": (),
+}
+
+
+def allowed_from(to_status: str) -> List[str]:
+    """Statuses from which an application may move to ``to_status``."""
+    return [status for status, targets in TRANSITIONS.items() if to_status in targets]
+
+
+# One T-SQL batch per request, whatever the number of applications: the lifecycle
+# check is part of the UPDATE's WHERE clause (so it holds under concurrent changes),
+# OUTPUT ... INTO captures the previous status of every row it moved, the audit rows
+# are inserted from that table variable, and the final SELECT reports the outcome
+# for every requested id.
+STATUS_TRANSITION_BATCH = """
+    SET NOCOUNT ON;
+    DECLARE @changed TABLE (application_id INT PRIMARY KEY, from_status VARCHAR(30));
+
+    UPDATE applications
+    SET application_status = :to_status, updated_at = :now
+    OUTPUT INSERTED.application_id, DELETED.application_status INTO @changed
+    WHERE application_id IN :application_ids
+      AND COALESCE(application_status, 'applied') IN :from_statuses;
+
+    INSERT INTO application_status_history (application_id, from_status, to_status, changed_by, reason, changed_at)
+    SELECT application_id, from_status, :to_status, :changed_by, :reason, :now
+    FROM @changed;
+
+    SELECT a.application_id, COALESCE(a.application_status, 'applied') AS application_status,
+           c.from_status, CASE WHEN c.application_id IS NULL THEN 0 ELSE 1 END AS changed
+    FROM applications a
+    LEFT JOIN @changed c ON c.application_id = a.application_id
+    WHERE a.application_id IN :application_ids;
+"""
+
+
+async def transition_applications(db: AsyncSession, application_ids: List[int], to_status: str,
+                                  reason: Optional[str] = None, changed_by: Optional[int] = None) -> dict:
+    """Move applications to ``to_status`` where the lifecycle allows it, with one audit row per change.
+
+    Returns the ids that moved, those already in ``to_status``, those whose current
+    status doesn't allow the move, and those that don't exist.
+    """
+    if to_status not in TRANSITIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid application_status: {to_status}")
+    application_ids = list(dict.fromkeys(application_ids))
+    from_statuses = allowed_from(to_status)
+    if not from_statuses:
+        raise HTTPException(status_code=400, detail=f"No application can move to '{to_status}'")
+
+    now = datetime.now()
+    query = text(STATUS_TRANSITION_BATCH).bindparams(
+        bindparam("application_ids", expanding=True),
+        bindparam("from_statuses", expanding=True),
+    )
+    try:
+        async with db.begin():
+            rows = (await db.execute(query, {
+                "application_ids": application_ids,
+                "from_statuses": from_statuses,
+                "to_status": to_status,
+                "now": now,
+                "changed_by": changed_by,
+                "reason": reason,
+            })).mappings().fetchall()
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail=f"Unknown user in changed_by: {e.orig}")
+
+    updated, unchanged, rejected = [], [], []
+    for row in rows:
+        if row["changed"]:
+            updated.append(row["application_id"])
+            hiring_analytics.apply_status_change(row["application_id"], to_status, now)
+        elif row["application_status"] == to_status:
+            unchanged.append(row["application_id"])
+        else:
+            rejected.append({
+                "application_id": row["application_id"],
+                "current_status": row["application_status"],
+                "allowed": list(TRANSITIONS.get(row["application_status"], ())),
+            })
+    found = {row["application_id"] for row in rows}
+    not_found = [application_id for application_id in application_ids if application_id not in found]
+
+    logger.info(
+        f"Status transition to '{to_status}': {len(updated)} updated, {len(unchanged)} unchanged, "
+        f"{len(rejected)} not allowed, {len(not_found)} not found"
+    )
+    return {
+        "to_status": to_status,
+        "updated": updated,
+        "unchanged": unchanged,
+        "rejected": rejected,
+        "not_found": not_found,
+    }
+
+
+async def transition_application(db: AsyncSession, application_id: int, to_status: str,
+                                 reason: Optional[str] = None, changed_by: Optional[int] = None) -> dict:
+    """Single-application form: 404 if it doesn't exist, 409 if the lifecycle forbids the move."""
+    result = await transition_applications(db, [application_id], to_status, reason, changed_by)
+    if result["not_found"]:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if result["rejected"]:
+        current = result["rejected"][0]
+        raise HTTPException(status_code=409, detail={
+            "message": f"Cannot move application from '{current['current_status']}' to '{to_status}'",
+            **current,
+        })
+    return {"application_id": application_id, "application_status": to_status, "changed": bool(result["updated"])}
+
+
+async def get_status_history(db: AsyncSession, application_id: int) -> list:
+    rows = (await db.execute(text("""
+        SELECT history_id, from_status, to_status, changed_by, reason, changed_at
+        FROM application_status_history
+        WHERE application_id = :application_id
+        ORDER BY changed_at, history_id
+    """).columns(changed_at=DateTime), {"application_id": application_id})).mappings().fetchall()
+    return [dict(row) for row in rows]
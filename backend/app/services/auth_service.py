@@ -0,0 +1,52 @@
+# app/services/auth_service.py
+import logging
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token, password_hasher
+
+logger = logging.getLogger(__name__)
+
+
+async def authenticate(db: AsyncSession, email: str, password: str) -> dict:
+    """Check an email/password pair and return an access token with the user's profile.
+
+    The lookup's transaction is ended before bcrypt runs, so no pooled connection is
+    held during the hash. Hashes made with an older cost are upgraded on success.
+    """
+    user = (await db.execute(text("""
+        SELECT emp_id, username, email, password_hash, role, full_name, department, designation, status, last_login
+        FROM users
+        WHERE email = :email
+    """), {"email": email})).mappings().fetchone()
+    await db.rollback()
+
+    if user is None:
+        await password_hasher.verify_unknown_user(password)
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    if not await password_hasher.verify(password, user["password_hash"]):
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    if user["status"] != "active":
+        raise HTTPException(status_code=403, detail="User account is inactive")
+
+    now = datetime.now()
+    params = {"emp_id": user["emp_id"], "now": now}
+    assignments = "last_login = :now"
+    if password_hasher.needs_rehash(user["password_hash"]):
+        params["password_hash"] = await password_hasher.hash(password)
+        assignments += ", password_hash = :password_hash"
+    try:
+        await db.execute(text(f"UPDATE users SET {assignments} WHERE emp_id = :emp_id"), params)
+        await db.commit()
+    except Exception as e:
+        # A failed bookkeeping write must not block the login itself
+        await db.rollback()
+        logger.error(f"Could not record login for user {user['emp_id']}: {e}")
+
+    profile = {key: value for key, value in user.items() if key != "password_hash"}
+    profile["last_login"] = now
+    token = create_access_token(user["emp_id"], {"role": user["role"]})
+    return {"token": token, "token_type": "bearer", "user": profile}
@@ -0,0 +1,153 @@
+# app/services/batch_scoring.py
+import logging
+import time
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.config import settings
+from .aishortlist import (
+    encode_texts,
+    get_jd_embedding,
+    preprocess_text,
+)
+from .resume_store import file_sha256, resume_store
+from .score_reranking import component_score_cache
+from .scoring_weights import job_weights
+from .skill_matcher import skill_matcher_cache
+from .text_extraction import text_extractor
+
+logger = logging.getLogger(__name__)
+
+
+def rescore_job(db: Session, job_id: int) -> dict:
+    """Re-score every applicant of a job in one pass.
+
+    Resumes missing from the resume store are parsed in the extraction pool and encoded in
+    batches; every resume is then compared to the single JD vector with one
+    matrix-vector product and written back with one executemany UPDATE (the engine
+    runs with ``fast_executemany``).
+    """
+    started = time.perf_counter()
+
+    job = db.execute(
+        text("""
+            SELECT jd, key_skills, additional_skills, semantic_weight, high_skill_weight
+            FROM jobs WHERE job_id = :job_id
+        """),
+        {"job_id": job_id},
+    ).mappings().fetchone()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    rows = db.execute(text("""
+        SELECT app.application_id, a.resume_url
+        FROM applications app
+        JOIN applicants a ON a.applicant_id = app.applicant_id
+        WHERE app.job_id = :job_id AND a.resume_url IS NOT NULL
+    """), {"job_id": job_id}).fetchall()
+    if not rows:
+        return {"job_id": job_id, "rescored": 0, "failed": [], "elapsed_seconds": 0.0, "resumes_per_second": 0.0}
+
+    # 1. Look every resume up in the resume store; only files never seen before are parsed
+    hashes = {}
+    failed = []
+    for application_id, path in rows:
+        try:
+            hashes[application_id] = file_sha256(path)
+        except OSError:
+            failed.append(application_id)
+
+    missing = {}
+    for application_id, path in rows:
+        sha256 = hashes.get(application_id)
+        if sha256 and sha256 not in missing and sha256 not in resume_store:
+            missing[sha256] = path
+
+    if missing:
+        # Parsed in the shared extraction process pool; results stream back as each file finishes
+        sha_by_path = {path: sha256 for sha256, path in missing.items()}
+        parsed = []
+        for path, raw, error in text_extractor.iter_extract(list(missing.values())):
+            if error:
+                logger.warning(f"Skipping resume {path} while rescoring job {job_id}: {error}")
+                continue
+            parsed.append((sha_by_path[path], raw))
+        cleaned = [preprocess_text(raw) for _, raw in parsed]
+        if parsed:
+            new_vectors = encode_texts(cleaned, batch_size=settings.RESCORE_ENCODE_BATCH_SIZE)
+            for (sha256, raw), clean, vector in zip(parsed, cleaned, new_vectors):
+                resume_store.put(sha256, raw, clean, vector)
+    prepared_at = time.perf_counter()
+
+    scored = []
+    for application_id, _ in rows:
+        record = resume_store.get(hashes[application_id]) if application_id in hashes else None
+        if record is None:
+            if application_id not in failed:
+                failed.append(application_id)
+            continue
+        scored.append((application_id, record))
+    if not scored:
+        raise HTTPException(status_code=422, detail="None of the resumes for this job could be read")
+
+    # 2. Score every resume against one JD vector with a single matrix-vector product
+    jd_vector = get_jd_embedding(job_id, job["jd"] or "")
+    resume_matrix = np.vstack([record.embedding for _, record in scored])
+    semantic = np.round(resume_matrix @ jd_vector, 4)
+
+    matcher = skill_matcher_cache.get(job_id, job["key_skills"], job["additional_skills"])
+    matches = matcher.score_many([record.raw_text for _, record in scored])
+    weights = job_weights(job["semantic_weight"], job["high_skill_weight"])
+    high = np.round(matches["high_match"], 4)
+    normal = np.round(matches["normal_match"], 4)
+    keyword = np.round(weights.keyword_score(matches["high_match"], matches["normal_match"]), 4)
+    overall = np.round(weights.overall_score(semantic, keyword), 4)
+
+    # 3. Write every score back in a single executemany round trip
+    now = datetime.now()
+    params = [
+        {
+            "application_id": app_id,
+            "skills_matching_score": float(keyword[i]),
+            "jd_matching_score": float(semantic[i]),
+            "high_skill_match": float(high[i]),
+            "normal_skill_match": float(normal[i]),
+            "resume_overall_score": float(overall[i]),
+            "updated_at": now,
+        }
+        for i, (app_id, _) in enumerate(scored)
+    ]
+    try:
+        db.execute(text("""
+            UPDATE applications
+            SET skills_matching_score = :skills_matching_score,
+                jd_matching_score = :jd_matching_score,
+                high_skill_match = :high_skill_match,
+                normal_skill_match = :normal_skill_match,
+                resume_overall_score = :resume_overall_score,
+                updated_at = :updated_at
+            WHERE application_id = :application_id
+        """), params)
+        db.commit()
+        component_score_cache.invalidate(job_id)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Bulk score update failed for job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to store rescored applications: {str(e)}")
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "job_id": job_id,
+        "rescored": len(scored),
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "newly_parsed": len(missing),
+        "prepare_seconds": round(prepared_at - started, 3),
+        "resumes_per_second": round(len(scored) / elapsed, 2) if elapsed else None,
+    }
+    logger.info(f"Rescored job {job_id}: {summary}")
+    return summary
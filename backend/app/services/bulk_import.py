@@ -0,0 +1,265 @@
+# app/services/bulk_import.py
+import csv
+import io
+import logging
+import os
+import time
+import zipfile
+from datetime import datetime
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.api.v1.applicants.schemas import APPLICATION_STATUSES, BulkApplicantRow
+from .resume_upload import save_resume_fileobj
+from .scoring_queue import scoring_queue
+
+logger = logging.getLogger(__name__)
+
+APPLICANT_COLUMNS = (
+    "first_name", "last_name", "email", "phone", "linkedin_url", "experience_years",
+    "education", "current_company", "current_role", "expected_ctc", "notice_period_days",
+    "skills", "location", "resume_url",
+)
+
+# Session-scoped staging tables: rows are loaded with one fast_executemany round trip,
+# then moved into the real tables with set-based statements whose OUTPUT clauses carry
+# the generated ids back together with the CSV row number.
+CREATE_STAGING = """
+    CREATE TABLE #bulk_applicants (
+        row_no INT PRIMARY KEY,
+        first_name VARCHAR(50),
+        last_name VARCHAR(50),
+        email VARCHAR(100),
+        phone VARCHAR(20),
+        linkedin_url VARCHAR(255),
+        experience_years DECIMAL(4,1),
+        education VARCHAR(255),
+        current_company VARCHAR(255),
+        current_role VARCHAR(100),
+        expected_ctc DECIMAL(10,2),
+        notice_period_days INT,
+        skills VARCHAR(MAX),
+        location VARCHAR(100),
+        resume_url VARCHAR(255),
+        comments VARCHAR(MAX)
+    );
+    CREATE TABLE #bulk_ids (row_no INT PRIMARY KEY, applicant_id INT);
+    CREATE TABLE #bulk_apps (row_no INT PRIMARY KEY, application_id INT);
+"""
+DROP_STAGING = "DROP TABLE #bulk_applicants; DROP TABLE #bulk_ids; DROP TABLE #bulk_apps;"
+
+
+class _Row:
+    __slots__ = ("row_no", "data", "resume", "result")
+
+    def __init__(self, row_no: int):
+        self.row_no = row_no
+        self.data = None
+        self.resume = None
+        self.result = {"row": row_no, "status": "error"}
+
+    def fail(self, error: str):
+        self.result["error"] = error
+
+
+def _clean(record: dict) -> dict:
+    """Strip cells and turn empty strings into None so optional fields validate."""
+    cleaned = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        value = value.strip() if isinstance(value, str) else value
+        cleaned[key.strip()] = value or None
+    return cleaned
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors())
+
+
+def _read_rows(csv_file) -> list:
+    rows = []
+    reader = csv.DictReader(io.TextIOWrapper(csv_file, encoding="utf-8-sig", newline=""))
+    missing = {"first_name", "last_name", "email"} - set(reader.fieldnames or ())
+    if missing:
+        raise HTTPException(status_code=400, detail=f"CSV is missing columns: {', '.join(sorted(missing))}")
+    for row_no, record in enumerate(reader, start=1):
+        if row_no > settings.BULK_IMPORT_MAX_ROWS:
+            raise HTTPException(status_code=413, detail=f"CSV has more than {settings.BULK_IMPORT_MAX_ROWS} rows")
+        row = _Row(row_no)
+        try:
+            row.data = BulkApplicantRow(**_clean(record))
+        except ValidationError as e:
+            row.fail(_format_validation_error(e))
+        rows.append(row)
+    return rows
+
+
+def _attach_resumes(rows: list, archive: zipfile.ZipFile):
+    """Stream each referenced ZIP entry into the content-addressed resume storage."""
+    entries = {}
+    for info in archive.infolist():
+        if not info.is_dir():
+            entries.setdefault(os.path.basename(info.filename).lower(), info)
+    max_bytes = settings.RESUME_MAX_FILE_MB * 1024 * 1024
+
+    for row in rows:
+        if row.data is None or not row.data.resume_filename:
+            continue
+        info = entries.get(os.path.basename(row.data.resume_filename).lower())
+        if info is None:
+            row.fail(f"Resume {row.data.resume_filename} not found in ZIP")
+            row.data = None
+            continue
+        if info.file_size > max_bytes:
+            row.fail(f"Resume {row.data.resume_filename} exceeds the {settings.RESUME_MAX_FILE_MB} MB limit")
+            row.data = None
+            continue
+        try:
+            with archive.open(info) as fileobj:
+                row.resume = save_resume_fileobj(fileobj, info.filename)
+        except HTTPException as e:
+            row.fail(str(e.detail))
+            row.data = None
+        except (zipfile.BadZipFile, OSError, RuntimeError) as e:
+            row.fail(f"Could not read {row.data.resume_filename} from ZIP: {e}")
+            row.data = None
+
+
+def _insert_batch(db: Session, batch: list, job_id: int, source: str, application_status: str, now: datetime) -> list:
+    """Insert one batch of validated rows in a single transaction; returns queued task ids."""
+    staged = []
+    for row in batch:
+        params = {"row_no": row.row_no, "resume_url": row.resume.path if row.resume else None}
+        params.update(row.data.model_dump(exclude={"resume_filename"}))
+        staged.append(params)
+
+    columns = ("row_no",) + APPLICANT_COLUMNS + ("comments",)
+    with db.begin():
+        db.execute(text(CREATE_STAGING))
+        # One round trip for the whole batch (the engine runs with fast_executemany)
+        db.execute(
+            text(f"INSERT INTO #bulk_applicants ({', '.join(columns)}) VALUES ({', '.join(':' + c for c in columns)})"),
+            staged,
+        )
+
+        # MERGE (not INSERT ... SELECT) because only MERGE's OUTPUT may reference source
+        # columns, which is how each new applicant_id is tied back to its CSV row
+        db.execute(text(f"""
+            MERGE INTO applicants AS target
+            USING #bulk_applicants AS source ON 1 = 0
+            WHEN NOT MATCHED THEN
+                INSERT ({', '.join(APPLICANT_COLUMNS)}, created_at, updated_at)
+                VALUES ({', '.join('source.' + c for c in APPLICANT_COLUMNS)}, :now, :now)
+            OUTPUT source.row_no, INSERTED.applicant_id INTO #bulk_ids (row_no, applicant_id);
+        """), {"now": now})
+
+        db.execute(text("""
+            MERGE INTO applications AS target
+            USING (
+                SELECT ids.row_no, ids.applicant_id, s.comments
+                FROM #bulk_ids ids
+                JOIN #bulk_applicants s ON s.row_no = ids.row_no
+            ) AS source ON 1 = 0
+            WHEN NOT MATCHED THEN
+                INSERT (applicant_id, job_id, application_status, source, comments, updated_at)
+                VALUES (source.applicant_id, :job_id, :application_status, :source, source.comments, :now)
+            OUTPUT source.row_no, INSERTED.application_id INTO #bulk_apps (row_no, application_id);
+        """), {"job_id": job_id, "application_status": application_status, "source": source, "now": now})
+
+        # Scoring tasks only for rows that came with a resume
+        tasks = db.execute(text("""
+            INSERT INTO scoring_tasks (application_id, status, attempts, created_at, updated_at)
+            OUTPUT INSERTED.task_id, INSERTED.application_id
+            SELECT apps.application_id, 'queued', 0, :now, :now
+            FROM #bulk_apps apps
+            JOIN #bulk_applicants s ON s.row_no = apps.row_no
+            WHERE s.resume_url IS NOT NULL;
+        """), {"now": now}).fetchall()
+
+        ids = db.execute(text("""
+            SELECT ids.row_no, ids.applicant_id, apps.application_id
+            FROM #bulk_ids ids
+            JOIN #bulk_apps apps ON apps.row_no = ids.row_no
+        """)).fetchall()
+        db.execute(text(DROP_STAGING))
+
+    task_by_application = {application_id: task_id for task_id, application_id in tasks}
+    by_row = {row_no: (applicant_id, application_id) for row_no, applicant_id, application_id in ids}
+    for row in batch:
+        applicant_id, application_id = by_row[row.row_no]
+        row.result.update({
+            "status": "created",
+            "applicant_id": applicant_id,
+            "application_id": application_id,
+            "scoring_task_id": task_by_application.get(application_id),
+            "resume_deduplicated": row.resume.deduplicated if row.resume else None,
+        })
+    return list(task_by_application.values())
+
+
+def bulk_import_applicants(db: Session, csv_file, zip_file, job_id: int, source: str, application_status: str) -> dict:
+    """Create applicants and applications for every valid CSV row and queue their scoring.
+
+    Rows are validated and their resumes stored first; the valid ones are then inserted
+    ``BULK_IMPORT_BATCH_SIZE`` at a time, each batch in its own transaction. A failing
+    batch is retried row by row, so only the rows the database rejects are reported.
+    Blocking; run it in a worker thread.
+    """
+    started = time.perf_counter()
+    if application_status not in APPLICATION_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid application_status: {application_status}")
+    if not db.execute(text("SELECT 1 FROM jobs WHERE job_id = :job_id"), {"job_id": job_id}).fetchone():
+        raise HTTPException(status_code=404, detail="Job not found")
+    db.rollback()  # end the autobegun transaction before the per-batch ones
+
+    rows = _read_rows(csv_file)
+    if zip_file is not None:
+        try:
+            with zipfile.ZipFile(zip_file) as archive:
+                _attach_resumes(rows, archive)
+        except zipfile.BadZipFile as e:
+            raise HTTPException(status_code=400, detail=f"Invalid resumes ZIP: {e}")
+    else:
+        for row in rows:
+            if row.data is not None and row.data.resume_filename:
+                row.fail("Resume given but no ZIP was uploaded")
+                row.data = None
+
+    valid = [row for row in rows if row.data is not None]
+    now = datetime.now()
+    task_ids = []
+    batch_size = settings.BULK_IMPORT_BATCH_SIZE
+    for start in range(0, len(valid), batch_size):
+        batch = valid[start:start + batch_size]
+        try:
+            task_ids += _insert_batch(db, batch, job_id, source, application_status, now)
+            continue
+        except Exception as e:
+            logger.error(f"Bulk import batch of rows {batch[0].row_no}-{batch[-1].row_no} failed, retrying row by row: {e}")
+        for row in batch:
+            try:
+                task_ids += _insert_batch(db, [row], job_id, source, application_status, now)
+            except Exception as e:
+                row.fail(f"Database error: {e}")
+
+    # Only hand tasks to the workers once their batch has committed
+    for task_id in task_ids:
+        scoring_queue.enqueue(task_id)
+
+    created = sum(1 for row in rows if row.result["status"] == "created")
+    elapsed = time.perf_counter() - started
+    logger.info(f"Bulk import for job {job_id}: {created}/{len(rows)} rows created in {elapsed:.2f}s")
+    return {
+        "job_id": job_id,
+        "total": len(rows),
+        "created": created,
+        "failed": len(rows) - created,
+        "scoring_tasks_queued": len(task_ids),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows": [row.result for row in rows],
+    }
@@ -0,0 +1,384 @@
+# app/services/hiring_analytics.py
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import DateTime, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Funnel order; every status maps onto the furthest stage it implies. A rejection
+# implies none: how far a rejected candidate got comes from the status history
+FUNNEL_STAGES = ("applied", "shortlisted", "interview_scheduled", "offered", "hired")
+STAGE_INDEX = {
+    "applied": 0,
+    "shortlisted": 1,
+    "under_review": 1,
+    "interview_scheduled": 2,
+    "offered": 3,
+    "hired": 4,
+    "rejected": 0,
+}
+
+
+def _stage_case(column: str) -> str:
+    whens = " ".join(f"WHEN '{status}' THEN {index}" for status, index in STAGE_INDEX.items() if index)
+    return f"CASE {column} {whens} ELSE 0 END"
+
+# Incremental refreshes after an empty first load read from here (within DATETIME's range)
+NO_ROWS_SEEN = datetime(1900, 1, 1)
+
+APPLICATION_COLUMNS = f"""
+    a.application_id, a.job_id, COALESCE(a.source, 'unknown') AS source,
+    COALESCE(a.application_status, 'applied') AS application_status,
+    a.applied_date, a.updated_at, a.resume_overall_score,
+    (SELECT MAX(h.changed_at) FROM application_status_history h WHERE h.application_id = a.application_id)
+        AS status_changed_at,
+    (SELECT MAX(stage) FROM (
+        SELECT {_stage_case("h.to_status")} AS stage
+        FROM application_status_history h WHERE h.application_id = a.application_id
+        UNION ALL SELECT {_stage_case("h.from_status")}
+        FROM application_status_history h WHERE h.application_id = a.application_id
+    ) stages) AS history_stage,
+    CASE WHEN EXISTS (SELECT 1 FROM interview_schedule s WHERE s.application_id = a.application_id)
+         THEN 1 ELSE 0 END AS interviewed,
+    CASE WHEN EXISTS (SELECT 1 FROM confirmed_candidates c WHERE c.application_id = a.application_id)
+         THEN 1 ELSE 0 END AS offered
+"""
+
+# Applications to re-read on an incremental refresh: their own row changed, or an
+# interview or offer row was added or changed for them (which moves their furthest
+# stage without touching applications.updated_at). Each branch uses its updated_at index.
+CHANGED_APPLICATIONS = """
+    SELECT application_id FROM applications WHERE updated_at >= :since
+    UNION SELECT application_id FROM interview_schedule WHERE updated_at >= :since
+    UNION SELECT application_id FROM confirmed_candidates WHERE updated_at >= :since
+"""
+
+
+class _Rollup:
+    """Aggregates for one slice (all, one job, one source, or one job and source).
+
+    Every field is a running sum, so adding or removing one application is O(stages)
+    and reading the slice never touches the applications themselves.
+    """
+
+    __slots__ = ("current", "reached", "entered_sum", "exits", "scored", "score_sum", "rated", "rating_sum")
+
+    def __init__(self):
+        self.current = {}      # status -> applications currently in it
+        self.reached = [0] * len(FUNNEL_STAGES)
+        self.entered_sum = {}  # status -> sum of entry timestamps of current occupants
+        self.exits = {}        # status -> [completed stays, total seconds]
+        self.scored = 0
+        self.score_sum = 0.0
+        self.rated = 0
+        self.rating_sum = 0.0
+
+
+class _Application:
+    __slots__ = ("job_id", "source", "status", "furthest", "entered_at", "score", "rated", "rating_sum")
+
+    def __init__(self, job_id, source, status, furthest, entered_at, score):
+        self.job_id = job_id
+        self.source = source
+        self.status = status
+        self.furthest = furthest
+        self.entered_at = entered_at
+        self.score = score
+        self.rated = 0
+        self.rating_sum = 0.0
+
+
+class HiringAnalytics:
+    """Hiring-funnel rollups by job, source and status, kept current incrementally.
+
+    The first request loads every application once (with the furthest stage in its
+    status history and flags for interview and offer rows, so rejected candidates
+    count towards the stages they reached); after
+    that ``refresh`` only reads applications whose row, interview or offer
+    ``updated_at`` moved and ``interview_performance`` rows past the last id seen,
+    and moves each changed application between the running sums of its slices.
+    Reads are dictionary lookups, independent of the number of applications.
+
+    The ``updated_at`` watermark is read back by ``overlap_seconds``: a row can
+    commit after rows with later timestamps (and app servers' clocks differ), and
+    re-applying an application is idempotent.
+
+    Time in stage uses the latest ``application_status_history`` row of each
+    application as the time it entered its status (``applied_date`` for new
+    applications, ``updated_at`` for rows that predate the history). Transitions made
+    through this process are applied directly by ``apply_status_change``.
+    """
+
+    def __init__(self, refresh_seconds: float, overlap_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.overlap_seconds = overlap_seconds
+        self._applications = {}  # application_id -> _Application
+        self._rollups = {}       # ("all",) | ("job", id) | ("source", s) | ("job_source", id, s) -> _Rollup
+        self._lock = threading.RLock()
+        self._refresh_lock = asyncio.Lock()
+        self._last_seen = None       # newest applications.updated_at applied
+        self._last_performance_id = 0
+        self._last_refresh = 0.0
+        self._refreshed_at = None
+        self._state = "empty"
+
+    @staticmethod
+    def _keys(app: _Application) -> tuple:
+        return ("all",), ("job", app.job_id), ("source", app.source), ("job_source", app.job_id, app.source)
+
+    def _rollup(self, key) -> _Rollup:
+        rollup = self._rollups.get(key)
+        if rollup is None:
+            rollup = self._rollups[key] = _Rollup()
+        return rollup
+
+    def _contribute(self, app: _Application, sign: int):
+        entered = app.entered_at.timestamp() if app.entered_at else None
+        for key in self._keys(app):
+            rollup = self._rollup(key)
+            rollup.current[app.status] = rollup.current.get(app.status, 0) + sign
+            for index in range(app.furthest + 1):
+                rollup.reached[index] += sign
+            if entered is not None:
+                rollup.entered_sum[app.status] = rollup.entered_sum.get(app.status, 0.0) + sign * entered
+            if app.score is not None:
+                rollup.scored += sign
+                rollup.score_sum += sign * app.score
+            rollup.rated += sign * app.rated
+            rollup.rating_sum += sign * app.rating_sum
+
+    def _record_exit(self, app: _Application, left_at: datetime):
+        if app.entered_at is None or left_at < app.entered_at:
+            return
+        seconds = (left_at - app.entered_at).total_seconds()
+        for key in self._keys(app):
+            stays = self._rollup(key).exits.setdefault(app.status, [0, 0.0])
+            stays[0] += 1
+            stays[1] += seconds
+
+    def _move(self, app: _Application, status: str, changed_at: datetime):
+        # Caller has withdrawn the application's contribution
+        self._record_exit(app, changed_at)
+        app.status = status
+        app.entered_at = changed_at
+        app.furthest = max(app.furthest, STAGE_INDEX.get(status, 0))
+
+    def apply(self, application_id: int, job_id, source: str, status: str, applied_date: Optional[datetime],
+              updated_at: Optional[datetime], score, interviewed: bool = False, offered: bool = False,
+              status_changed_at: Optional[datetime] = None, history_stage: Optional[int] = None):
+        """Bring one application's contribution in line with its row."""
+        furthest = max(STAGE_INDEX.get(status, 0), int(history_stage or 0))
+        if interviewed:
+            furthest = max(furthest, STAGE_INDEX["interview_scheduled"])
+        if offered:
+            furthest = max(furthest, STAGE_INDEX["offered"])
+        score = float(score) if score is not None else None
+
+        with self._lock:
+            app = self._applications.get(application_id)
+            if app is None:
+                if status_changed_at is not None:
+                    entered_at = status_changed_at
+                else:
+                    entered_at = applied_date if status == "applied" else (updated_at or applied_date)
+                app = self._applications[application_id] = _Application(
+                    job_id, source, status, furthest, entered_at, score
+                )
+                self._contribute(app, 1)
+                return
+
+            self._contribute(app, -1)
+            if status != app.status:
+                self._move(app, status, status_changed_at or updated_at or datetime.now())
+            app.job_id, app.source, app.score = job_id, source, score
+            app.furthest = max(app.furthest, furthest)
+            self._contribute(app, 1)
+
+    def apply_status_change(self, application_id: int, status: str, changed_at: datetime):
+        """Record a transition made in this process without waiting for the next refresh."""
+        with self._lock:
+            app = self._applications.get(application_id)
+            if app is None or app.status == status:
+                return
+            self._contribute(app, -1)
+            self._move(app, status, changed_at)
+            self._contribute(app, 1)
+
+    def apply_rating(self, application_id: int, rating):
+        """Add one interviewer's final rating to the application's slices."""
+        if rating is None:
+            return
+        with self._lock:
+            app = self._applications.get(application_id)
+            if app is None:
+                return
+            self._contribute(app, -1)
+            app.rated += 1
+            app.rating_sum += float(rating)
+            self._contribute(app, 1)
+
+    async def refresh(self, db: AsyncSession, force: bool = False):
+        """Load the rollups on first use, then apply what changed since the last refresh.
+
+        At most one refresh runs at a time; other readers keep answering from the
+        current rollups meanwhile (or wait, before the first load).
+        """
+        if not force and self._state == "ready" and time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return
+        if self._refresh_lock.locked() and self._state == "ready":
+            return
+        async with self._refresh_lock:
+            if not force and self._state == "ready" and time.monotonic() - self._last_refresh < self.refresh_seconds:
+                return
+            await self._refresh(db)
+
+    async def _refresh(self, db: AsyncSession):
+        initial_load = self._last_seen is None
+        started = time.perf_counter()
+        since = self._last_seen
+        where = "" if initial_load else f"WHERE a.application_id IN ({CHANGED_APPLICATIONS})"
+        query = text(f"SELECT {APPLICATION_COLUMNS} FROM applications a {where}").columns(
+            applied_date=DateTime, updated_at=DateTime, status_changed_at=DateTime
+        )
+        params = {} if initial_load else {"since": since - timedelta(seconds=self.overlap_seconds)}
+        rows = (await db.execute(query, params)).mappings().fetchall()
+        ratings = (await db.execute(text("""
+            SELECT p.performance_id, s.application_id, p.final_rating
+            FROM interview_performance p
+            JOIN interview_rounds_attended r ON r.round_attended_id = p.round_attended_id
+            JOIN interview_schedule s ON s.schedule_id = r.schedule_id
+            WHERE p.performance_id > :last_id
+            ORDER BY p.performance_id
+        """), {"last_id": self._last_performance_id})).fetchall()
+        await db.rollback()  # read-only; don't hold the transaction open
+
+        with self._lock:
+            for row in rows:
+                self.apply(
+                    row["application_id"], row["job_id"], row["source"], row["application_status"],
+                    row["applied_date"], row["updated_at"], row["resume_overall_score"],
+                    bool(row["interviewed"]), bool(row["offered"]), row["status_changed_at"],
+                    row["history_stage"],
+                )
+                if row["updated_at"] is not None and (since is None or row["updated_at"] > since):
+                    since = row["updated_at"]
+            for performance_id, application_id, rating in ratings:
+                self.apply_rating(application_id, rating)
+                self._last_performance_id = performance_id
+            self._last_seen = since or NO_ROWS_SEEN
+            self._last_refresh = time.monotonic()
+            self._refreshed_at = datetime.now()
+            if initial_load:
+                self._state = "ready"
+                logger.info(
+                    f"Hiring analytics loaded {len(self._applications)} applications into "
+                    f"{len(self._rollups)} rollups in {(time.perf_counter() - started) * 1000:.1f} ms"
+                )
+
+    # ------------------------------------------------------------------
+    # Reads (O(stages) per slice)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _slice_key(job_id: Optional[int], source: Optional[str]) -> tuple:
+        if job_id is not None and source is not None:
+            return ("job_source", job_id, source)
+        if job_id is not None:
+            return ("job", job_id)
+        if source is not None:
+            return ("source", source)
+        return ("all",)
+
+    def _header(self, job_id, source) -> dict:
+        return {"job_id": job_id, "source": source, "as_of": self._refreshed_at}
+
+    def funnel(self, job_id: Optional[int] = None, source: Optional[str] = None) -> dict:
+        with self._lock:
+            rollup = self._rollups.get(self._slice_key(job_id, source)) or _Rollup()
+            stages = []
+            for index, stage in enumerate(FUNNEL_STAGES):
+                reached = rollup.reached[index]
+                previous = rollup.reached[index - 1] if index else reached
+                stages.append({
+                    "stage": stage,
+                    "reached": reached,
+                    "conversion_from_previous": round(reached / previous, 4) if previous else None,
+                    "conversion_from_applied": round(reached / rollup.reached[0], 4) if rollup.reached[0] else None,
+                })
+            return {
+                **self._header(job_id, source),
+                "total": rollup.reached[0],
+                "stages": stages,
+                "by_status": {status: count for status, count in rollup.current.items() if count},
+            }
+
+    def time_in_stage(self, job_id: Optional[int] = None, source: Optional[str] = None) -> dict:
+        now = datetime.now().timestamp()
+        with self._lock:
+            rollup = self._rollups.get(self._slice_key(job_id, source)) or _Rollup()
+            statuses = []
+            for status in STAGE_INDEX:
+                occupants = rollup.current.get(status, 0)
+                stays, seconds = rollup.exits.get(status, (0, 0.0))
+                if not occupants and not stays:
+                    continue
+                statuses.append({
+                    "status": status,
+                    "current": occupants,
+                    "avg_days_in_stage_so_far": (
+                        round((now - rollup.entered_sum.get(status, 0.0) / occupants) / 86400, 2) if occupants else None
+                    ),
+                    "completed_stays": stays,
+                    "avg_days_per_completed_stay": round(seconds / stays / 86400, 2) if stays else None,
+                })
+            return {**self._header(job_id, source), "statuses": statuses}
+
+    def scores(self, job_id: Optional[int] = None, source: Optional[str] = None) -> dict:
+        with self._lock:
+            rollup = self._rollups.get(self._slice_key(job_id, source)) or _Rollup()
+            return {
+                **self._header(job_id, source),
+                "scored_applications": rollup.scored,
+                "avg_resume_overall_score": round(rollup.score_sum / rollup.scored, 4) if rollup.scored else None,
+                "interview_ratings": rollup.rated,
+                "avg_interview_final_rating": round(rollup.rating_sum / rollup.rated, 2) if rollup.rated else None,
+            }
+
+    def breakdown(self, by: str) -> list:
+        """Funnel counts for every job or every source (one row per slice, not per application)."""
+        kind = "job" if by == "job" else "source"
+        with self._lock:
+            keys = [key[1] for key in self._rollups if key[0] == kind]
+        rows = []
+        for value in keys:
+            funnel = self.funnel(job_id=value) if kind == "job" else self.funnel(source=value)
+            if funnel["total"]:
+                rows.append({
+                    kind if kind == "source" else "job_id": value,
+                    "total": funnel["total"],
+                    **{stage["stage"]: stage["reached"] for stage in funnel["stages"]},
+                })
+        return sorted(rows, key=lambda row: -row["total"])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state,
+                "applications": len(self._applications),
+                "rollups": len(self._rollups),
+                "refreshed_at": self._refreshed_at.isoformat() if self._refreshed_at else None,
+            }
+
+
+hiring_analytics = HiringAnalytics(
+    refresh_seconds=settings.ANALYTICS_REFRESH_SECONDS,
+    overlap_seconds=settings.ANALYTICS_REFRESH_OVERLAP_SECONDS,
+)
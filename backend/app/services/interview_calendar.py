@@ -0,0 +1,252 @@
+# app/services/interview_calendar.py
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from sqlalchemy import DateTime, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Statuses that occupy the interviewers' and manager's time
+ACTIVE_STATUSES = ("scheduled", "rescheduled")
+
+
+def parse_interviewer_ids(value) -> List[int]:
+    """`interviewer_ids` is stored as comma-separated TEXT; accept that or an iterable of ids."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        parts = value.replace(";", ",").split(",")
+    else:
+        parts = value
+    ids = []
+    for part in parts:
+        part = str(part).strip()
+        if part.isdigit() and int(part) not in ids:
+            ids.append(int(part))
+    return ids
+
+
+class IntervalSet:
+    """Bookings of one person, ordered by start.
+
+    Overlap queries bisect on start time and only look back as far as the longest
+    booking held, so a check costs O(log n + matches) rather than a scan. Inserts
+    and deletes keep the order incrementally.
+    """
+
+    __slots__ = ("_items", "_max_length")
+
+    def __init__(self):
+        self._items = []  # (start, end, schedule_id), sorted
+        self._max_length = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, start: datetime, end: datetime, schedule_id: int):
+        insort(self._items, (start, end, schedule_id))
+        self._max_length = max(self._max_length, end - start)
+
+    def remove(self, start: datetime, end: datetime, schedule_id: int):
+        index = bisect_left(self._items, (start, end, schedule_id))
+        if index < len(self._items) and self._items[index] == (start, end, schedule_id):
+            del self._items[index]
+
+    def overlapping(self, start: datetime, end: datetime) -> list:
+        """Bookings intersecting the half-open interval [start, end)."""
+        lo = bisect_left(self._items, (start - self._max_length,))
+        hi = bisect_left(self._items, (end,))
+        return [item for item in self._items[lo:hi] if item[1] > start]
+
+
+class InterviewCalendar:
+    """In-memory index of active interview bookings per interviewer and per manager.
+
+    Loaded from ``interview_schedule`` on first use, then kept current incrementally:
+    writes in this process are applied directly, and ``refresh`` picks up rows other
+    workers changed with one indexed query on ``updated_at``. That query re-reads
+    ``overlap_seconds`` before the newest timestamp seen, because a row can commit
+    after rows with later timestamps (and app servers' clocks differ); applying a
+    row twice is harmless. The database stays the source of truth: bookings are
+    checked against the table when they are written, and the index only answers
+    conflict and free-slot questions without scanning ``interviewer_ids`` with LIKE.
+    """
+
+    def __init__(self, lookback_days: int, refresh_seconds: float, overlap_seconds: float):
+        self.lookback_days = lookback_days
+        self.refresh_seconds = refresh_seconds
+        self.overlap_seconds = overlap_seconds
+        self._people = {}        # ("interviewer" | "manager", id) -> IntervalSet
+        self._bookings = {}      # schedule_id -> (start, end, keys)
+        self._lock = threading.RLock()
+        self._last_seen = None   # newest updated_at applied
+        self._last_refresh = 0.0
+        self._state = "empty"
+
+    @staticmethod
+    def _keys(interviewer_ids: Iterable[int], manager_id: Optional[int]) -> tuple:
+        keys = tuple(("interviewer", int(i)) for i in interviewer_ids)
+        if manager_id is not None:
+            keys += (("manager", int(manager_id)),)
+        return keys
+
+    def apply(self, schedule_id: int, start: Optional[datetime], duration_minutes: Optional[int],
+              interviewer_ids, manager_id: Optional[int], status: Optional[str]):
+        """Insert, move or drop one booking to match its row."""
+        schedule_id = int(schedule_id)
+        with self._lock:
+            self.remove(schedule_id)
+            if status not in ACTIVE_STATUSES or start is None or not duration_minutes:
+                return
+            end = start + timedelta(minutes=int(duration_minutes))
+            keys = self._keys(parse_interviewer_ids(interviewer_ids), manager_id)
+            for key in keys:
+                people = self._people.get(key)
+                if people is None:
+                    people = self._people[key] = IntervalSet()
+                people.add(start, end, schedule_id)
+            self._bookings[schedule_id] = (start, end, keys)
+
+    def remove(self, schedule_id: int):
+        with self._lock:
+            booking = self._bookings.pop(int(schedule_id), None)
+            if booking is None:
+                return
+            start, end, keys = booking
+            for key in keys:
+                people = self._people.get(key)
+                if people is not None:
+                    people.remove(start, end, int(schedule_id))
+                    if not len(people):
+                        del self._people[key]
+
+    def conflicts(self, start: datetime, duration_minutes: int, interviewer_ids, manager_id: Optional[int] = None,
+                  exclude_schedule_id: Optional[int] = None) -> list:
+        """Existing bookings that overlap the proposed one, per person."""
+        end = start + timedelta(minutes=int(duration_minutes))
+        found = []
+        with self._lock:
+            for role, person_id in self._keys(parse_interviewer_ids(interviewer_ids), manager_id):
+                people = self._people.get((role, person_id))
+                if people is None:
+                    continue
+                for booked_start, booked_end, schedule_id in people.overlapping(start, end):
+                    if schedule_id != exclude_schedule_id:
+                        found.append({
+                            "schedule_id": schedule_id, "role": role, "person_id": person_id,
+                            "start": booked_start, "end": booked_end,
+                        })
+        return found
+
+    def free_slots(self, duration_minutes: int, interviewer_ids, manager_id: Optional[int] = None,
+                   window_start: Optional[datetime] = None, window_end: Optional[datetime] = None,
+                   limit: int = 5, exclude_schedule_id: Optional[int] = None) -> list:
+        """Earliest slots in the window where everyone involved is free, within working hours."""
+        duration = timedelta(minutes=int(duration_minutes))
+        step = timedelta(minutes=settings.INTERVIEW_SLOT_MINUTES)
+        window_start = _align(window_start or datetime.now(), step)
+        window_end = window_end or window_start + timedelta(days=settings.INTERVIEW_FREE_SLOT_SEARCH_DAYS)
+
+        # Everyone's busy intervals in the window, merged into one sorted list
+        busy = []
+        with self._lock:
+            for key in self._keys(parse_interviewer_ids(interviewer_ids), manager_id):
+                people = self._people.get(key)
+                if people is not None:
+                    busy += [(s, e) for s, e, sid in people.overlapping(window_start, window_end)
+                             if sid != exclude_schedule_id]
+        busy.sort()
+        merged = []
+        for s, e in busy:
+            if merged and s <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], e)
+            else:
+                merged.append([s, e])
+
+        slots = []
+        day = window_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        index = 0
+        while day < window_end and len(slots) < limit:
+            if not (settings.INTERVIEW_WEEKDAYS_ONLY and day.weekday() >= 5):
+                candidate = max(window_start, day + timedelta(hours=settings.INTERVIEW_DAY_START_HOUR))
+                day_end = min(window_end, day + timedelta(hours=settings.INTERVIEW_DAY_END_HOUR))
+                while candidate + duration <= day_end and len(slots) < limit:
+                    while index < len(merged) and merged[index][1] <= candidate:
+                        index += 1
+                    if index < len(merged) and merged[index][0] < candidate + duration:
+                        candidate = _align(merged[index][1], step)
+                        continue
+                    slots.append({"start": candidate, "end": candidate + duration})
+                    candidate = _align(candidate + duration, step)
+            day += timedelta(days=1)
+        return slots
+
+    async def refresh(self, db: AsyncSession, force: bool = False):
+        """Load the index on first use, then apply rows changed since the last refresh.
+
+        Reads refresh at most every ``refresh_seconds``; writes pass ``force``.
+        """
+        if not force and self._state == "ready" and time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return
+        columns = "schedule_id, scheduled_date, duration_minutes, interviewer_ids, manager_id, schedule_status, updated_at"
+        initial_load = self._last_seen is None
+        started = time.perf_counter()
+        if initial_load:
+            since = datetime.now()
+            query = text(f"""
+                SELECT {columns}
+                FROM interview_schedule
+                WHERE schedule_status IN ('scheduled', 'rescheduled') AND scheduled_date >= :since
+            """)
+            params = {"since": since - timedelta(days=self.lookback_days)}
+        else:
+            since = self._last_seen
+            query = text(f"""
+                SELECT {columns}
+                FROM interview_schedule
+                WHERE updated_at >= :since
+            """)
+            params = {"since": since - timedelta(seconds=self.overlap_seconds)}
+        # Typed so drivers that return text for DATETIME still give datetimes
+        query = query.columns(scheduled_date=DateTime, updated_at=DateTime)
+        rows = (await db.execute(query, params)).fetchall()
+
+        with self._lock:
+            for row in rows:
+                self.apply(row[0], row[1], row[2], row[3], row[4], row[5])
+                if row[6] is not None and row[6] > since:
+                    since = row[6]
+            # On the first load, rows changed while it ran are picked up by the next refresh
+            self._last_seen = since
+            self._last_refresh = time.monotonic()
+            if initial_load:
+                self._state = "ready"
+                logger.info(
+                    f"Interview calendar loaded {len(self._bookings)} bookings for {len(self._people)} people "
+                    f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+                )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"state": self._state, "bookings": len(self._bookings), "people": len(self._people)}
+
+
+def _align(moment: datetime, step: timedelta) -> datetime:
+    """Round up to the slot grid so proposed slots start on e.g. :00/:15/:30/:45."""
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    offset = moment - day
+    return day + (offset // step + (1 if offset % step else 0)) * step
+
+
+interview_calendar = InterviewCalendar(
+    lookback_days=settings.INTERVIEW_CALENDAR_LOOKBACK_DAYS,
+    refresh_seconds=settings.INTERVIEW_CALENDAR_REFRESH_SECONDS,
+    overlap_seconds=settings.INTERVIEW_CALENDAR_REFRESH_OVERLAP_SECONDS,
+)
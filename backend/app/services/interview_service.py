@@ -0,0 +1,241 @@
+# app/services/interview_service.py
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.interviews.schemas import MAX_DURATION_MINUTES, InterviewScheduleCreate, InterviewScheduleUpdate
+from app.config import settings
+from .interview_calendar import ACTIVE_STATUSES, interview_calendar, parse_interviewer_ids
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_COLUMNS = (
+    "schedule_id, application_id, round_number, round_type, scheduled_date, duration_minutes, "
+    "interviewer_ids, manager_id, meeting_link, location, schedule_status, remarks, created_by, "
+    "created_at, updated_at"
+)
+SUGGESTED_SLOTS = 3
+
+# The final conflict check runs in the database, inside the write transaction, so
+# it holds across API workers. An exclusive application lock per person involved
+# (taken in a fixed order, released at commit or rollback) serialises writes that
+# book the same people; the overlap query then reads the table itself, not the
+# in-memory index, which may not have seen another worker's booking yet.
+BOOKING_LOCK = """
+    EXEC @result = sp_getapplock @Resource = :resource_{n}, @LockMode = 'Exclusive',
+                                 @LockOwner = 'Transaction', @LockTimeout = :timeout_ms;
+    IF @result < 0 THROW 51000, 'Timed out waiting for an interview booking lock', 1;
+"""
+# Bookings are at most MAX_DURATION_MINUTES long, so only starts in that window can overlap
+OVERLAPPING_BOOKINGS = """
+    SELECT schedule_id, scheduled_date, duration_minutes, interviewer_ids, manager_id
+    FROM interview_schedule
+    WHERE schedule_status IN ('scheduled', 'rescheduled')
+      AND scheduled_date > :earliest AND scheduled_date < :end
+      AND schedule_id <> :exclude_schedule_id
+"""
+
+
+def _schedule_query(sql: str):
+    # Typed so drivers that return text for DATETIME still give datetimes
+    return text(sql).columns(scheduled_date=DateTime, created_at=DateTime, updated_at=DateTime)
+
+
+def _isoformat(items: list) -> list:
+    return [
+        {key: value.isoformat() if isinstance(value, datetime) else value for key, value in item.items()}
+        for item in items
+    ]
+
+
+def _conflict_error(conflicts: list, data: dict, exclude_schedule_id: Optional[int] = None) -> HTTPException:
+    """409 listing the clashing bookings and the next free slots for the same people."""
+    slots = interview_calendar.free_slots(
+        data["duration_minutes"], data["interviewer_ids"], data.get("manager_id"),
+        window_start=data["scheduled_date"], limit=SUGGESTED_SLOTS, exclude_schedule_id=exclude_schedule_id,
+    )
+    return HTTPException(status_code=409, detail={
+        "message": "Interviewer or manager is already booked at that time",
+        "conflicts": _isoformat(conflicts),
+        "suggested_slots": _isoformat(slots),
+    })
+
+
+def _people(interviewer_ids, manager_id: Optional[int]) -> list:
+    people = [("interviewer", person_id) for person_id in parse_interviewer_ids(interviewer_ids)]
+    if manager_id is not None:
+        people.append(("manager", int(manager_id)))
+    return sorted(people)
+
+
+async def _lock_and_check(db: AsyncSession, data: dict, exclude_schedule_id: Optional[int] = None) -> list:
+    """Lock the people of a booking for this transaction and return the bookings it overlaps, per person."""
+    people = _people(data["interviewer_ids"], data.get("manager_id"))
+    batch = "DECLARE @result INT;" + "".join(BOOKING_LOCK.format(n=n) for n in range(len(people)))
+    await db.execute(text(batch), {
+        **{f"resource_{n}": f"interview:{role}:{person_id}" for n, (role, person_id) in enumerate(people)},
+        "timeout_ms": settings.INTERVIEW_BOOKING_LOCK_TIMEOUT_MS,
+    })
+
+    start = data["scheduled_date"]
+    end = start + timedelta(minutes=int(data["duration_minutes"]))
+    rows = (await db.execute(text(OVERLAPPING_BOOKINGS).columns(scheduled_date=DateTime), {
+        "earliest": start - timedelta(minutes=MAX_DURATION_MINUTES),
+        "end": end,
+        "exclude_schedule_id": exclude_schedule_id or 0,
+    })).fetchall()
+
+    wanted = set(people)
+    conflicts = []
+    for schedule_id, booked_start, duration_minutes, interviewer_ids, manager_id in rows:
+        booked_end = booked_start + timedelta(minutes=int(duration_minutes or 0))
+        if booked_end <= start:
+            continue
+        # The index may not have this row yet; it is needed for the suggested slots
+        interview_calendar.apply(schedule_id, booked_start, duration_minutes, interviewer_ids, manager_id, "scheduled")
+        for role, person_id in _people(interviewer_ids, manager_id):
+            if (role, person_id) in wanted:
+                conflicts.append({
+                    "schedule_id": schedule_id, "role": role, "person_id": person_id,
+                    "start": booked_start, "end": booked_end,
+                })
+    return conflicts
+
+
+def _row_to_dict(row) -> dict:
+    item = dict(row)
+    item["interviewer_ids"] = parse_interviewer_ids(item["interviewer_ids"])
+    return item
+
+
+def _booking_error(e: DBAPIError) -> HTTPException:
+    if "interview booking lock" in str(e.orig):
+        return HTTPException(status_code=503, detail="Another booking for the same people is in progress, retry")
+    return HTTPException(status_code=500, detail=f"Database error: {e.orig}")
+
+
+async def schedule_interview(db: AsyncSession, schedule: InterviewScheduleCreate) -> dict:
+    data = schedule.model_dump()
+    data["interviewer_ids"] = parse_interviewer_ids(data["interviewer_ids"])
+
+    await interview_calendar.refresh(db)
+    try:
+        conflicts = await _lock_and_check(db, data)
+        if conflicts:
+            await db.rollback()
+            raise _conflict_error(conflicts, data)
+
+        # Taken once the locks are held, so the row's updated_at is not older than
+        # bookings of the same people that committed while this request waited
+        now = datetime.now()
+        schedule_id = (await db.execute(text("""
+            INSERT INTO interview_schedule (
+                application_id, round_number, round_type, scheduled_date, duration_minutes,
+                interviewer_ids, manager_id, meeting_link, location, schedule_status, remarks,
+                created_by, created_at, updated_at
+            )
+            OUTPUT INSERTED.schedule_id
+            VALUES (
+                :application_id, :round_number, :round_type, :scheduled_date, :duration_minutes,
+                :interviewer_ids, :manager_id, :meeting_link, :location, 'scheduled', :remarks,
+                :created_by, :now, :now
+            )
+        """), {**data, "interviewer_ids": ",".join(map(str, data["interviewer_ids"])), "now": now})).scalar_one()
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"Unknown application, manager or creator: {e.orig}")
+    except DBAPIError as e:
+        await db.rollback()
+        raise _booking_error(e)
+
+    interview_calendar.apply(
+        schedule_id, data["scheduled_date"], data["duration_minutes"],
+        data["interviewer_ids"], data["manager_id"], "scheduled",
+    )
+    logger.info(f"Interview {schedule_id} scheduled for application {data['application_id']}")
+    return {"message": "Interview scheduled", "schedule_id": int(schedule_id), "schedule_status": "scheduled"}
+
+
+async def update_interview(db: AsyncSession, schedule_id: int, changes: InterviewScheduleUpdate) -> dict:
+    updates = changes.model_dump(exclude_unset=True)
+    if not updates:
+        raise HTTPException(status_code=400, detail="No fields to update")
+
+    await interview_calendar.refresh(db)
+    try:
+        # UPDLOCK keeps concurrent edits of this booking from working on the same old row
+        row = (await db.execute(
+            _schedule_query(
+                f"SELECT {SCHEDULE_COLUMNS} FROM interview_schedule WITH (UPDLOCK, ROWLOCK) WHERE schedule_id = :schedule_id"
+            ),
+            {"schedule_id": schedule_id},
+        )).mappings().fetchone()
+        if row is None:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Interview not found")
+
+        current = _row_to_dict(row)
+        if "interviewer_ids" in updates:
+            updates["interviewer_ids"] = parse_interviewer_ids(updates["interviewer_ids"])
+        if (
+            "scheduled_date" in updates and updates["scheduled_date"] != current["scheduled_date"]
+            and "schedule_status" not in updates and current["schedule_status"] == "scheduled"
+        ):
+            updates["schedule_status"] = "rescheduled"
+        merged = {**current, **updates}
+
+        if merged["schedule_status"] in ACTIVE_STATUSES and merged["scheduled_date"] and merged["duration_minutes"]:
+            conflicts = await _lock_and_check(db, merged, exclude_schedule_id=schedule_id)
+            if conflicts:
+                await db.rollback()
+                raise _conflict_error(conflicts, merged, exclude_schedule_id=schedule_id)
+
+        params = {**updates, "schedule_id": schedule_id, "now": datetime.now()}
+        if "interviewer_ids" in params:
+            params["interviewer_ids"] = ",".join(map(str, params["interviewer_ids"]))
+        assignments = ", ".join(f"{column} = :{column}" for column in updates)
+        await db.execute(
+            text(f"UPDATE interview_schedule SET {assignments}, updated_at = :now WHERE schedule_id = :schedule_id"),
+            params,
+        )
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"Unknown manager: {e.orig}")
+    except DBAPIError as e:
+        await db.rollback()
+        raise _booking_error(e)
+
+    interview_calendar.apply(
+        schedule_id, merged["scheduled_date"], merged["duration_minutes"],
+        merged["interviewer_ids"], merged["manager_id"], merged["schedule_status"],
+    )
+    return {"message": "Interview updated", "schedule_id": schedule_id, "schedule_status": merged["schedule_status"]}
+
+
+async def list_interviews(db: AsyncSession, application_id: int) -> list:
+    rows = (await db.execute(_schedule_query(f"""
+        SELECT {SCHEDULE_COLUMNS}
+        FROM interview_schedule
+        WHERE application_id = :application_id
+        ORDER BY round_number, scheduled_date
+    """), {"application_id": application_id})).mappings().fetchall()
+    return [_row_to_dict(row) for row in rows]
+
+
+async def find_conflicts(db: AsyncSession, interviewer_ids, manager_id: Optional[int], start: datetime,
+                         duration_minutes: int, exclude_schedule_id: Optional[int] = None) -> list:
+    await interview_calendar.refresh(db)
+    return interview_calendar.conflicts(start, duration_minutes, interviewer_ids, manager_id, exclude_schedule_id)
+
+
+async def find_free_slots(db: AsyncSession, interviewer_ids, manager_id: Optional[int], duration_minutes: int,
+                          window_start: Optional[datetime], window_end: Optional[datetime], limit: int) -> list:
+    await interview_calendar.refresh(db)
+    return interview_calendar.free_slots(duration_minutes, interviewer_ids, manager_id, window_start, window_end, limit)
@@ -0,0 +1,121 @@
+# app/services/jd_embedding_cache.py
+import glob
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from app.config import settings
+from app.core.metrics import timed_stage
+from .model_registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+
+class JDEmbeddingCache:
+    """LRU cache of job-description embeddings keyed by (job_id, JD content hash).
+
+    The hash covers the preprocessed JD text and the model it was encoded with, so an
+    edited JD or a model swap can never be served a stale vector. Entries are optionally
+    written to ``persist_dir`` as ``<job_id>_<hash>.npy`` so they survive restarts.
+    """
+
+    def __init__(self, max_entries: int, persist_dir: str = None):
+        self.max_entries = max_entries
+        self.persist_dir = persist_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    @staticmethod
+    def content_hash(jd_clean: str) -> str:
+        payload = f"{model_registry.source}\0{jd_clean}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, job_id: int, jd_clean: str) -> np.ndarray:
+        """Return the embedding for a preprocessed JD, encoding it only on a miss."""
+        key = (int(job_id), self.content_hash(jd_clean))
+
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vector
+            self.misses += 1
+
+        vector = self._load(key)
+        if vector is None:
+            with timed_stage("embedding"):
+                vector = model_registry.get_model().encode(
+                    [jd_clean], normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False
+                )[0].astype(np.float32)
+            self._save(key, vector)
+
+        self._put(key, vector)
+        return vector
+
+    def invalidate(self, job_id: int):
+        """Drop every cached embedding for a job, in memory and on disk."""
+        job_id = int(job_id)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == job_id]:
+                del self._entries[key]
+        if self.persist_dir:
+            for path in glob.glob(os.path.join(self.persist_dir, f"{job_id}_*.npy")):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Could not remove cached JD embedding {path}: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses}
+
+    def _put(self, key, vector):
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key) -> str:
+        return os.path.join(self.persist_dir, f"{key[0]}_{key[1]}.npy")
+
+    def _load(self, key):
+        if not self.persist_dir:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            return np.load(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable JD embedding {path}: {e}")
+            return None
+
+    def _save(self, key, vector):
+        if not self.persist_dir:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            # Write-then-rename so a concurrent reader never sees a half-written file
+            with open(tmp_path, "wb") as fh:
+                np.save(fh, vector)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist JD embedding {path}: {e}")
+
+
+jd_embedding_cache = JDEmbeddingCache(
+    max_entries=settings.JD_EMBEDDING_CACHE_SIZE,
+    persist_dir=settings.JD_EMBEDDING_CACHE_DIR if settings.JD_EMBEDDING_PERSIST else None,
+)
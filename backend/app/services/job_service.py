@@ -1,8 +1,18 @@
-from sqlalchemy.orm import Session
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.api.v1.hr.schemas import JobCreate
+from app.api.v1.hr.schemas import JobCreate, JobUpdate
 from datetime import datetime
 from fastapi import HTTPException
+from app.services.aishortlist import prime_jd_embedding
+from app.services.jd_embedding_cache import jd_embedding_cache
+from app.services.score_reranking import component_score_cache
+from app.services.scoring_weights import job_weights
+from app.services.skill_matcher import skill_matcher_cache
+from app.core.cache import CachedEntry, TTLCache
+from app.config import settings
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -12,40 +22,102 @@ from sqlalchemy import text
 
 # app/services/job_service.py
 
-def get_active_jobs(db: Session):
-    query = text("""
-        SELECT 
-            job_id,
-            created_by,
-            title,
-            job_code,
-            department,
-            location,
-            employment_type,
-            experience_required,
-            salary_range,
-            jd,
-            key_skills,
-            additional_skills,
-            openings,
-            posted_date,
-            closing_date,
-            status,
-            approved_by,
-            approved_date
+# Columns the job list can project (name -> SQL expression). jd_preview is the start
+# of the JD for list cards; the full JD is only sent on request or by the detail endpoint.
+JOB_LIST_FIELDS = {
+    "job_id": "job_id",
+    "created_by": "created_by",
+    "title": "title",
+    "job_code": "job_code",
+    "department": "department",
+    "location": "location",
+    "employment_type": "employment_type",
+    "experience_required": "experience_required",
+    "salary_range": "salary_range",
+    "jd": "jd",
+    "jd_preview": "SUBSTRING(jd, 1, 280)",
+    "key_skills": "key_skills",
+    "additional_skills": "additional_skills",
+    "semantic_weight": "semantic_weight",
+    "high_skill_weight": "high_skill_weight",
+    "openings": "openings",
+    "posted_date": "posted_date",
+    "closing_date": "closing_date",
+    "status": "status",
+    "approved_by": "approved_by",
+    "approved_date": "approved_date",
+}
+JOB_SUMMARY_FIELDS = (
+    "job_id", "title", "job_code", "department", "location", "employment_type",
+    "openings", "posted_date", "closing_date", "status", "jd_preview",
+)
+ALL_JOB_FIELDS = tuple(name for name in JOB_LIST_FIELDS if name != "jd_preview")
+
+
+def resolve_job_fields(fields: str = None, include_jd: bool = False) -> tuple:
+    """Turn a ``fields=`` query value into a validated column tuple (job_id always included)."""
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in JOB_LIST_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown job fields: {', '.join(unknown)}")
+        columns = ["job_id"] + [name for name in requested if name != "job_id"]
+    else:
+        columns = list(JOB_SUMMARY_FIELDS)
+    if include_jd and "jd" not in columns:
+        columns.append("jd")
+    return tuple(dict.fromkeys(columns))
+
+
+# Read-through cache for the job list and job detail endpoints. Every write below
+# invalidates the keys it affects; the TTL only bounds staleness across API workers.
+ACTIVE_JOBS_KEY = ("active_jobs",)
+job_cache = TTLCache(max_entries=settings.JOB_CACHE_SIZE, ttl_seconds=settings.JOB_CACHE_TTL_SECONDS)
+
+
+def _job_key(job_id: int) -> tuple:
+    return ("job", int(job_id))
+
+
+def invalidate_job_cache(job_id: int = None):
+    """Drop every cached projection of the job list and, if given, one job's detail."""
+    job_cache.invalidate_prefix(ACTIVE_JOBS_KEY)
+    if job_id is not None:
+        job_cache.invalidate(_job_key(job_id))
+
+
+async def get_active_jobs_cached(db: AsyncSession, columns: tuple = JOB_SUMMARY_FIELDS) -> CachedEntry:
+    async def load():
+        return {"active_jobs": await get_active_jobs(db, columns)}
+
+    return await job_cache.get_or_load(ACTIVE_JOBS_KEY + (columns,), load)
+
+
+async def get_job_by_id_cached(db: AsyncSession, job_id: int) -> CachedEntry:
+    return await job_cache.get_or_load(_job_key(job_id), lambda: get_job_by_id(db, job_id))
+
+
+async def get_active_jobs(db: AsyncSession, columns: tuple = ALL_JOB_FIELDS):
+    """Open jobs, newest first, projected to ``columns`` (keys of JOB_LIST_FIELDS)."""
+    select_list = ",\n            ".join(
+        name if JOB_LIST_FIELDS[name] == name else f"{JOB_LIST_FIELDS[name]} AS {name}" for name in columns
+    )
+    query = text(f"""
+        SELECT
+            {select_list}
         FROM jobs 
         WHERE status = 'open'
         ORDER BY posted_date DESC
     """)
-    result = db.execute(query).mappings().fetchall()
-    return [dict(row) for row in result]  # ← Returns full dict
+    result = (await db.execute(query)).mappings().fetchall()
+    return [dict(row) for row in result]
 
 
-def create_job(db: Session, job: JobCreate):
+async def create_job(db: AsyncSession, job: JobCreate):
     # Check if approved_by exists in users table
     if job.approved_by:
         query = text("SELECT emp_id FROM users WHERE emp_id = :emp_id")
-        user = db.execute(query, {"emp_id": job.approved_by}).fetchone()
+        user = (await db.execute(query, {"emp_id": job.approved_by})).fetchone()
         if not user:
             raise HTTPException(status_code=400, detail=f"User with emp_id {job.approved_by} not found.")
     
@@ -54,10 +126,14 @@ def create_job(db: Session, job: JobCreate):
         INSERT INTO jobs (
             created_by, title, job_code, department, location, employment_type,
             experience_required, salary_range, jd, key_skills, additional_skills,
+            semantic_weight, high_skill_weight,
             openings, posted_date, closing_date, status, approved_by, approved_date
-        ) VALUES (
+        )
+        OUTPUT INSERTED.job_id
+        VALUES (
             :created_by, :title, :job_code, :department, :location, :employment_type,
             :experience_required, :salary_range, :jd, :key_skills, :additional_skills,
+            :semantic_weight, :high_skill_weight,
             :openings, :posted_date, :closing_date, :status, :approved_by, :approved_date
         )
     """)
@@ -66,8 +142,8 @@ def create_job(db: Session, job: JobCreate):
     posted_date = job.posted_date or datetime.now()
 
     try:
-        # Execute the INSERT query
-        db.execute(insert_query, {
+        # Execute the INSERT query; OUTPUT returns the new job_id in the same round trip
+        result = await db.execute(insert_query, {
             "created_by": job.created_by,
             "title": job.title,
             "job_code": job.job_code,
@@ -79,6 +155,8 @@ def create_job(db: Session, job: JobCreate):
             "jd": job.jd,
             "key_skills": job.key_skills,
             "additional_skills": job.additional_skills,
+            "semantic_weight": job.semantic_weight,
+            "high_skill_weight": job.high_skill_weight,
             "openings": job.openings,
             "posted_date": posted_date,
             "closing_date": job.closing_date,
@@ -86,15 +164,21 @@ def create_job(db: Session, job: JobCreate):
             "approved_by": job.approved_by,
             "approved_date": job.approved_date
         })
-        db.commit()  # Commit the transaction after the insert
+        job_id = int(result.fetchone()[0])
+        await db.commit()  # Commit the transaction after the insert
+        invalidate_job_cache()
+
+        # Compile the skill matcher and encode the JD once now so applicant scoring only does per-resume work
+        skill_matcher_cache.compile(job_id, job.key_skills, job.additional_skills)
+        if job.jd:
+            prime_jd_embedding(job_id, job.jd)
 
         # Return a success message or status indicating job creation
-        return {"message": "Job created successfully", "status": "success"}
+        return {"message": "Job created successfully", "status": "success", "job_id": job_id}
 
     except Exception as e:
-        db.rollback()  # Rollback in case of error
-        # Log the error for debugging purposes
-        print(f"Error: {str(e)}")
+        await db.rollback()  # Rollback in case of error
+        logger.error(f"Error creating job: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating job: {str(e)}")
     
 
@@ -102,17 +186,94 @@ def create_job(db: Session, job: JobCreate):
 
 
 # app/services/job_service.py
-def get_job_by_id(db: Session, job_id: int):
+async def get_job_by_id(db: AsyncSession, job_id: int):
     query = text("""
         SELECT 
             job_id, created_by, title, job_code, department, location,
             employment_type, experience_required, salary_range, jd,
-            key_skills, additional_skills, openings, posted_date,
-            closing_date, status, approved_by, approved_date
+            key_skills, additional_skills, semantic_weight, high_skill_weight,
+            openings, posted_date, closing_date, status, approved_by, approved_date
         FROM jobs 
         WHERE job_id = :job_id
     """)
-    result = db.execute(query, {"job_id": job_id}).mappings().fetchone()
+    result = (await db.execute(query, {"job_id": job_id})).mappings().fetchone()
     if not result:
         raise HTTPException(status_code=404, detail="Job not found")
-    return dict(result)
\ No newline at end of file
+    return dict(result)
+
+
+# Columns that may be changed through update_job
+UPDATABLE_JOB_COLUMNS = (
+    "title", "job_code", "department", "location", "employment_type",
+    "experience_required", "salary_range", "jd", "key_skills", "additional_skills",
+    "semantic_weight", "high_skill_weight",
+    "openings", "posted_date", "closing_date", "status", "approved_by", "approved_date",
+)
+
+# Re-derives every stored keyword and overall score of a job from the persisted
+# components after its weights change; set-based, so no resume is read or encoded.
+# Rows scored before the high/normal split was stored keep their keyword score.
+KEYWORD_FROM_COMPONENTS = """
+    CASE WHEN high_skill_match IS NULL OR normal_skill_match IS NULL THEN skills_matching_score
+         ELSE ROUND(:high_skill_weight * high_skill_match + (1 - :high_skill_weight) * normal_skill_match, 4) END
+"""
+REWEIGHT_JOB_SCORES = f"""
+    UPDATE applications
+    SET skills_matching_score = {KEYWORD_FROM_COMPONENTS},
+        resume_overall_score = ROUND(
+            :semantic_weight * jd_matching_score
+            + (1 - :semantic_weight) * COALESCE({KEYWORD_FROM_COMPONENTS}, 0), 4),
+        updated_at = :now
+    WHERE job_id = :job_id AND jd_matching_score IS NOT NULL
+"""
+
+
+async def update_job(db: AsyncSession, job_id: int, job: JobUpdate):
+    changes = {
+        column: value
+        for column, value in job.model_dump(exclude_unset=True).items()
+        if column in UPDATABLE_JOB_COLUMNS
+    }
+    if not changes:
+        raise HTTPException(status_code=400, detail="No job fields to update")
+
+    assignments = ", ".join(f"{column} = :{column}" for column in changes)
+    query = text(f"UPDATE jobs SET {assignments} WHERE job_id = :job_id")
+
+    reweighted = "semantic_weight" in changes or "high_skill_weight" in changes
+    try:
+        updated = (await db.execute(query, {**changes, "job_id": job_id})).rowcount
+        if not updated:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Job not found")
+        if reweighted:
+            stored = (await db.execute(
+                text("SELECT semantic_weight, high_skill_weight FROM jobs WHERE job_id = :job_id"), {"job_id": job_id}
+            )).fetchone()
+            weights = job_weights(stored[0], stored[1])
+            await db.execute(text(REWEIGHT_JOB_SCORES), {
+                "semantic_weight": weights.semantic,
+                "high_skill_weight": weights.high_skill,
+                "now": datetime.now(),
+                "job_id": job_id,
+            })
+        await db.commit()
+        invalidate_job_cache(job_id)
+        if reweighted:
+            component_score_cache.invalidate(job_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error updating job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Error updating job: {str(e)}")
+
+    # Recompile the skill matcher and re-encode the JD when they changed
+    if "key_skills" in changes or "additional_skills" in changes:
+        skill_matcher_cache.invalidate(job_id)
+    if "jd" in changes:
+        jd_embedding_cache.invalidate(job_id)
+        if changes["jd"]:
+            prime_jd_embedding(job_id, changes["jd"])
+
+    return await get_job_by_id(db, job_id)
@@ -0,0 +1,98 @@
+# app/services/model_registry.py
+import logging
+import os
+import threading
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """Holds the one SentenceTransformer instance shared by everything in this process.
+
+    Nothing is imported or loaded at import time: the model is built on the first call
+    to ``get_model()`` or by ``warm_up()`` in a background thread after startup.
+    """
+
+    def __init__(self, model_name: str, model_path: str = None, device: str = None):
+        self.model_name = model_name
+        self.model_path = model_path
+        self.device = device
+        self._model = None
+        self._state = "not_loaded"
+        self._error = None
+        self._load_seconds = None
+        self._lock = threading.Lock()
+        self._warm_thread = None
+
+    @property
+    def source(self) -> str:
+        return self.model_path or self.model_name
+
+    def is_ready(self) -> bool:
+        return self._model is not None
+
+    def get_model(self):
+        """Return the shared model, loading it on first use (thread-safe)."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._load()
+        return self._model
+
+    def warm_up(self):
+        """Load the model in a daemon thread so startup and unrelated routes are not delayed."""
+        if self._model is not None or (self._warm_thread and self._warm_thread.is_alive()):
+            return
+        self._warm_thread = threading.Thread(target=self._warm, name="embedding-model-warmup", daemon=True)
+        self._warm_thread.start()
+
+    def status(self) -> dict:
+        return {
+            "model": self.source,
+            "state": self._state,
+            "ready": self.is_ready(),
+            "load_seconds": self._load_seconds,
+            "error": self._error,
+        }
+
+    def _warm(self):
+        try:
+            model = self.get_model()
+            # One tiny encode pays for lazy kernel/tokenizer initialisation up front
+            model.encode(["warm up"], show_progress_bar=False)
+        except Exception as e:
+            logger.error(f"Embedding model warm-up failed: {e}")
+
+    def _load(self):
+        self._state = "loading"
+        self._error = None
+        started = time.perf_counter()
+        try:
+            if self.model_path:
+                # A local model directory must never fall back to the Hugging Face hub
+                if not os.path.isdir(self.model_path):
+                    raise FileNotFoundError(f"Embedding model path not found: {self.model_path}")
+                os.environ.setdefault("HF_HUB_OFFLINE", "1")
+                os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+            from sentence_transformers import SentenceTransformer
+
+            self._model = SentenceTransformer(self.source, device=self.device)
+        except Exception as e:
+            self._state = "failed"
+            self._error = str(e)
+            raise
+
+        self._load_seconds = round(time.perf_counter() - started, 3)
+        self._state = "ready"
+        logger.info(f"Embedding model '{self.source}' loaded in {self._load_seconds}s")
+
+
+model_registry = ModelRegistry(
+    model_name=settings.EMBEDDING_MODEL_NAME,
+    model_path=settings.EMBEDDING_MODEL_PATH,
+    device=settings.EMBEDDING_DEVICE,
+)
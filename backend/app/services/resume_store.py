@@ -0,0 +1,194 @@
+# app/services/resume_store.py
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from app.config import settings
+from .model_registry import model_registry
+from .text_extraction import text_extractor
+
+try:  # cross-process append lock; POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeRecord(NamedTuple):
+    sha256: str
+    raw_text: str
+    clean_text: str
+    embedding: np.ndarray
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResumeStore:
+    """Content-addressed store of parsed resumes, keyed by the SHA-256 of the uploaded file.
+
+    Layout of ``<root>/<model>/``:
+
+    - ``vectors.f32``  float32 embedding matrix, one row per resume, read through ``np.memmap``
+    - ``text.bin``     UTF-8 raw and preprocessed text blobs, appended back to back
+    - ``index.jsonl``  one line per resume: sha256, matrix row and (offset, length) of both blobs
+
+    Everything is append-only, so a resume is parsed and encoded once per model and
+    every later scoring run only reads a row and two slices.
+    """
+
+    def __init__(self, root: str, model_source: str):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_source).strip("_") or "model"
+        self.directory = os.path.join(root, slug)
+        os.makedirs(self.directory, exist_ok=True)
+        self._vectors_path = os.path.join(self.directory, "vectors.f32")
+        self._text_path = os.path.join(self.directory, "text.bin")
+        self._index_path = os.path.join(self.directory, "index.jsonl")
+        self._lock_path = os.path.join(self.directory, "store.lock")
+        self._lock = threading.RLock()
+        self._index = {}
+        self._index_offset = 0
+        self._dim = None
+        self._matrix = None
+        self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, sha256: str) -> bool:
+        return self.get(sha256) is not None
+
+    def get(self, sha256: str) -> Optional[ResumeRecord]:
+        with self._lock:
+            entry = self._index.get(sha256)
+            if entry is None:
+                # Another process may have appended it since we last looked
+                self._refresh()
+                entry = self._index.get(sha256)
+            if entry is None:
+                return None
+            return ResumeRecord(
+                sha256=sha256,
+                raw_text=self._read_text(*entry["raw"]),
+                clean_text=self._read_text(*entry["clean"]),
+                embedding=np.array(self._vectors()[entry["row"]]),
+            )
+
+    def get_embedding(self, sha256: str) -> Optional[np.ndarray]:
+        with self._lock:
+            entry = self._index.get(sha256)
+            if entry is None:
+                self._refresh()
+                entry = self._index.get(sha256)
+            return None if entry is None else np.array(self._vectors()[entry["row"]])
+
+    def put(self, sha256: str, raw_text: str, clean_text: str, embedding: np.ndarray) -> ResumeRecord:
+        """Append a parsed resume; a no-op if the hash is already stored."""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        with self._lock, self._file_lock():
+            self._refresh()
+            if sha256 in self._index:
+                return self.get(sha256)
+            if self._dim is not None and vector.shape[0] != self._dim:
+                raise ValueError(f"Embedding has {vector.shape[0]} dims, store expects {self._dim}")
+
+            raw_bytes = raw_text.encode("utf-8")
+            clean_bytes = clean_text.encode("utf-8")
+            with open(self._text_path, "ab") as fh:
+                raw_offset = fh.seek(0, os.SEEK_END)
+                fh.write(raw_bytes)
+                fh.write(clean_bytes)
+            with open(self._vectors_path, "ab") as fh:
+                row = fh.seek(0, os.SEEK_END) // (4 * vector.shape[0])
+                fh.write(vector.tobytes())
+
+            entry = {
+                "sha256": sha256,
+                "row": int(row),
+                "dim": int(vector.shape[0]),
+                "raw": [raw_offset, len(raw_bytes)],
+                "clean": [raw_offset + len(raw_bytes), len(clean_bytes)],
+            }
+            with open(self._index_path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry) + "\n")
+
+            self._refresh()
+            return ResumeRecord(sha256, raw_text, clean_text, vector)
+
+    def get_or_build(self, path: str, sha256: str = None) -> ResumeRecord:
+        """Return the stored record for a resume file, parsing and encoding it only once."""
+        # Imported here: aishortlist depends on this module for its scoring path
+        from .aishortlist import encode_texts, preprocess_text
+
+        sha256 = sha256 or file_sha256(path)
+        record = self.get(sha256)
+        if record is not None:
+            return record
+
+        raw_text = text_extractor.extract_text(path)
+        clean_text = preprocess_text(raw_text)
+        embedding = encode_texts([clean_text])[0]
+        return self.put(sha256, raw_text, clean_text, embedding)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"resumes": len(self._index), "dim": self._dim, "directory": self.directory}
+
+    # ------------------------------------------------------------------
+
+    def _refresh(self):
+        """Read index lines appended since the last refresh (by this or another process)."""
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "r", encoding="utf-8") as fh:
+            fh.seek(self._index_offset)
+            added = False
+            for line in iter(fh.readline, ""):
+                if not line.endswith("\n"):
+                    break  # partially written line; pick it up next time
+                entry = json.loads(line)
+                self._index[entry["sha256"]] = entry
+                self._dim = entry["dim"]
+                self._index_offset = fh.tell()
+                added = True
+        if added:
+            self._matrix = None
+
+    def _vectors(self) -> np.ndarray:
+        if self._matrix is None:
+            rows = max(entry["row"] for entry in self._index.values()) + 1
+            self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(rows, self._dim))
+        return self._matrix
+
+    def _read_text(self, offset: int, length: int) -> str:
+        with open(self._text_path, "rb") as fh:
+            fh.seek(offset)
+            return fh.read(length).decode("utf-8")
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+resume_store = ResumeStore(settings.RESUME_STORE_DIR, model_registry.source)
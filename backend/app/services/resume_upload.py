@@ -0,0 +1,128 @@
+# app/services/resume_upload.py
+import hashlib
+import logging
+import os
+import tempfile
+import zipfile
+from typing import NamedTuple
+
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from .text_extraction import ExtractionError, sniff_format
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR = settings.RESUME_UPLOAD_DIR
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+
+class StoredResume(NamedTuple):
+    path: str
+    sha256: str
+    size: int
+    file_format: str
+    original_filename: str
+    deduplicated: bool
+
+
+class _ResumeWriter:
+    """Writes an upload to a temp file chunk by chunk while hashing and size-checking it.
+
+    ``finish`` sniffs the format from the first bytes and moves the file to its
+    content-addressed path ``<UPLOAD_DIR>/<sha[:2]>/<sha>.<ext>``. If that path already
+    exists the temp file is dropped and the existing file is referenced instead.
+    """
+
+    def __init__(self, filename: str, max_bytes: int):
+        self.filename = filename or ""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._head = b""
+        tmp_dir = os.path.join(UPLOAD_DIR, ".incoming")
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        self._fh = os.fdopen(fd, "wb")
+
+    def update(self, chunk: bytes):
+        """Account for a chunk (hash, size, magic bytes); cheap enough for the event loop."""
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise HTTPException(status_code=413, detail=f"Resume exceeds the {self.max_bytes // (1024 * 1024)} MB limit")
+        if len(self._head) < 512:
+            self._head += chunk[:512 - len(self._head)]
+        self._digest.update(chunk)
+
+    def write(self, chunk: bytes):
+        self._fh.write(chunk)
+
+    def finish(self) -> StoredResume:
+        self._fh.close()
+        if not self.size:
+            self.abort()
+            raise HTTPException(status_code=400, detail="Resume file is empty")
+        try:
+            file_format = sniff_format(self._head, self.filename)
+            if file_format == "docx":
+                with zipfile.ZipFile(self._tmp_path) as archive:
+                    if "word/document.xml" not in archive.namelist():
+                        raise ExtractionError("ZIP upload is not a Word document")
+        except (ExtractionError, zipfile.BadZipFile) as e:
+            self.abort()
+            raise HTTPException(status_code=400, detail=f"Invalid resume file: {str(e)}")
+
+        sha256 = self._digest.hexdigest()
+        directory = os.path.join(UPLOAD_DIR, sha256[:2])
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{sha256}.{file_format}")
+
+        deduplicated = os.path.exists(path)
+        if deduplicated:
+            os.remove(self._tmp_path)
+        else:
+            os.replace(self._tmp_path, path)
+        return StoredResume(path, sha256, self.size, file_format, self.filename, deduplicated)
+
+    def abort(self):
+        try:
+            self._fh.close()
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+async def save_resume(file: UploadFile) -> StoredResume:
+    """Stream an uploaded resume to disk in fixed-size chunks without blocking the event loop."""
+    writer = await run_in_threadpool(_ResumeWriter, file.filename, settings.RESUME_MAX_FILE_MB * 1024 * 1024)
+    try:
+        while True:
+            chunk = await file.read(settings.RESUME_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            writer.update(chunk)
+            await run_in_threadpool(writer.write, chunk)
+        stored = await run_in_threadpool(writer.finish)
+    except Exception:
+        await run_in_threadpool(writer.abort)
+        raise
+
+    logger.info(
+        f"Resume stored at {stored.path} ({stored.size} bytes, "
+        f"{'existing file reused' if stored.deduplicated else 'new file'})"
+    )
+    return stored
+
+
+def save_resume_fileobj(fileobj, filename: str) -> StoredResume:
+    """Synchronous variant for scripts and bulk imports that already run off the event loop."""
+    writer = _ResumeWriter(filename, settings.RESUME_MAX_FILE_MB * 1024 * 1024)
+    try:
+        for chunk in iter(lambda: fileobj.read(settings.RESUME_UPLOAD_CHUNK_BYTES), b""):
+            writer.update(chunk)
+            writer.write(chunk)
+        return writer.finish()
+    except Exception:
+        writer.abort()
+        raise
@@ -0,0 +1,229 @@
+# app/services/score_export.py
+"""Columnar snapshots of application scores for offline ranking analysis.
+
+Rows are read from a server-side cursor in chunks of ``SCORE_EXPORT_ROW_GROUP_ROWS``
+and each chunk becomes one Parquet row group or one Arrow IPC record batch, so
+memory stays flat however many applications are exported. Used by
+``GET /api/v1/applicants/scores/export`` and from the command line::
+
+    python -m app.services.score_export --format parquet --output scores.parquet --job-id 12
+
+pyarrow is only needed here; it is imported when an export starts.
+"""
+import argparse
+import asyncio
+import io
+import logging
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, Float, Integer, String, bindparam, literal_column, select, text
+
+from app.config import settings
+from app.db.connection import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+SCORE_EXPORT_FORMATS = {
+    # format -> (file extension, media type)
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+    "arrow": ("arrows", "application/vnd.apache.arrow.stream"),
+}
+
+# (column expression, name, SQLAlchemy type, Arrow type name); DECIMAL scores are
+# cast to FLOAT in SQL so they arrive as floats rather than Decimal objects
+SCORE_EXPORT_COLUMNS = (
+    ("app.application_id", "application_id", Integer, "int64"),
+    ("app.job_id", "job_id", Integer, "int64"),
+    ("app.applicant_id", "applicant_id", Integer, "int64"),
+    ("app.source", "source", String, "string"),
+    ("COALESCE(app.application_status, 'applied')", "application_status", String, "string"),
+    ("app.applied_date", "applied_date", DateTime, "timestamp"),
+    ("app.updated_at", "updated_at", DateTime, "timestamp"),
+    ("CAST(app.jd_matching_score AS FLOAT)", "semantic_similarity", Float, "float64"),
+    ("CAST(app.skills_matching_score AS FLOAT)", "keyword_match_score", Float, "float64"),
+    ("CAST(app.high_skill_match AS FLOAT)", "high_skill_match", Float, "float64"),
+    ("CAST(app.normal_skill_match AS FLOAT)", "normal_skill_match", Float, "float64"),
+    ("CAST(app.resume_overall_score AS FLOAT)", "resume_overall_score", Float, "float64"),
+    ("COALESCE(perf.interview_ratings, 0)", "interview_ratings", Integer, "int64"),
+    ("perf.avg_final_rating", "avg_final_rating", Float, "float64"),
+    ("perf.avg_technical_score", "avg_technical_score", Float, "float64"),
+    ("perf.avg_communication_score", "avg_communication_score", Float, "float64"),
+    ("perf.avg_problem_solving_score", "avg_problem_solving_score", Float, "float64"),
+    ("perf.avg_domain_knowledge_score", "avg_domain_knowledge_score", Float, "float64"),
+    ("perf.avg_team_fit_score", "avg_team_fit_score", Float, "float64"),
+    ("perf.avg_attitude_score", "avg_attitude_score", Float, "float64"),
+    ("COALESCE(perf.positive_recommendations, 0)", "positive_recommendations", Integer, "int64"),
+)
+
+# Interview ratings aggregated per application in one pass, then joined by key
+PERFORMANCE_BY_APPLICATION = """
+    LEFT JOIN (
+        SELECT s.application_id,
+               COUNT(*) AS interview_ratings,
+               AVG(CAST(p.final_rating AS FLOAT)) AS avg_final_rating,
+               AVG(CAST(p.technical_score AS FLOAT)) AS avg_technical_score,
+               AVG(CAST(p.communication_score AS FLOAT)) AS avg_communication_score,
+               AVG(CAST(p.problem_solving_score AS FLOAT)) AS avg_problem_solving_score,
+               AVG(CAST(p.domain_knowledge_score AS FLOAT)) AS avg_domain_knowledge_score,
+               AVG(CAST(p.team_fit_score AS FLOAT)) AS avg_team_fit_score,
+               AVG(CAST(p.attitude_score AS FLOAT)) AS avg_attitude_score,
+               SUM(CASE WHEN p.recommendation IN ('strong_yes', 'yes') THEN 1 ELSE 0 END) AS positive_recommendations
+        FROM interview_performance p
+        JOIN interview_rounds_attended r ON r.round_attended_id = p.round_attended_id
+        JOIN interview_schedule s ON s.schedule_id = r.schedule_id
+        GROUP BY s.application_id
+    ) perf ON perf.application_id = app.application_id
+"""
+
+
+def require_pyarrow():
+    """Import pyarrow, or fail with 503 before any response bytes are sent."""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail="Score export needs pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def score_export_query(job_id: Optional[int] = None, statuses: Optional[List[str]] = None,
+                       updated_since: Optional[datetime] = None):
+    query = (
+        select(*(literal_column(expression, type_).label(name) for expression, name, type_, _ in SCORE_EXPORT_COLUMNS))
+        .select_from(text(f"applications app {PERFORMANCE_BY_APPLICATION}"))
+        .order_by(text("app.application_id"))
+    )
+    if job_id is not None:
+        query = query.where(text("app.job_id = :job_id").bindparams(job_id=job_id))
+    if statuses:
+        query = query.where(
+            text("COALESCE(app.application_status, 'applied') IN :statuses").bindparams(
+                bindparam("statuses", value=list(statuses), expanding=True)
+            )
+        )
+    if updated_since is not None:
+        query = query.where(text("app.updated_at >= :updated_since").bindparams(updated_since=updated_since))
+    return query
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that keeps what was written until ``drain`` hands it out."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+class ScoreSnapshotWriter:
+    """Turns row chunks into Parquet row groups or Arrow IPC record batches on ``sink``."""
+
+    def __init__(self, sink, export_format: str):
+        pa = require_pyarrow()
+        self._pa = pa
+        types = {"int64": pa.int64(), "float64": pa.float64(), "string": pa.string(), "timestamp": pa.timestamp("ms")}
+        self.schema = pa.schema([(name, types[arrow_type]) for _, name, _, arrow_type in SCORE_EXPORT_COLUMNS])
+        if export_format == "parquet":
+            self._writer = pa.parquet.ParquetWriter(sink, self.schema, compression="zstd")
+        elif export_format == "arrow":
+            self._writer = pa.ipc.new_stream(sink, self.schema)
+        else:
+            raise ValueError(f"Unknown export format: {export_format}")
+        self.rows = 0
+
+    def write_rows(self, rows: list):
+        if not rows:
+            return
+        columns = list(zip(*rows))
+        batch = self._pa.record_batch(
+            [self._pa.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+            schema=self.schema,
+        )
+        self._writer.write_batch(batch)
+        self.rows += len(rows)
+
+    def close(self):
+        self._writer.close()
+
+
+async def stream_score_snapshot(export_format: str, job_id: Optional[int] = None,
+                                statuses: Optional[List[str]] = None,
+                                updated_since: Optional[datetime] = None) -> AsyncIterator[bytes]:
+    """
+    Yield the export file as it is produced, one row group at a time.
+
+    Opens its own session, like ``stream_applicants``: the response keeps iterating
+    after the request's dependencies have been cleaned up. Arrow conversion and
+    compression run on a worker thread so the event loop keeps serving requests.
+    """
+    sink = _ChunkSink()
+    writer = ScoreSnapshotWriter(sink, export_format)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            score_export_query(job_id, statuses, updated_since),
+            execution_options={"yield_per": settings.SCORE_EXPORT_ROW_GROUP_ROWS},
+        )
+        async for batch in result.partitions():
+            await asyncio.to_thread(writer.write_rows, batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    await asyncio.to_thread(writer.close)
+    yield sink.drain()
+    logger.info(f"Score snapshot exported: {writer.rows} rows as {export_format}")
+
+
+def export_score_snapshot(path: str, export_format: str, job_id: Optional[int] = None,
+                          statuses: Optional[List[str]] = None,
+                          updated_since: Optional[datetime] = None) -> int:
+    """Write a snapshot file through the sync engine's server-side cursor; returns the row count."""
+    from app.db.connection import SessionLocal
+
+    with open(path, "wb") as sink, SessionLocal() as db:
+        writer = ScoreSnapshotWriter(sink, export_format)
+        result = db.execute(
+            score_export_query(job_id, statuses, updated_since),
+            execution_options={"yield_per": settings.SCORE_EXPORT_ROW_GROUP_ROWS},
+        )
+        for batch in result.partitions():
+            writer.write_rows(batch)
+        writer.close()
+    return writer.rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export application scores and interview ratings as Parquet or Arrow IPC.")
+    parser.add_argument("--output", required=True, help="file to write")
+    parser.add_argument("--format", choices=list(SCORE_EXPORT_FORMATS), default="parquet")
+    parser.add_argument("--job-id", type=int)
+    parser.add_argument("--status", nargs="+", help="only these application statuses")
+    parser.add_argument("--updated-since", type=datetime.fromisoformat, help="ISO timestamp")
+    args = parser.parse_args()
+
+    from app.core.logging import setup_logging, shutdown_logging
+
+    setup_logging()
+    try:
+        rows = export_score_snapshot(args.output, args.format, args.job_id, args.status, args.updated_since)
+        logger.info(f"Wrote {rows} rows to {args.output}")
+    finally:
+        shutdown_logging()
@@ -0,0 +1,162 @@
+# app/services/score_reranking.py
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from .scoring_weights import ScoringWeights, job_weights
+
+logger = logging.getLogger(__name__)
+
+
+class JobComponents(NamedTuple):
+    """Raw component scores of every scored application of one job, as aligned arrays."""
+    application_ids: np.ndarray
+    semantic: np.ndarray
+    high: np.ndarray      # NaN where the split was not stored (scored before it was persisted)
+    normal: np.ndarray
+    keyword: np.ndarray   # stored weighted keyword score, the fallback for those rows
+    weights: ScoringWeights
+    loaded_at: float
+
+
+def overall_scores(components: JobComponents, weights: ScoringWeights) -> np.ndarray:
+    """Overall score of every application under ``weights``; one vector expression, no resume work."""
+    missing = np.isnan(components.high) | np.isnan(components.normal)
+    keyword = np.where(missing, components.keyword, weights.keyword_score(components.high, components.normal))
+    return weights.overall_score(components.semantic, np.nan_to_num(keyword))
+
+
+class ComponentScoreCache:
+    """Per-job LRU of component score arrays, so a what-if re-rank is pure NumPy.
+
+    Entries are dropped when a job's applications are (re)scored or its weights change
+    and expire after ``ttl_seconds``, which bounds staleness across API workers. A load
+    that overlaps an invalidation of the same job is returned but not stored.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, job_id: int) -> Optional[JobComponents]:
+        with self._lock:
+            entry = self._entries.get(int(job_id))
+            if entry is None:
+                return None
+            if time.monotonic() - entry.loaded_at > self.ttl_seconds:
+                del self._entries[int(job_id)]
+                return None
+            self._entries.move_to_end(int(job_id))
+            return entry
+
+    def invalidate(self, job_id: int):
+        with self._lock:
+            self._entries.pop(int(job_id), None)
+            self._generations[int(job_id)] = self._generations.get(int(job_id), 0) + 1
+
+    async def get_or_load(self, db: AsyncSession, job_id: int) -> JobComponents:
+        cached = self.get(job_id)
+        if cached is not None:
+            return cached
+        with self._lock:
+            generation = self._generations.get(int(job_id), 0)
+
+        job = (await db.execute(
+            text("SELECT semantic_weight, high_skill_weight FROM jobs WHERE job_id = :job_id"), {"job_id": job_id}
+        )).fetchone()
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        rows = (await db.execute(text("""
+            SELECT application_id, jd_matching_score, high_skill_match, normal_skill_match, skills_matching_score
+            FROM applications
+            WHERE job_id = :job_id AND jd_matching_score IS NOT NULL
+            ORDER BY application_id
+        """), {"job_id": job_id})).fetchall()
+
+        # NULLs become NaN with a float dtype
+        values = np.array([row[1:] for row in rows], dtype=np.float64).reshape(len(rows), 4)
+        components = JobComponents(
+            application_ids=np.array([row[0] for row in rows], dtype=np.int64),
+            semantic=values[:, 0],
+            high=values[:, 1],
+            normal=values[:, 2],
+            keyword=values[:, 3],
+            weights=job_weights(job[0], job[1]),
+            loaded_at=time.monotonic(),
+        )
+        with self._lock:
+            if self._generations.get(int(job_id), 0) == generation:
+                self._entries[int(job_id)] = components
+                self._entries.move_to_end(int(job_id))
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return components
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "jobs": len(self._entries),
+                "applications": int(sum(len(entry.application_ids) for entry in self._entries.values())),
+            }
+
+
+component_score_cache = ComponentScoreCache(
+    max_entries=settings.SCORE_COMPONENT_CACHE_SIZE,
+    ttl_seconds=settings.SCORE_COMPONENT_CACHE_TTL_SECONDS,
+)
+
+
+async def what_if_ranking(db: AsyncSession, job_id: int, weights: ScoringWeights, limit: int = 50) -> dict:
+    """Re-rank every scored applicant of a job under ``weights`` and compare with the job's current weights."""
+    components = await component_score_cache.get_or_load(db, job_id)
+    started = time.perf_counter()
+
+    proposed = overall_scores(components, weights)
+    current = overall_scores(components, components.weights)
+    order = np.argsort(-proposed, kind="stable")
+    current_order = np.argsort(-current, kind="stable")
+    current_rank = np.empty(len(current), dtype=np.int64)
+    current_rank[current_order] = np.arange(1, len(current) + 1)
+
+    top = order[:limit]
+    overlap = len(np.intersect1d(top, current_order[:limit], assume_unique=True))
+    ranking = [
+        {
+            "application_id": application_id,
+            "rank": rank,
+            "score": round(score, 4),
+            "current_rank": previous_rank,
+            "current_score": round(previous_score, 4),
+            "rank_change": previous_rank - rank,
+        }
+        for rank, application_id, score, previous_rank, previous_score in zip(
+            range(1, len(top) + 1),
+            components.application_ids[top].tolist(),
+            proposed[top].tolist(),
+            current_rank[top].tolist(),
+            current[top].tolist(),
+        )
+    ]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "job_id": job_id,
+        "weights": weights.as_dict(),
+        "current_weights": components.weights.as_dict(),
+        "applicants": len(components.application_ids),
+        "without_skill_split": int((np.isnan(components.high) | np.isnan(components.normal)).sum()),
+        "top_overlap": overlap,
+        "rerank_ms": round(elapsed_ms, 3),
+        "ranking": ranking,
+    }
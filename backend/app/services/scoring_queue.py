@@ -0,0 +1,258 @@
+# app/services/scoring_queue.py
+import logging
+import queue
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.config import settings
+from app.db.connection import SessionLocal
+from .aishortlist import evaluate_resume_match
+from .resume_store import resume_store
+from .score_reranking import component_score_cache
+from .scoring_weights import job_weights
+from .vector_index import vector_index
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------
+# Task rows live in the `scoring_tasks` table (see documentation/sqlcodecreatescript.txt)
+# so a task survives a restart and can be polled from any API worker.
+# ----------------------------------------------------------------------
+
+async def get_scoring_task(db: AsyncSession, task_id: int) -> dict:
+    """Fetch a scoring task together with the scores written for its application."""
+    query = text("""
+        SELECT
+            t.task_id,
+            t.application_id,
+            t.status,
+            t.attempts,
+            t.last_error,
+            t.created_at,
+            t.updated_at,
+            app.skills_matching_score,
+            app.jd_matching_score,
+            app.resume_overall_score
+        FROM scoring_tasks t
+        JOIN applications app ON app.application_id = t.application_id
+        WHERE t.task_id = :task_id
+    """)
+    result = (await db.execute(query, {"task_id": task_id})).mappings().fetchone()
+    if not result:
+        raise HTTPException(status_code=404, detail="Scoring task not found")
+    return dict(result)
+
+
+class ScoringQueue:
+    """In-process queue of scoring task ids drained by a pool of worker threads.
+
+    Each worker claims a task with a conditional UPDATE, scores the resume outside of
+    any request transaction, writes the scores back onto the application row and
+    retries failures with exponential backoff up to ``max_attempts``.
+    """
+
+    def __init__(self, workers: int, max_attempts: int, retry_backoff: float, stale_after_minutes: int):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.stale_after = timedelta(minutes=stale_after_minutes)
+        self._queue = queue.Queue()
+        self._threads = []
+        self._timers = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker threads and re-queue tasks left over by a previous process."""
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"scoring-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._recover_pending()
+        logger.info(f"Scoring queue started with {self.workers} workers")
+
+    def stop(self, timeout: float = 5.0):
+        """Ask every worker to exit once its current task is done."""
+        with self._lock:
+            for timer in self._timers:
+                timer.cancel()
+            self._timers.clear()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def enqueue(self, task_id: int):
+        self._queue.put(int(task_id))
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _enqueue_later(self, task_id: int, delay: float):
+        def fire():
+            with self._lock:
+                self._timers.discard(timer)
+            self.enqueue(task_id)
+
+        timer = threading.Timer(delay, fire)
+        timer.daemon = True
+        with self._lock:
+            self._timers.add(timer)
+        timer.start()
+
+    def _recover_pending(self):
+        db = SessionLocal()
+        try:
+            # Tasks stuck in 'running' belong to a worker that died mid-task.
+            db.execute(text("""
+                UPDATE scoring_tasks SET status = 'queued', updated_at = :now
+                WHERE status = 'running' AND updated_at < :stale_before
+            """), {"now": datetime.now(), "stale_before": datetime.now() - self.stale_after})
+            db.commit()
+            rows = db.execute(text(
+                "SELECT task_id FROM scoring_tasks WHERE status = 'queued' ORDER BY task_id"
+            )).fetchall()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Could not recover pending scoring tasks: {e}")
+            return
+        finally:
+            db.close()
+
+        for row in rows:
+            self.enqueue(row[0])
+        if rows:
+            logger.info(f"Re-queued {len(rows)} pending scoring tasks")
+
+    def _run(self):
+        while True:
+            task_id = self._queue.get()
+            try:
+                if task_id is None:
+                    return
+                self._process(task_id)
+            except Exception as e:  # never let one task kill the worker
+                logger.error(f"Unexpected error in scoring worker for task {task_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _process(self, task_id: int):
+        db = SessionLocal()
+        try:
+            # Claim the task and read everything scoring needs in one round trip; another
+            # worker (or process) may already own it, in which case no row comes back.
+            row = db.execute(text("""
+                UPDATE t
+                SET status = 'running', attempts = t.attempts + 1, updated_at = :now
+                OUTPUT
+                    INSERTED.application_id,
+                    app.job_id,
+                    app.applicant_id,
+                    a.resume_url,
+                    j.jd,
+                    j.key_skills,
+                    j.additional_skills,
+                    j.semantic_weight,
+                    j.high_skill_weight
+                FROM scoring_tasks t
+                LEFT JOIN applications app ON app.application_id = t.application_id
+                LEFT JOIN applicants a ON a.applicant_id = app.applicant_id
+                LEFT JOIN jobs j ON j.job_id = app.job_id
+                WHERE t.task_id = :task_id AND t.status = 'queued'
+            """), {"task_id": task_id, "now": datetime.now()}).mappings().fetchone()
+            db.commit()
+            if not row:
+                return
+            if row["applicant_id"] is None or row["job_id"] is None:
+                raise ValueError("Application, applicant or job for this task no longer exists")
+
+            result = evaluate_resume_match(
+                resume_pdf_path=row["resume_url"],
+                jd_text=row["jd"] or "",
+                high_priority_keywords=row["key_skills"],
+                normal_keywords=row["additional_skills"],
+                job_id=row["job_id"],
+                weights=job_weights(row["semantic_weight"], row["high_skill_weight"]),
+            )
+
+            # Scores and task completion go out as one batch
+            now = datetime.now()
+            db.execute(text("""
+                UPDATE applications
+                SET skills_matching_score = :skills_matching_score,
+                    jd_matching_score = :jd_matching_score,
+                    high_skill_match = :high_skill_match,
+                    normal_skill_match = :normal_skill_match,
+                    resume_overall_score = :resume_overall_score,
+                    updated_at = :now
+                WHERE application_id = :application_id;
+                UPDATE scoring_tasks SET status = 'completed', last_error = NULL, updated_at = :now
+                WHERE task_id = :task_id;
+            """), {
+                "skills_matching_score": result["keyword_match_score"],
+                "jd_matching_score": result["semantic_similarity"],
+                "high_skill_match": result["high_skill_match"],
+                "normal_skill_match": result["normal_skill_match"],
+                "resume_overall_score": result["resume_overall_score"],
+                "now": now,
+                "application_id": row["application_id"],
+                "task_id": task_id,
+            })
+            db.commit()
+            component_score_cache.invalidate(row["job_id"])
+
+            # Keep the candidate search index current without a rebuild
+            embedding = resume_store.get_embedding(result["resume_sha256"])
+            if embedding is not None:
+                vector_index.add(int(row["applicant_id"]), embedding, row["resume_url"])
+            logger.info(f"Scoring task {task_id} completed for application {row['application_id']}")
+
+        except Exception as e:
+            db.rollback()
+            self._record_failure(db, task_id, e)
+        finally:
+            db.close()
+
+    def _record_failure(self, db: Session, task_id: int, error: Exception):
+        try:
+            attempts = db.execute(
+                text("SELECT attempts FROM scoring_tasks WHERE task_id = :task_id"), {"task_id": task_id}
+            ).scalar() or 0
+            retry = attempts < self.max_attempts
+            db.execute(text("""
+                UPDATE scoring_tasks SET status = :status, last_error = :last_error, updated_at = :now
+                WHERE task_id = :task_id
+            """), {
+                "status": "queued" if retry else "failed",
+                "last_error": str(error),
+                "now": datetime.now(),
+                "task_id": task_id,
+            })
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Could not record failure of scoring task {task_id}: {e}")
+            return
+
+        if retry:
+            delay = self.retry_backoff * (2 ** (attempts - 1))
+            logger.warning(f"Scoring task {task_id} failed (attempt {attempts}), retrying in {delay:.1f}s: {error}")
+            self._enqueue_later(task_id, delay)
+        else:
+            logger.error(f"Scoring task {task_id} failed permanently after {attempts} attempts: {error}")
+
+
+scoring_queue = ScoringQueue(
+    workers=settings.SCORING_WORKERS,
+    max_attempts=settings.SCORING_MAX_ATTEMPTS,
+    retry_backoff=settings.SCORING_RETRY_BACKOFF_SECONDS,
+    stale_after_minutes=settings.SCORING_STALE_TASK_MINUTES,
+)
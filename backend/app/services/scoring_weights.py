@@ -0,0 +1,33 @@
+# app/services/scoring_weights.py
+from typing import NamedTuple, Optional
+
+from app.config import settings
+
+
+class ScoringWeights(NamedTuple):
+    """How a resume's component scores combine into its overall score.
+
+    keyword = high_skill * high_skill_match + (1 - high_skill) * normal_skill_match
+    overall = semantic * semantic_similarity + (1 - semantic) * keyword
+
+    Both methods work element-wise on NumPy arrays as well as on floats.
+    """
+    semantic: float
+    high_skill: float
+
+    def keyword_score(self, high_skill_match, normal_skill_match):
+        return self.high_skill * high_skill_match + (1 - self.high_skill) * normal_skill_match
+
+    def overall_score(self, semantic_similarity, keyword_score):
+        return self.semantic * semantic_similarity + (1 - self.semantic) * keyword_score
+
+    def as_dict(self) -> dict:
+        return {"semantic_weight": self.semantic, "high_skill_weight": self.high_skill}
+
+
+def job_weights(semantic_weight: Optional[float] = None, high_skill_weight: Optional[float] = None) -> ScoringWeights:
+    """A job's stored weights; NULL columns fall back to the configured defaults."""
+    return ScoringWeights(
+        semantic=float(semantic_weight) if semantic_weight is not None else settings.SCORING_SEMANTIC_WEIGHT,
+        high_skill=float(high_skill_weight) if high_skill_weight is not None else settings.SCORING_HIGH_SKILL_WEIGHT,
+    )
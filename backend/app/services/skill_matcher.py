@@ -0,0 +1,178 @@
+# app/services/skill_matcher.py
+import hashlib
+import re
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from app.config import settings
+
+# Separators used in the free-text key_skills / additional_skills columns
+SKILL_SEPARATORS = re.compile(r"[,;|\n\r\t•]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and reduce to alphanumeric words (keeping '+' and '#', e.g. c++, c#)."""
+    text = (text or "").lower()
+    text = re.sub(r"[^a-z0-9+#]+", " ", text)
+    return " ".join(text.split())
+
+
+def parse_skills(skills) -> list:
+    """Split a skills string (or an iterable of them) into unique normalized phrases."""
+    if not skills:
+        return []
+    if isinstance(skills, str):
+        skills = [skills]
+    phrases = []
+    seen = set()
+    for raw in skills:
+        for part in SKILL_SEPARATORS.split(raw or ""):
+            phrase = normalize_text(part)
+            if phrase and phrase not in seen:
+                seen.add(phrase)
+                phrases.append(phrase)
+    return phrases
+
+
+class _TokenAutomaton:
+    """Aho-Corasick automaton over word tokens.
+
+    Working on tokens rather than characters gives whole-word matching for free
+    ("java" never matches inside "javascript") and finds every multi-word phrase
+    in a single left-to-right pass over the resume.
+    """
+
+    def __init__(self, phrases: list):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        for phrase_id, phrase in enumerate(phrases):
+            node = 0
+            for token in phrase.split():
+                child = self.goto[node].get(token)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                    self.goto[node][token] = child
+                node = child
+            self.out[node] = self.out[node] + (phrase_id,)
+
+        # Breadth-first pass to wire failure links and merge outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(token, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+    def find(self, tokens) -> set:
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        found = set()
+        for token in tokens:
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class SkillMatcher:
+    """Compiled matcher for one job's high-priority (key) and normal (additional) skills."""
+
+    def __init__(self, high_priority_skills, normal_skills, high_weight: float = None):
+        self.high_skills = parse_skills(high_priority_skills)
+        high = set(self.high_skills)
+        self.normal_skills = [s for s in parse_skills(normal_skills) if s not in high]
+        # Only used for ``keyword_score``; job scoring combines the match fractions with its own weights
+        self.high_weight = settings.SCORING_HIGH_SKILL_WEIGHT if high_weight is None else high_weight
+        self.normal_weight = 1 - self.high_weight
+        phrases = self.high_skills + self.normal_skills
+        self._automaton = _TokenAutomaton(phrases)
+        self._is_high = np.array([True] * len(self.high_skills) + [False] * len(self.normal_skills), dtype=bool)
+
+    def match_matrix(self, texts) -> np.ndarray:
+        """Boolean (n_texts, n_skills) matrix of which skills occur in which text."""
+        matrix = np.zeros((len(texts), self._is_high.shape[0]), dtype=bool)
+        for row, text in enumerate(texts):
+            found = self._automaton.find(normalize_text(text).split())
+            if found:
+                matrix[row, list(found)] = True
+        return matrix
+
+    def score_many(self, texts) -> dict:
+        """Score N resumes in one call; returns arrays of match fractions and keyword scores."""
+        matrix = self.match_matrix(texts)
+        n_high = int(self._is_high.sum())
+        n_normal = self._is_high.shape[0] - n_high
+        high = matrix[:, self._is_high].sum(axis=1) / n_high if n_high else np.zeros(len(texts))
+        normal = matrix[:, ~self._is_high].sum(axis=1) / n_normal if n_normal else np.zeros(len(texts))
+        keyword = np.round(self.high_weight * high + self.normal_weight * normal, 4)
+        return {"high_match": high, "normal_match": normal, "keyword_score": keyword}
+
+    def score(self, text: str) -> dict:
+        scores = self.score_many([text])
+        return {name: float(values[0]) for name, values in scores.items()}
+
+    def matched_skills(self, text: str) -> list:
+        phrases = self.high_skills + self.normal_skills
+        return [phrases[i] for i in sorted(self._automaton.find(normalize_text(text).split()))]
+
+
+class SkillMatcherCache:
+    """Per-job LRU of compiled matchers; a changed skills list is detected by fingerprint."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id, high_priority_skills, normal_skills) -> SkillMatcher:
+        if job_id is None:
+            return SkillMatcher(high_priority_skills, normal_skills)
+
+        key = int(job_id)
+        fingerprint = _fingerprint(high_priority_skills, normal_skills)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._entries.move_to_end(key)
+                return cached[1]
+
+        return self.compile(job_id, high_priority_skills, normal_skills)
+
+    def compile(self, job_id: int, high_priority_skills, normal_skills) -> SkillMatcher:
+        """Parse and compile a job's skills now (called when a job is created or edited)."""
+        matcher = SkillMatcher(high_priority_skills, normal_skills)
+        with self._lock:
+            self._entries[int(job_id)] = (_fingerprint(high_priority_skills, normal_skills), matcher)
+            self._entries.move_to_end(int(job_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return matcher
+
+    def invalidate(self, job_id: int):
+        with self._lock:
+            self._entries.pop(int(job_id), None)
+
+
+def _fingerprint(high_priority_skills, normal_skills) -> str:
+    def flat(skills):
+        if not skills:
+            return ""
+        return skills if isinstance(skills, str) else "\n".join(sorted(s or "" for s in skills))
+
+    return hashlib.sha256(f"{flat(high_priority_skills)}\0{flat(normal_skills)}".encode("utf-8")).hexdigest()
+
+
+skill_matcher_cache = SkillMatcherCache(max_entries=settings.SKILL_MATCHER_CACHE_SIZE)
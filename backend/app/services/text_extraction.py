@@ -0,0 +1,216 @@
+# app/services/text_extraction.py
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from xml.etree import ElementTree
+
+from app.config import settings
+from app.core.metrics import timed_stage
+
+try:  # per-task CPU limit inside pool workers; POSIX only
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = ("pdf", "docx", "txt")
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class ExtractionError(Exception):
+    """Raised when a resume cannot be turned into text (bad format, too big, too slow)."""
+
+
+# ----------------------------------------------------------------------
+# Format readers. These run inside the pool workers.
+# ----------------------------------------------------------------------
+
+def _read_pdf(path: str, max_pages: int) -> str:
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return "".join(page.extract_text() or "" for page in reader.pages[:max_pages])
+
+
+def _read_docx(path: str, max_chars: int) -> str:
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo("word/document.xml")
+        # Guard against zip bombs: the XML itself is bounded, not just the upload
+        if info.file_size > max_chars * 20:
+            raise ExtractionError("DOCX document body is too large")
+        root = ElementTree.fromstring(archive.read(info))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        paragraphs.append("".join(node.text or "" for node in paragraph.iter(f"{WORD_NAMESPACE}t")))
+    return "\n".join(paragraphs)
+
+
+def _read_txt(path: str, max_chars: int) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        return fh.read(max_chars)
+
+
+def sniff_format(head: bytes, filename: str) -> str:
+    """Work out the resume format from its first bytes; the extension only decides plain text."""
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "txt" and b"\x00" not in head:
+        return "txt"
+    raise ExtractionError(f"Unsupported resume format: {os.path.basename(filename or '')}")
+
+
+def detect_format(path: str) -> str:
+    with open(path, "rb") as fh:
+        head = fh.read(512)
+    return sniff_format(head, path)
+
+
+def _extract_in_worker(path: str, max_pages: int, max_chars: int, cpu_seconds: int) -> str:
+    if resource is not None and cpu_seconds:
+        # The kernel kills this worker (SIGXCPU) if the task burns more CPU than allowed
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = used + cpu_seconds
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+    file_format = detect_format(path)
+    if file_format == "pdf":
+        text = _read_pdf(path, max_pages)
+    elif file_format == "docx":
+        text = _read_docx(path, max_chars)
+    else:
+        text = _read_txt(path, max_chars)
+    return text[:max_chars]
+
+
+# ----------------------------------------------------------------------
+# Pool front-end
+# ----------------------------------------------------------------------
+
+class TextExtractor:
+    """Bounded process pool for resume text extraction.
+
+    Parsing never runs on the event loop or in the caller's thread: each file is
+    size-checked, then parsed in a worker with a page cap, a CPU-seconds limit and a
+    wall-clock timeout. A crashed or killed worker breaks the pool, which is rebuilt
+    on the next call.
+    """
+
+    def __init__(self, workers: int, timeout: float, cpu_seconds: int, max_pages: int,
+                 max_file_bytes: int, max_chars: int):
+        self.workers = workers
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.max_pages = max_pages
+        self.max_file_bytes = max_file_bytes
+        self.max_chars = max_chars
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _reset_pool(self, pool: ProcessPoolExecutor):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _check_size(self, path: str):
+        try:
+            size = os.path.getsize(path)
+        except OSError as e:
+            raise ExtractionError(f"Resume file not readable: {e}") from e
+        if size > self.max_file_bytes:
+            raise ExtractionError(f"Resume is {size} bytes, limit is {self.max_file_bytes}")
+
+    def submit(self, path: str):
+        self._check_size(path)
+        pool = self._get_pool()
+        try:
+            return pool.submit(_extract_in_worker, path, self.max_pages, self.max_chars, self.cpu_seconds)
+        except BrokenProcessPool:
+            self._reset_pool(pool)
+            return self._get_pool().submit(_extract_in_worker, path, self.max_pages, self.max_chars, self.cpu_seconds)
+
+    def extract_text(self, path: str) -> str:
+        """Extract text from a PDF, DOCX or TXT resume, blocking the calling thread only."""
+        with timed_stage("extraction"):
+            pool = self._get_pool()
+            future = self.submit(path)
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeout as e:
+                future.cancel()
+                raise ExtractionError(f"Extraction timed out after {self.timeout}s: {os.path.basename(path)}") from e
+            except BrokenProcessPool as e:
+                self._reset_pool(pool)
+                raise ExtractionError(f"Extraction worker died (CPU limit or crash): {os.path.basename(path)}") from e
+            except ExtractionError:
+                raise
+            except Exception as e:
+                raise ExtractionError(f"Could not extract text from {os.path.basename(path)}: {e}") from e
+
+    async def extract_text_async(self, path: str) -> str:
+        """Awaitable variant for async handlers; the event loop is never blocked."""
+        return await asyncio.to_thread(self.extract_text, path)
+
+    def iter_extract(self, paths):
+        """Yield ``(path, text, error)`` for each file as soon as its extraction finishes."""
+        pool = self._get_pool()
+        futures = {}
+        for path in paths:
+            try:
+                futures[self.submit(path)] = path
+            except ExtractionError as e:
+                yield path, None, str(e)
+        if not futures:
+            return
+        try:
+            for future in as_completed(futures, timeout=self.timeout * max(1, len(futures) / self.workers)):
+                path = futures[future]
+                try:
+                    yield path, future.result(), None
+                except BrokenProcessPool:
+                    self._reset_pool(pool)
+                    yield path, None, "Extraction worker died (CPU limit or crash)"
+                except Exception as e:
+                    yield path, None, str(e)
+        except FutureTimeout:
+            for future, path in futures.items():
+                if not future.done():
+                    future.cancel()
+                    yield path, None, "Extraction timed out"
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+text_extractor = TextExtractor(
+    workers=settings.EXTRACTION_WORKERS,
+    timeout=settings.EXTRACTION_TIMEOUT_SECONDS,
+    cpu_seconds=settings.EXTRACTION_CPU_SECONDS,
+    max_pages=settings.EXTRACTION_MAX_PAGES,
+    max_file_bytes=settings.RESUME_MAX_FILE_MB * 1024 * 1024,
+    max_chars=settings.EXTRACTION_MAX_CHARS,
+)
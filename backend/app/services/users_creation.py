@@ -1,27 +1,41 @@
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from app.db.connection import SessionLocal  # Import SessionLocal from the connection file
-import bcrypt
 
-def create_user(db: Session, user_data: dict):
+from app.core.security import password_hasher
+
+# One round trip for all three uniqueness checks; the UNIQUE/PRIMARY KEY constraints
+# still catch a concurrent signup that slips in between this and the INSERT
+EXISTING_USER_CHECK = """
+    SELECT
+        MAX(CASE WHEN username = :username THEN 1 ELSE 0 END) AS username_taken,
+        MAX(CASE WHEN email = :email THEN 1 ELSE 0 END) AS email_taken,
+        MAX(CASE WHEN emp_id = :emp_id THEN 1 ELSE 0 END) AS emp_id_taken
+    FROM users
+    WHERE username = :username OR email = :email OR emp_id = :emp_id
+"""
+
+
+async def create_user(db: AsyncSession, user_data: dict):
     try:
-        # Check if the username already exists
-        existing_user = db.execute(text("SELECT 1 FROM users WHERE username = :username"), {"username": user_data["username"]}).fetchone()
-        if existing_user:
+        taken = (await db.execute(text(EXISTING_USER_CHECK), {
+            "username": user_data["username"], "email": user_data["email"], "emp_id": user_data["emp_id"],
+        })).mappings().fetchone()
+        if taken["username_taken"]:
             raise HTTPException(status_code=400, detail="Username already exists")
-
-        # Check if the email already exists
-        existing_email = db.execute(text("SELECT 1 FROM users WHERE email = :email"), {"email": user_data["email"]}).fetchone()
-        if existing_email:
+        if taken["email_taken"]:
             raise HTTPException(status_code=400, detail="Email already exists")
-
-        # Check if emp_id already exists
-        existing_emp_id = db.execute(text("SELECT 1 FROM users WHERE emp_id = :emp_id"), {"emp_id": user_data["emp_id"]}).fetchone()
-        if existing_emp_id:
+        if taken["emp_id_taken"]:
             raise HTTPException(status_code=400, detail="Employee ID already exists")
+        # Don't hold a pooled connection (and an open transaction) while bcrypt runs
+        await db.rollback()
 
-        # Hash the password before saving
-        hashed_password = bcrypt.hashpw(user_data["password_hash"].encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        # Hash the password before saving, on the bounded bcrypt pool
+        try:
+            hashed_password = await password_hasher.hash(user_data["password_hash"])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         # Raw SQL query to insert the new user
         query = """
@@ -30,7 +44,7 @@ def create_user(db: Session, user_data: dict):
         """
 
         # Execute the query
-        db.execute(text(query), {
+        await db.execute(text(query), {
             "emp_id": user_data["emp_id"],  # Now we are using the emp_id passed in the request
             "username": user_data["username"],
             "password_hash": hashed_password,
@@ -43,10 +57,16 @@ def create_user(db: Session, user_data: dict):
         })
 
         # Commit the transaction
-        db.commit()
+        await db.commit()
 
         return {"message": "User created successfully", "emp_id": user_data["emp_id"]}  # Return emp_id from the request
 
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Username, email or employee ID already exists")
     except Exception as e:
-        db.rollback()  # Rollback transaction in case of error
+        await db.rollback()  # Rollback transaction in case of error
         raise HTTPException(status_code=400, detail=f"Error creating user: {str(e)}")
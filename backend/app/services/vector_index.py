@@ -0,0 +1,289 @@
+# app/services/vector_index.py
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.db.connection import SessionLocal
+from .aishortlist import get_jd_embedding
+from .resume_store import file_sha256, resume_store
+
+logger = logging.getLogger(__name__)
+
+# Applicants whose scoring completed since the watermark. The scoring worker adds its
+# own results directly, but only to the index of the process it runs in; every other
+# API worker picks them up here. Their embeddings are already in the resume store.
+RECENTLY_SCORED_APPLICANTS = """
+    SELECT DISTINCT a.applicant_id, a.resume_url
+    FROM scoring_tasks t
+    JOIN applications app ON app.application_id = t.application_id
+    JOIN applicants a ON a.applicant_id = app.applicant_id
+    WHERE t.status = 'completed' AND t.updated_at >= :since AND a.resume_url IS NOT NULL
+"""
+# Uploads are saved as <sha256>.<ext> (see resume_upload), so their hash needs no read
+CONTENT_ADDRESSED_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+class VectorIndex:
+    """Exact nearest-neighbour index over applicant resume embeddings.
+
+    Vectors are unit length, so cosine similarity is a dot product. Search is NumPy
+    brute force over ``block_size`` rows at a time with an ``argpartition`` top-k per
+    block, which keeps temporaries small and answers in milliseconds for the applicant
+    pool sizes we deal with. The matrix grows by doubling so ``add`` is amortised O(1).
+
+    The initial build only takes embeddings already in the resume store; it never parses
+    or encodes a resume. After it, a background thread loads applicants scored by any
+    process every ``refresh_seconds`` (see ``RECENTLY_SCORED_APPLICANTS``), re-reading
+    ``overlap_seconds`` before the previous load so late-committing tasks are not missed.
+    """
+
+    def __init__(self, block_size: int = 65536, refresh_seconds: float = 0.0, overlap_seconds: float = 60.0):
+        self.block_size = block_size
+        self.refresh_seconds = refresh_seconds
+        self.overlap_seconds = overlap_seconds
+        self._ids = np.empty(0, dtype=np.int64)
+        self._matrix = None
+        self._size = 0
+        self._positions = {}
+        self._resume_urls = {}   # applicant_id -> resume_url its vector came from
+        self._lock = threading.RLock()
+        self._state = "empty"
+        self._build_thread = None
+        self._stop = threading.Event()
+        self._loaded_since = None  # start of the last successful load
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def add(self, applicant_id: int, vector: np.ndarray, resume_url: str = None):
+        """Insert or replace the embedding for an applicant."""
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        with self._lock:
+            if resume_url is not None:
+                self._resume_urls[applicant_id] = resume_url
+            if self._matrix is None:
+                self._matrix = np.empty((1024, vector.shape[0]), dtype=np.float32)
+                self._ids = np.empty(1024, dtype=np.int64)
+            position = self._positions.get(applicant_id)
+            if position is None:
+                if self._size == self._matrix.shape[0]:
+                    self._grow()
+                position = self._size
+                self._size += 1
+                self._positions[applicant_id] = position
+                self._ids[position] = applicant_id
+            self._matrix[position] = vector
+
+    def get(self, applicant_id: int):
+        with self._lock:
+            position = self._positions.get(applicant_id)
+            return None if position is None else self._matrix[position].copy()
+
+    def search(self, query: np.ndarray, k: int, exclude=()) -> list:
+        """Return up to ``k`` ``(applicant_id, similarity)`` pairs, best first."""
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        excluded = {int(i) for i in exclude}
+        want = k + len(excluded)
+        with self._lock:
+            if not self._size:
+                return []
+            best_ids, best_scores = [], []
+            for start in range(0, self._size, self.block_size):
+                end = min(start + self.block_size, self._size)
+                scores = self._matrix[start:end] @ query
+                if scores.shape[0] > want:
+                    top = np.argpartition(-scores, want - 1)[:want]
+                else:
+                    top = np.arange(scores.shape[0])
+                best_ids.append(self._ids[start:end][top])
+                best_scores.append(scores[top])
+
+        ids = np.concatenate(best_ids)
+        scores = np.concatenate(best_scores)
+        order = np.argsort(-scores, kind="stable")
+        results = []
+        for i in order:
+            applicant_id = int(ids[i])
+            if applicant_id in excluded:
+                continue
+            results.append((applicant_id, round(float(scores[i]), 4)))
+            if len(results) == k:
+                break
+        return results
+
+    def build_async(self):
+        """Load every stored resume embedding in a background thread, then keep loading deltas."""
+        if self._build_thread and self._build_thread.is_alive():
+            return
+        self._stop.clear()
+        self._build_thread = threading.Thread(target=self._run, name="vector-index-build", daemon=True)
+        self._build_thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self) -> int:
+        """Add applicants scored since the last load; returns how many vectors changed."""
+        started = datetime.now()
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                text(RECENTLY_SCORED_APPLICANTS),
+                {"since": self._loaded_since - timedelta(seconds=self.overlap_seconds)},
+            ).fetchall()
+        finally:
+            db.close()
+        added, _ = self._load(rows)
+        self._loaded_since = started
+        if added:
+            logger.info(f"Vector index loaded {added} newly scored resumes")
+        return added
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"state": self._state, "vectors": self._size}
+
+    def _grow(self):
+        capacity = self._matrix.shape[0] * 2
+        matrix = np.empty((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        ids = np.empty(capacity, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        self._matrix, self._ids = matrix, ids
+
+    def _run(self):
+        self._build()
+        if self._state != "ready" or not self.refresh_seconds:
+            return
+        while not self._stop.wait(self.refresh_seconds):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Vector index refresh failed: {e}")
+
+    def _load(self, rows, build: bool = True) -> tuple:
+        """Add or replace the vectors of ``(applicant_id, resume_url)`` rows; returns (loaded, skipped).
+
+        With ``build=False`` only resumes already in the resume store are loaded.
+        """
+        loaded = skipped = 0
+        for applicant_id, resume_url in rows:
+            applicant_id = int(applicant_id)
+            with self._lock:
+                if applicant_id in self._positions and self._resume_urls.get(applicant_id) == resume_url:
+                    continue
+            try:
+                # Resumes already in the resume store cost a hash and a row read, not a parse
+                embedding = (
+                    resume_store.get_or_build(resume_url).embedding if build else _stored_embedding(resume_url)
+                )
+            except Exception as e:
+                embedding = None
+                logger.debug(f"Skipping applicant {applicant_id} in vector index: {e}")
+            if embedding is None:
+                skipped += 1
+                continue
+            self.add(applicant_id, embedding, resume_url)
+            loaded += 1
+        return loaded, skipped
+
+    def _build(self):
+        self._state = "building"
+        started = time.perf_counter()
+        self._loaded_since = datetime.now()
+        db = SessionLocal()
+        try:
+            rows = db.execute(text(
+                "SELECT applicant_id, resume_url FROM applicants WHERE resume_url IS NOT NULL"
+            )).fetchall()
+        except Exception as e:
+            logger.error(f"Could not load applicants for the vector index: {e}")
+            self._state = "failed"
+            return
+        finally:
+            db.close()
+
+        # Resumes not parsed yet join through the delta refresh once they are scored
+        _, skipped = self._load(rows, build=False)
+
+        self._state = "ready"
+        logger.info(
+            f"Vector index built with {self._size} resumes ({skipped} not in the resume store yet) "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+
+def _stored_embedding(resume_url: str):
+    """Embedding of a resume file if the resume store already has it, else None."""
+    name = os.path.splitext(os.path.basename(resume_url))[0]
+    sha256 = name if CONTENT_ADDRESSED_NAME.match(name) else file_sha256(resume_url)
+    return resume_store.get_embedding(sha256)
+
+
+vector_index = VectorIndex(
+    block_size=settings.VECTOR_INDEX_BLOCK_SIZE,
+    refresh_seconds=settings.VECTOR_INDEX_REFRESH_SECONDS,
+    overlap_seconds=settings.VECTOR_INDEX_REFRESH_OVERLAP_SECONDS,
+)
+
+
+# ----------------------------------------------------------------------
+# Query helpers used by the applicants router
+# ----------------------------------------------------------------------
+
+def _require_index():
+    if vector_index.state == "empty" and not len(vector_index):
+        raise HTTPException(status_code=503, detail="Candidate index is not built yet")
+
+
+async def _with_applicant_details(db: AsyncSession, matches: list) -> list:
+    if not matches:
+        return []
+    query = text("""
+        SELECT applicant_id, first_name, last_name, email, current_role, experience_years, location
+        FROM applicants
+        WHERE applicant_id IN :applicant_ids
+    """).bindparams(bindparam("applicant_ids", expanding=True))
+    result = await db.execute(query, {"applicant_ids": [applicant_id for applicant_id, _ in matches]})
+    rows = result.mappings().fetchall()
+    details = {row["applicant_id"]: dict(row) for row in rows}
+    return [
+        {**details.get(applicant_id, {"applicant_id": applicant_id}), "similarity": similarity}
+        for applicant_id, similarity in matches
+    ]
+
+
+async def top_candidates_for_job(db: AsyncSession, job_id: int, k: int) -> list:
+    """Best-matching applicants across the whole pool for a job's description."""
+    _require_index()
+    result = (await db.execute(text("SELECT jd FROM jobs WHERE job_id = :job_id"), {"job_id": job_id})).fetchone()
+    if not result:
+        raise HTTPException(status_code=404, detail="Job not found")
+    # Encoding a JD on a cache miss is CPU-bound, so keep it off the event loop
+    jd_vector = await run_in_threadpool(get_jd_embedding, job_id, result[0] or "")
+    matches = vector_index.search(jd_vector, k)
+    return await _with_applicant_details(db, matches)
+
+
+async def similar_applicants(db: AsyncSession, applicant_id: int, k: int) -> list:
+    """Applicants whose resumes are closest to the given applicant's resume."""
+    _require_index()
+    vector = vector_index.get(applicant_id)
+    if vector is None:
+        raise HTTPException(status_code=404, detail="Applicant has no indexed resume")
+    matches = vector_index.search(vector, k, exclude=(applicant_id,))
+    return await _with_applicant_details(db, matches)
@@ -0,0 +1,77 @@
+# benchmarks/bench_async_db.py
+"""Requests per second for the async API routers against a local SQLite stand-in.
+
+Usage (from backend/)::
+
+    python -m benchmarks.bench_async_db --requests 500 --concurrency 1 8 32 --round-trip-ms 5
+
+``--round-trip-ms`` adds a sleep to every statement inside the driver's thread to
+mimic the network round trip to RDS, so a handler that awaits its queries leaves the
+event loop free for other requests while it waits.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.reporting import format_row, summarize  # noqa: E402
+from benchmarks.standin import create_standin, simulate_round_trip, standin_env  # noqa: E402
+
+ENDPOINTS = ("/api/v1/hr/jobs/", "/api/v1/applicants/applicants")
+
+
+async def run_endpoint(client, path: str, total: int, concurrency: int) -> dict:
+    latencies = []
+    counter = iter(range(total))
+
+    async def worker():
+        for _ in counter:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} returned {response.status_code}: {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def main(args):
+    import httpx
+
+    from app.db.connection import async_engine
+    from app.main import app
+
+    logging.disable(logging.INFO)  # request logs would dominate the timings
+
+    if args.round_trip_ms:
+        simulate_round_trip(async_engine, args.round_trip_ms)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ENDPOINTS:
+            await client.get(path)  # warm the pool
+            for concurrency in args.concurrency:
+                result = await run_endpoint(client, path, args.requests, concurrency)
+                print(format_row(f"{path} concurrency={concurrency}", result, width=52))
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--applicants", type=int, default=500)
+    parser.add_argument("--round-trip-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    path = create_standin(os.path.join(tempfile.mkdtemp(), "standin.db"), jobs=args.jobs, applicants=args.applicants)
+    os.environ.update(standin_env(path))
+    asyncio.run(main(args))
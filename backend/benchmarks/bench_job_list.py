@@ -0,0 +1,85 @@
+# benchmarks/bench_job_list.py
+"""Payload size and latency of the job list: full rows vs. the summary projection.
+
+Usage (from backend/)::
+
+    python -m benchmarks.bench_job_list --jobs 200 --requests 200
+
+Each variant is measured cold (job cache cleared before every request, so the query,
+projection and encoding are all timed) and warm (served from the cache).
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.standin import create_standin, standin_env  # noqa: E402
+
+FULL_FIELDS = ",".join([
+    "created_by", "title", "job_code", "department", "location", "employment_type",
+    "experience_required", "salary_range", "key_skills", "additional_skills", "openings",
+    "posted_date", "closing_date", "status", "approved_by", "approved_date",
+])
+VARIANTS = {
+    "full (all columns + jd)": {"fields": FULL_FIELDS, "include_jd": "true"},
+    "summary (default)": {},
+    "summary + include_jd": {"include_jd": "true"},
+}
+
+
+async def measure(client, params: dict, total: int, cold: bool) -> dict:
+    from app.services.job_service import job_cache
+
+    latencies = []
+    size = 0
+    for _ in range(total):
+        if cold:
+            job_cache.clear()
+        started = time.perf_counter()
+        response = await client.get("/api/v1/hr/jobs/", params=params)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            raise RuntimeError(f"job list returned {response.status_code}: {response.text[:200]}")
+        size = len(response.content)
+    latencies.sort()
+    return {
+        "bytes": size,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main(args):
+    import httpx
+
+    from app.db.connection import async_engine
+    from app.main import app
+
+    logging.disable(logging.INFO)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, params in VARIANTS.items():
+            for cold in (True, False):
+                result = await measure(client, params, args.requests, cold)
+                print(
+                    f"{name:<26} {'cold' if cold else 'warm':<5} {result['bytes']:>9} bytes  "
+                    f"p50={result['p50_ms']:7.2f} ms  p95={result['p95_ms']:7.2f} ms"
+                )
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=200)
+    args = parser.parse_args()
+
+    path = create_standin(os.path.join(tempfile.mkdtemp(), "standin.db"), jobs=args.jobs, applicants=10)
+    os.environ.update(standin_env(path))
+    asyncio.run(main(args))
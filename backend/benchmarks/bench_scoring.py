@@ -0,0 +1,100 @@
+# benchmarks/bench_scoring.py
+"""Micro-benchmarks for resume scoring: extraction, keyword matching and evaluate_resume_match.
+
+Usage (from backend/)::
+
+    python -m benchmarks.bench_scoring --resumes 50 --repeat 3
+
+Runs on synthetic PDF resumes in a temporary directory, with the resume store and JD
+embedding cache also pointed there, so nothing under uploads/ is touched:
+
+- extraction: ``text_extractor.extract_text`` per PDF (process pool already started)
+- keyword matching: compiling a job's matcher, and scoring one resume with it
+- ``evaluate_resume_match`` cold (resume not in the store: extraction + embedding)
+  and warm (store hit: only the JD lookup, dot product and keyword score)
+
+The last group needs the embedding model (``EMBEDDING_MODEL_NAME`` / ``EMBEDDING_MODEL_PATH``);
+if it cannot be loaded that group is reported as skipped.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.reporting import percentile  # noqa: E402
+from benchmarks.standin import SKILLS, create_resumes  # noqa: E402
+
+JD_TEXT = "We are hiring a backend engineer to build data services in Python and SQL. " * 20
+HIGH_PRIORITY = "python, sql, fastapi"
+NORMAL = "docker, aws, excel"
+
+
+def report(name: str, timings: list):
+    values = sorted(timings)
+    print(
+        f"{name:<44} n={len(values):<5} mean={sum(values) / len(values) * 1000:9.3f} ms  "
+        f"p50={percentile(values, 50) * 1000:9.3f} ms  p95={percentile(values, 95) * 1000:9.3f} ms"
+    )
+
+
+def timed(fn, *args) -> float:
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+def main(args, workdir: str):
+    from app.services.aishortlist import evaluate_resume_match
+    from app.services.model_registry import model_registry
+    from app.services.skill_matcher import SkillMatcher
+    from app.services.text_extraction import text_extractor
+
+    paths = create_resumes(os.path.join(workdir, "resumes"), args.resumes)
+
+    text_extractor.extract_text(paths[0])  # start the worker processes outside the timings
+    report("extraction (pypdf, process pool)", [timed(text_extractor.extract_text, p) for p in paths * args.repeat])
+
+    texts = [text_extractor.extract_text(p) for p in paths]
+    report("keyword matcher compile", [timed(SkillMatcher, HIGH_PRIORITY, NORMAL) for _ in range(200)])
+    matcher = SkillMatcher(", ".join(SKILLS[:5]), ", ".join(SKILLS[5:]))
+    report("keyword score (one resume)", [timed(matcher.score, t) for t in texts * args.repeat])
+
+    try:
+        started = time.perf_counter()
+        model_registry.get_model()
+        print(f"{'embedding model load':<44} {time.perf_counter() - started:9.3f} s")
+    except Exception as e:
+        print(f"evaluate_resume_match skipped: embedding model unavailable ({e})")
+        text_extractor.shutdown()
+        return
+
+    job_id = 1
+    evaluate_resume_match(paths[0], JD_TEXT, HIGH_PRIORITY, NORMAL, job_id)  # JD embedding + matcher
+    report(
+        "evaluate_resume_match cold (new resume)",
+        [timed(evaluate_resume_match, p, JD_TEXT, HIGH_PRIORITY, NORMAL, job_id) for p in paths[1:]],
+    )
+    report(
+        "evaluate_resume_match warm (resume store hit)",
+        [timed(evaluate_resume_match, p, JD_TEXT, HIGH_PRIORITY, NORMAL, job_id) for p in paths * args.repeat],
+    )
+    text_extractor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the resumes for warm timings")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    os.environ.setdefault("DB_SERVER", "unused")
+    os.environ.setdefault("DB_NAME", "unused")
+    os.environ.setdefault("DB_USER", "unused")
+    os.environ.setdefault("DB_PASSWORD", "unused")
+    os.environ["RESUME_STORE_DIR"] = os.path.join(workdir, "resume_store")
+    os.environ["JD_EMBEDDING_CACHE_DIR"] = os.path.join(workdir, "jd_embeddings")
+    main(args, workdir)
@@ -0,0 +1,152 @@
+# benchmarks/load_test.py
+"""Load test of the job, applicant, user, interview and analytics endpoints on the SQLite stand-in.
+
+Usage (from backend/)::
+
+    python -m benchmarks.load_test --concurrency 1 16 64 --duration 10 --round-trip-ms 2
+    python -m benchmarks.load_test --scenario jobs_list applicants_page --json results.json
+
+Boots ``create_app()`` in-process on a freshly seeded stand-in (jobs, applicants,
+applications, interview bookings and synthetic PDF resumes) and drives it through
+httpx's ASGI transport. Each scenario runs alone at every concurrency level, then all
+of them together as a weighted mix. Reports throughput and p50/p95/p99 latency per
+run; ``--json`` keeps the numbers for comparison between commits.
+
+The stand-in cannot run the T-SQL batches, so applicant creation and bulk import are
+not driven here; ``POST /api/v1/users/`` is, and includes the bcrypt hash.
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.reporting import format_row, summarize, write_json  # noqa: E402
+from benchmarks.standin import STATUSES, create_standin, simulate_round_trip, standin_env  # noqa: E402
+
+_user_ids = itertools.count(100000)
+
+
+def _new_user(rng):
+    emp_id = next(_user_ids)
+    return {
+        "emp_id": emp_id,
+        "username": f"bench{emp_id}",
+        "password_hash": "benchmark-password",
+        "email": f"bench{emp_id}@example.com",
+        "role": rng.choice(["HR", "Manager"]),
+    }
+
+
+# name -> (weight in the mixed run, request factory(rng, args) -> (method, url, kwargs))
+SCENARIOS = {
+    "jobs_list": (30, lambda rng, args: ("GET", "/api/v1/hr/jobs/", {})),
+    "jobs_list_with_jd": (5, lambda rng, args: ("GET", "/api/v1/hr/jobs/", {"params": {"include_jd": "true"}})),
+    "job_detail": (20, lambda rng, args: ("GET", f"/api/v1/hr/jobs/{rng.randint(1, args.jobs)}", {})),
+    "applicants_page": (20, lambda rng, args: ("GET", "/api/v1/applicants/applicants", {"params": {"limit": 50}})),
+    "applicants_filtered": (15, lambda rng, args: (
+        "GET", "/api/v1/applicants/applicants",
+        {"params": {"job_id": rng.randint(1, args.jobs), "status": rng.choice(STATUSES), "min_score": 0.3}},
+    )),
+    "users_applicants": (8, lambda rng, args: ("GET", "/api/v1/users/applicants", {})),
+    "users_create": (2, lambda rng, args: ("POST", "/api/v1/users/", {"json": _new_user(rng)})),
+    "interview_conflicts": (5, lambda rng, args: ("GET", "/api/v1/interviews/conflicts", {"params": {
+        "interviewer_ids": f"{rng.randint(1, 20)},{rng.randint(1, 20)}", "manager_id": 1,
+        "start": f"2030-01-0{rng.randint(1, 9)}T{rng.randint(9, 16):02d}:00:00", "duration_minutes": 60,
+    }})),
+    "analytics_funnel": (3, lambda rng, args: ("GET", "/api/v1/analytics/funnel", {
+        "params": {"job_id": rng.randint(1, args.jobs)},
+    })),
+    "analytics_breakdown": (1, lambda rng, args: ("GET", "/api/v1/analytics/funnel/breakdown", {
+        "params": {"by": rng.choice(["job", "source"])},
+    })),
+    "job_what_if": (2, lambda rng, args: ("POST", f"/api/v1/hr/jobs/{rng.randint(1, args.jobs)}/what-if", {
+        "json": {"semantic_weight": round(rng.random(), 2), "high_skill_weight": round(rng.random(), 2)},
+    })),
+    "interview_free_slots": (3, lambda rng, args: ("GET", "/api/v1/interviews/free-slots", {"params": {
+        "interviewer_ids": f"{rng.randint(1, 20)},{rng.randint(1, 20)}", "manager_id": 1, "duration_minutes": 60,
+    }})),
+}
+
+
+async def run(client, factories: list, weights: list, args, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + args.duration
+    rng = random.Random(args.seed)
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            method, url, kwargs = rng.choices(factories, weights)[0](rng, args)
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+                if errors <= 3:
+                    print(f"  {method} {url} -> {response.status_code}: {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def main(args):
+    import httpx
+
+    from app.db.connection import async_engine
+    from app.main import create_app
+
+    app = create_app()
+    logging.disable(logging.WARNING)  # slow-request and access logs would dominate the timings
+    if args.round_trip_ms:
+        simulate_round_trip(async_engine, args.round_trip_ms)
+
+    names = args.scenario or list(SCENARIOS)
+    runs = [(name, [SCENARIOS[name][1]], [1]) for name in names]
+    if len(names) > 1:
+        runs.append(("mixed", [SCENARIOS[n][1] for n in names], [SCENARIOS[n][0] for n in names]))
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        await client.get("/api/v1/hr/jobs/")  # open the first pooled connection
+        for name, factories, weights in runs:
+            for concurrency in args.concurrency:
+                summary = await run(client, factories, weights, args, concurrency)
+                print(format_row(f"{name} concurrency={concurrency}", summary))
+                results.append({"scenario": name, "concurrency": concurrency, **summary})
+    await async_engine.dispose()
+
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), help="default: all, plus a mixed run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per run")
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--applicants", type=int, default=5000)
+    parser.add_argument("--resumes", type=int, default=50, help="synthetic PDF resumes to seed")
+    parser.add_argument("--interviews", type=int, default=2000, help="interview bookings to seed")
+    parser.add_argument("--round-trip-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = create_standin(
+        os.path.join(workdir, "standin.db"), jobs=args.jobs, applicants=args.applicants, seed=args.seed,
+        resume_dir=os.path.join(workdir, "resumes"), resumes=args.resumes, interviews=args.interviews,
+    )
+    os.environ.update(standin_env(path))
+    asyncio.run(main(args))
@@ -0,0 +1,55 @@
+# benchmarks/query_budget.py
+"""Assert per-request database round trips (X-Query-Count) against the SQLite stand-in.
+
+Usage (from backend/)::
+
+    python -m benchmarks.query_budget
+
+Exits non-zero if any endpoint issues more statements than its budget. The write
+paths, whose T-SQL batches SQLite can't run, are budgeted in tests/test_query_budget.py.
+"""
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.standin import create_standin, standin_env  # noqa: E402
+
+# (method, path, params, max statements)
+BUDGETS = [
+    ("GET", "/api/v1/hr/jobs/", None, 1),
+    ("GET", "/api/v1/hr/jobs/", None, 0),   # second call is served from the job cache
+    ("GET", "/api/v1/hr/jobs/1", None, 1),
+    ("GET", "/api/v1/applicants/applicants", None, 1),
+    ("GET", "/api/v1/applicants/applicants", {"job_id": 1, "status": "applied", "min_score": 0.2}, 1),
+]
+
+
+async def main() -> int:
+    import httpx
+
+    from app.db.connection import async_engine
+    from app.main import app
+
+    logging.disable(logging.INFO)
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for method, path, params, budget in BUDGETS:
+            response = await client.request(method, path, params=params)
+            count = int(response.headers["X-Query-Count"])
+            ok = response.status_code < 400 and count <= budget
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {method} {path} {params or ''} -> {response.status_code}, "
+                  f"{count} statement(s), budget {budget}")
+    await async_engine.dispose()
+    return failures
+
+
+if __name__ == "__main__":
+    path = create_standin(os.path.join(tempfile.mkdtemp(), "standin.db"), jobs=20, applicants=200)
+    os.environ.update(standin_env(path))
+    sys.exit(1 if asyncio.run(main()) else 0)
@@ -0,0 +1,38 @@
+# benchmarks/reporting.py
+"""Latency percentiles and throughput shared by the benchmark scripts."""
+import json
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: list, elapsed: float, errors: int = 0) -> dict:
+    """Summary of per-request latencies (seconds) measured over ``elapsed`` wall seconds."""
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "rps": len(values) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": (values[-1] if values else 0.0) * 1000,
+    }
+
+
+def format_row(name: str, summary: dict, width: int = 40) -> str:
+    return (
+        f"{name:<{width}} {summary['rps']:9.1f} req/s  p50={summary['p50_ms']:8.2f} ms  "
+        f"p95={summary['p95_ms']:8.2f} ms  p99={summary['p99_ms']:8.2f} ms  errors={summary['errors']}"
+    )
+
+
+def write_json(path: str, results: list):
+    """Write results for comparison between runs (e.g. before and after a change)."""
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
@@ -0,0 +1,332 @@
+# benchmarks/standin.py
+"""Local SQLite stand-in for the SQL Server schema, used by the benchmarks.
+
+Only the tables and columns the benchmarked endpoints touch are created. Point the
+app at the file before importing it::
+
+    os.environ.update(standin_env(path))
+"""
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+SCHEMA = """
+CREATE TABLE users (
+    emp_id INTEGER PRIMARY KEY,
+    username VARCHAR(50) NOT NULL UNIQUE,
+    password_hash VARCHAR(255) NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE,
+    role VARCHAR(20),
+    full_name VARCHAR(100),
+    department VARCHAR(100),
+    designation VARCHAR(100),
+    status VARCHAR(10),
+    last_login DATETIME NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE applicants (
+    applicant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    first_name VARCHAR(50),
+    last_name VARCHAR(50),
+    email VARCHAR(100),
+    phone VARCHAR(20),
+    linkedin_url VARCHAR(255),
+    resume_url VARCHAR(255),
+    experience_years DECIMAL(4,1),
+    education VARCHAR(255),
+    current_company VARCHAR(255),
+    current_role VARCHAR(100),
+    expected_ctc DECIMAL(10,2),
+    notice_period_days INT,
+    skills TEXT,
+    location VARCHAR(100),
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_by INT REFERENCES users(emp_id),
+    title VARCHAR(150),
+    job_code VARCHAR(50),
+    department VARCHAR(100),
+    location VARCHAR(100),
+    employment_type VARCHAR(20),
+    experience_required VARCHAR(50),
+    salary_range VARCHAR(50),
+    jd TEXT,
+    key_skills TEXT,
+    additional_skills TEXT,
+    semantic_weight DECIMAL(4,3) NULL,
+    high_skill_weight DECIMAL(4,3) NULL,
+    openings INT,
+    posted_date DATETIME,
+    closing_date DATETIME,
+    status VARCHAR(10),
+    approved_by INT NULL REFERENCES users(emp_id),
+    approved_date DATETIME NULL
+);
+CREATE TABLE applications (
+    application_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INT REFERENCES jobs(job_id),
+    applicant_id INT REFERENCES applicants(applicant_id),
+    applied_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+    source VARCHAR(100),
+    skills_matching_score DECIMAL(5,2),
+    jd_matching_score DECIMAL(5,2),
+    resume_overall_score DECIMAL(5,2),
+    high_skill_match DECIMAL(5,4),
+    normal_skill_match DECIMAL(5,4),
+    application_status VARCHAR(30),
+    assigned_hr INT NULL REFERENCES users(emp_id),
+    assigned_manager INT NULL REFERENCES users(emp_id),
+    comments TEXT,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE application_status_history (
+    history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id INT NOT NULL REFERENCES applications(application_id),
+    from_status VARCHAR(30),
+    to_status VARCHAR(30) NOT NULL,
+    changed_by INT REFERENCES users(emp_id),
+    reason VARCHAR(500),
+    changed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE interview_schedule (
+    schedule_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id INT REFERENCES applications(application_id),
+    round_number INT,
+    round_type VARCHAR(50),
+    scheduled_date DATETIME,
+    duration_minutes INT,
+    interviewer_ids TEXT,
+    manager_id INT NULL REFERENCES users(emp_id),
+    meeting_link VARCHAR(255),
+    location VARCHAR(255),
+    schedule_status VARCHAR(20),
+    remarks TEXT,
+    created_by INT REFERENCES users(emp_id),
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE interview_rounds_attended (
+    round_attended_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    schedule_id INT REFERENCES interview_schedule(schedule_id),
+    attended BIT,
+    attendance_status VARCHAR(20),
+    result VARCHAR(10),
+    recorded_by INT REFERENCES users(emp_id),
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE interview_performance (
+    performance_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    round_attended_id INT REFERENCES interview_rounds_attended(round_attended_id),
+    interviewer_id INT REFERENCES users(emp_id),
+    technical_score DECIMAL(5,2),
+    communication_score DECIMAL(5,2),
+    problem_solving_score DECIMAL(5,2),
+    domain_knowledge_score DECIMAL(5,2),
+    team_fit_score DECIMAL(5,2),
+    attitude_score DECIMAL(5,2),
+    final_rating DECIMAL(5,2),
+    recommendation VARCHAR(20),
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE confirmed_candidates (
+    confirm_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id INT UNIQUE REFERENCES applications(application_id),
+    offer_date DATE,
+    joining_status VARCHAR(20),
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE scoring_tasks (
+    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id INT REFERENCES applications(application_id),
+    status VARCHAR(20),
+    attempts INT DEFAULT 0,
+    last_error TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Same text format SQLAlchemy's SQLite dialect writes, so bound datetimes compare correctly
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+RESUME_PHRASES = [
+    "Built REST services and data pipelines", "Led a team of four engineers",
+    "Migrated batch jobs to the cloud", "Improved query latency by tuning indexes",
+    "Wrote automated tests and CI pipelines", "Mentored junior developers",
+]
+
+SKILLS = ["python", "sql", "fastapi", "react", "aws", "docker", "kubernetes", "java", "spark", "excel"]
+STATUSES = ["applied", "shortlisted", "under_review", "interview_scheduled", "offered", "rejected", "hired"]
+SOURCES = ["portal", "referral", "linkedin", "campus"]
+
+
+def standin_env(path: str) -> dict:
+    """Environment that points both app engines at the SQLite file."""
+    return {
+        "DB_SERVER": "standin",
+        "DB_NAME": "standin",
+        "DB_USER": "standin",
+        "DB_PASSWORD": "standin",
+        "DB_URL": f"sqlite:///{path}",
+        "DB_ASYNC_URL": f"sqlite+aiosqlite:///{path}",
+        "DB_POOL_PRE_PING": "false",
+        "VECTOR_INDEX_BUILD_ON_STARTUP": "false",
+        "EMBEDDING_WARMUP_ON_STARTUP": "false",
+    }
+
+
+def simulate_round_trip(async_engine, round_trip_ms: float):
+    """Add ``round_trip_ms`` to every statement on the async engine to mimic a network hop.
+
+    aiosqlite runs each statement in its own thread and sqlite3 calls the trace
+    callback from that thread, so the sleep never touches the event loop.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.util import await_only
+
+    delay = round_trip_ms / 1000
+
+    @event.listens_for(async_engine.sync_engine.pool, "connect")
+    def _simulate_round_trip(dbapi_connection, connection_record):
+        driver = dbapi_connection.driver_connection
+        await_only(driver._execute(driver._conn.set_trace_callback, lambda statement: time.sleep(delay)))
+
+
+def create_standin(path: str, jobs: int = 50, applicants: int = 2000, seed: int = 7,
+                   resume_dir: str = None, resumes: int = 20, interviews: int = 0, interviewers: int = 20) -> str:
+    """Create (or recreate) the stand-in database with deterministic sample data.
+
+    With ``resume_dir``, ``resumes`` synthetic PDFs are written there and the
+    applicants' ``resume_url`` values point at them (round-robin). ``interviews``
+    bookings are spread over the next weeks' working hours among ``interviewers``
+    interviewer ids (they may overlap, as legacy data does).
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(seed)
+    resume_paths = create_resumes(resume_dir, resumes, seed) if resume_dir else None
+    now = datetime(2024, 1, 1)
+
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executescript(SCHEMA)
+        conn.execute(
+            "INSERT INTO users (emp_id, username, password_hash, email, role, status) VALUES (1, 'hr', 'x', 'hr@example.com', 'HR', 'active')"
+        )
+        conn.executemany(
+            """INSERT INTO jobs (created_by, title, job_code, department, location, employment_type,
+                   experience_required, salary_range, jd, key_skills, additional_skills, openings,
+                   posted_date, status)
+               VALUES (1, ?, ?, 'Engineering', 'Remote', 'Full-time', '3+ years', '10-20', ?, ?, ?, 2, ?, ?)""",
+            [
+                (
+                    f"Engineer {i}", f"ENG-{i:04d}",
+                    "We are looking for an engineer. " * 40,
+                    ", ".join(rng.sample(SKILLS, 3)), ", ".join(rng.sample(SKILLS, 3)),
+                    (now - timedelta(days=i)).strftime(DATETIME_FORMAT), "open" if i % 5 else "closed",
+                )
+                for i in range(1, jobs + 1)
+            ],
+        )
+        conn.executemany(
+            """INSERT INTO applicants (first_name, last_name, email, phone, experience_years,
+                   current_company, current_role, expected_ctc, notice_period_days, skills, location, resume_url)
+               VALUES (?, ?, ?, '555-0100', ?, 'Acme', 'Developer', ?, 30, ?, 'Remote', ?)""",
+            [
+                (
+                    f"First{i}", f"Last{i}", f"applicant{i}@example.com", rng.randint(0, 15),
+                    rng.randint(5, 40) * 1000, ", ".join(rng.sample(SKILLS, 4)),
+                    resume_paths[i % len(resume_paths)] if resume_paths else f"uploads/resumes/{i}.pdf",
+                )
+                for i in range(1, applicants + 1)
+            ],
+        )
+        conn.executemany(
+            """INSERT INTO applications (job_id, applicant_id, applied_date, source, skills_matching_score,
+                   jd_matching_score, resume_overall_score, application_status, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    rng.randint(1, jobs), i, (now + timedelta(minutes=i // 3)).strftime(DATETIME_FORMAT),
+                    SOURCES[i % len(SOURCES)],
+                    round(rng.random(), 2), round(rng.random(), 2), round(rng.random(), 2),
+                    rng.choice(STATUSES), (now + timedelta(minutes=i)).strftime(DATETIME_FORMAT),
+                )
+                for i in range(1, applicants + 1)
+            ],
+        )
+        # Own generator, so adding the skill split leaves the rest of the data unchanged
+        split_rng = random.Random(seed + 1)
+        conn.executemany(
+            "UPDATE applications SET high_skill_match = ?, normal_skill_match = ? WHERE application_id = ?",
+            [(round(split_rng.random(), 4), round(split_rng.random(), 4), i) for i in range(1, applicants + 1)],
+        )
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        conn.executemany(
+            """INSERT INTO interview_schedule (application_id, round_number, round_type, scheduled_date,
+                   duration_minutes, interviewer_ids, manager_id, schedule_status, created_by, updated_at)
+               VALUES (?, 1, 'technical', ?, ?, ?, 1, ?, 1, ?)""",
+            [
+                (
+                    rng.randint(1, applicants),
+                    (today + timedelta(days=rng.randint(1, 28), hours=rng.randint(9, 16),
+                                       minutes=rng.choice((0, 15, 30, 45)))).strftime(DATETIME_FORMAT),
+                    rng.choice((30, 45, 60, 90)),
+                    ",".join(str(n) for n in rng.sample(range(1, interviewers + 1), rng.randint(1, 3))),
+                    "scheduled" if rng.random() < 0.9 else "cancelled",
+                    now.strftime(DATETIME_FORMAT),
+                )
+                for _ in range(interviews)
+            ],
+        )
+    conn.close()
+    return path
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf_resume(path: str, lines: list) -> str:
+    """Write a one-page text PDF (Helvetica, no dependencies) that pypdf can extract."""
+    content = "BT /F1 11 Tf 14 TL 50 780 Td " + " ".join(f"({_pdf_escape(line)}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(content.encode('latin-1'))} >>\nstream\n{content}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as fh:
+        fh.write(out)
+    return path
+
+
+def create_resumes(directory: str, count: int, seed: int = 7) -> list:
+    """Write ``count`` synthetic PDF resumes; returns their paths."""
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    for i in range(1, count + 1):
+        lines = [f"Candidate {i}", f"Skills: {', '.join(rng.sample(SKILLS, 5))}"]
+        lines += [f"- {phrase}" for phrase in rng.sample(RESUME_PHRASES, 4)]
+        lines += [f"Experience: {rng.randint(0, 15)} years"]
+        paths.append(write_pdf_resume(os.path.join(directory, f"{i}.pdf"), lines))
+    return paths
@@ -0,0 +1,36 @@
+# tests/conftest.py
+"""Point the app at a fresh SQLite stand-in before any app module is imported.
+
+Run from backend/::
+
+    python -m pytest tests
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.standin import create_standin, standin_env  # noqa: E402
+
+STANDIN_PATH = os.path.join(tempfile.mkdtemp(prefix="hiring-tests-"), "standin.db")
+os.environ.update(standin_env(STANDIN_PATH))
+os.environ.setdefault("LOG_FORMAT", "text")
+create_standin(STANDIN_PATH, jobs=5, applicants=200, seed=7, interviews=0)
+
+
+@pytest.fixture(scope="session")
+def standin_path() -> str:
+    return STANDIN_PATH
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client without startup events: no scoring workers, model warm-up or index build."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
@@ -0,0 +1,44 @@
+# tests/test_applicant_paging.py
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def application_ids(standin_path) -> list:
+    """Every application id, after giving some rows a shared applied_date and some none at all."""
+    with sqlite3.connect(standin_path) as conn:
+        ids = [row[0] for row in conn.execute("SELECT application_id FROM applications ORDER BY application_id")]
+        conn.executemany("UPDATE applications SET applied_date = '2026-01-05 10:00:00' WHERE application_id = ?",
+                         [(i,) for i in ids[:12]])
+        conn.executemany("UPDATE applications SET applied_date = NULL WHERE application_id = ?",
+                         [(i,) for i in ids[-9:]])
+    return ids
+
+
+def _walk(client, path: str, limit: int, max_pages: int = 1000) -> list:
+    seen, cursor = [], None
+    for _ in range(max_pages):
+        response = client.get(path, params={"limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        seen += [row["application_id"] for row in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return seen
+    pytest.fail(f"{path} still had a next page after {max_pages} pages")
+
+
+@pytest.mark.parametrize("path", ["/api/v1/applicants/applicants", "/api/v1/users/applicants"])
+def test_pages_reach_every_row_once_including_ties_and_null_dates(client, application_ids, path):
+    seen = _walk(client, path, limit=5)
+
+    assert sorted(seen) == application_ids
+    # Rows without an applied_date come last, newest id first
+    assert seen[-9:] == sorted(application_ids[-9:], reverse=True)
+
+
+def test_users_applicants_is_capped_by_limit(client, application_ids):
+    response = client.get("/api/v1/users/applicants", params={"limit": 3})
+
+    assert len(response.json()) == 3
+    assert "X-Next-Cursor" in response.headers
@@ -0,0 +1,133 @@
+# tests/test_cache.py
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    """Manual clock for the cache's expiry checks; advance ``clock.now`` to move time."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def run():
+        release = asyncio.Event()
+
+        async def loader():
+            calls.append(1)
+            await release.wait()
+            return {"jobs": [1, 2]}
+
+        tasks = [asyncio.create_task(cache.get_or_load("jobs", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    entries = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert cache.coalesced == 4
+    assert all(entry is entries[0] for entry in entries)
+    assert entries[0].value == {"jobs": [1, 2]}
+
+
+def test_follower_loads_itself_when_the_leader_is_cancelled():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def run():
+        started = asyncio.Event()
+
+        async def slow_loader():
+            calls.append("leader")
+            started.set()
+            await asyncio.Event().wait()  # never finishes; only cancellation ends it
+
+        async def loader():
+            calls.append("follower")
+            return "fresh"
+
+        leader = asyncio.create_task(cache.get_or_load("key", slow_loader))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    entry = asyncio.run(run())
+
+    assert entry.value == "fresh"
+    assert calls == ["leader", "follower"]
+    assert cache.get("key").value == "fresh"
+
+
+def test_loader_errors_reach_every_waiter_and_are_not_cached():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+
+    async def run():
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            raise RuntimeError("database down")
+
+        tasks = [asyncio.create_task(cache.get_or_load("key", loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert [str(result) for result in results] == ["database down"] * 3
+    assert cache.get("key") is None
+
+
+def test_load_overlapping_an_invalidate_is_served_but_not_kept():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+
+    async def loader():
+        cache.invalidate("key")  # a write lands while the read is in flight
+        return "stale"
+
+    entry = asyncio.run(cache.get_or_load("key", loader))
+
+    assert entry.value == "stale"
+    assert cache.get("key") is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=30)
+    cache.set("key", "value")
+
+    clock.now += 29.9
+    assert cache.get("key").value == "value"
+    clock.now += 0.1
+    assert cache.get("key") is None
+    assert cache.expirations == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(max_entries=2, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a").value == 1
+    assert cache.get("c").value == 3
+    assert cache.evictions == 1
@@ -0,0 +1,78 @@
+# tests/test_hiring_analytics.py
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+
+from app.services.hiring_analytics import STAGE_INDEX, HiringAnalytics
+
+APPLIED = datetime(2026, 3, 2, 9, 0)
+
+
+def _reached(analytics: HiringAnalytics, **slice_) -> dict:
+    return {stage["stage"]: stage["reached"] for stage in analytics.funnel(**slice_)["stages"]}
+
+
+def _apply(analytics: HiringAnalytics, application_id: int, status: str, **kwargs):
+    analytics.apply(application_id, kwargs.pop("job_id", 1), kwargs.pop("source", "referral"), status,
+                    APPLIED, APPLIED, kwargs.pop("score", None), **kwargs)
+
+
+def test_rejection_keeps_the_furthest_stage_reached():
+    analytics = HiringAnalytics(refresh_seconds=60, overlap_seconds=60)
+    _apply(analytics, 1, "shortlisted")
+    _apply(analytics, 2, "applied")
+
+    analytics.apply_status_change(1, "rejected", APPLIED + timedelta(days=2))
+    # A later refresh of the same row must not pull it back either
+    _apply(analytics, 1, "rejected", history_stage=STAGE_INDEX["shortlisted"])
+
+    assert _reached(analytics) == {"applied": 2, "shortlisted": 1, "interview_scheduled": 0, "offered": 0, "hired": 0}
+    assert analytics.funnel()["by_status"] == {"rejected": 1, "applied": 1}
+
+
+def test_first_load_of_a_rejected_application_counts_its_history():
+    analytics = HiringAnalytics(refresh_seconds=60, overlap_seconds=60)
+    _apply(analytics, 1, "rejected", history_stage=STAGE_INDEX["offered"], job_id=7, score=0.8)
+    _apply(analytics, 2, "rejected", job_id=7, score=0.4)
+    _apply(analytics, 3, "rejected", interviewed=True, job_id=8)
+
+    assert _reached(analytics, job_id=7) == {"applied": 2, "shortlisted": 1, "interview_scheduled": 1,
+                                             "offered": 1, "hired": 0}
+    assert _reached(analytics) == {"applied": 3, "shortlisted": 2, "interview_scheduled": 2, "offered": 1, "hired": 0}
+    assert analytics.scores(job_id=7)["avg_resume_overall_score"] == 0.6
+
+
+def test_reapplying_a_row_leaves_the_sums_unchanged():
+    analytics = HiringAnalytics(refresh_seconds=60, overlap_seconds=60)
+    for _ in range(3):
+        _apply(analytics, 1, "interview_scheduled", score=0.5, source="careers")
+
+    for slice_ in ({}, {"job_id": 1}, {"source": "careers"}, {"job_id": 1, "source": "careers"}):
+        assert list(_reached(analytics, **slice_).values()) == [1, 1, 1, 0, 0]
+        assert analytics.scores(**slice_)["scored_applications"] == 1
+
+
+def test_refresh_reads_the_furthest_stage_from_status_history(standin_path):
+    from app.db.connection import AsyncSessionLocal
+
+    with sqlite3.connect(standin_path) as conn:
+        application_id = conn.execute("SELECT MAX(application_id) FROM applications").fetchone()[0]
+        conn.execute("UPDATE applications SET application_status = 'rejected' WHERE application_id = ?",
+                     (application_id,))
+        conn.execute("DELETE FROM interview_schedule WHERE application_id = ?", (application_id,))
+        conn.executemany(
+            "INSERT INTO application_status_history (application_id, from_status, to_status, changed_at) "
+            "VALUES (?, ?, ?, ?)",
+            [(application_id, "applied", "shortlisted", "2026-03-03 09:00:00"),
+             (application_id, "shortlisted", "rejected", "2026-03-05 09:00:00")],
+        )
+
+    async def load():
+        analytics = HiringAnalytics(refresh_seconds=60, overlap_seconds=60)
+        async with AsyncSessionLocal() as db:
+            await analytics.refresh(db)
+        return analytics
+
+    analytics = asyncio.run(load())
+
+    assert analytics._applications[application_id].furthest == STAGE_INDEX["shortlisted"]
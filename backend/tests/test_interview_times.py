@@ -0,0 +1,54 @@
+# tests/test_interview_times.py
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from app.api.v1.interviews.schemas import InterviewScheduleCreate, InterviewScheduleUpdate, to_server_time
+
+
+def _next_weekday_at(hour: int) -> datetime:
+    day = (datetime.now() + timedelta(days=7)).replace(hour=hour, minute=0, second=0, microsecond=0)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+
+def _book(standin_path: str, start: datetime, interviewer_id: int) -> int:
+    # Inserted directly: the booking path itself takes SQL Server application locks
+    with sqlite3.connect(standin_path) as conn:
+        cursor = conn.execute(
+            """INSERT INTO interview_schedule (application_id, round_number, scheduled_date, duration_minutes,
+                   interviewer_ids, schedule_status, updated_at)
+               VALUES (1, 1, ?, 60, ?, 'scheduled', ?)""",
+            (start.strftime("%Y-%m-%d %H:%M:%S"), str(interviewer_id), datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+        return cursor.lastrowid
+
+
+def _utc_z(local: datetime) -> str:
+    return local.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_schemas_convert_offsets_to_naive_server_time():
+    start = _next_weekday_at(10)
+    created = InterviewScheduleCreate(application_id=1, scheduled_date=_utc_z(start), interviewer_ids=[1])
+    updated = InterviewScheduleUpdate(scheduled_date=start.astimezone(timezone(timedelta(hours=5, minutes=30))))
+    assert created.scheduled_date == start and created.scheduled_date.tzinfo is None
+    assert updated.scheduled_date == start and updated.scheduled_date.tzinfo is None
+    assert to_server_time(start) == start
+
+
+def test_z_suffixed_queries_match_naive_bookings(client, standin_path):
+    start = _next_weekday_at(10)
+    schedule_id = _book(standin_path, start, interviewer_id=901)
+
+    response = client.get("/api/v1/interviews/conflicts", params={
+        "interviewer_ids": "901", "start": _utc_z(start + timedelta(minutes=30)), "duration_minutes": 60,
+    })
+    assert response.status_code == 200
+    assert [conflict["schedule_id"] for conflict in response.json()] == [schedule_id]
+
+    response = client.get("/api/v1/interviews/free-slots", params={
+        "interviewer_ids": "901", "duration_minutes": 60, "window_start": _utc_z(start), "limit": 1,
+    })
+    assert response.status_code == 200
+    assert response.json()[0]["start"] == (start + timedelta(hours=1)).isoformat()
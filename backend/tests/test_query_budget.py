@@ -0,0 +1,146 @@
+# tests/test_query_budget.py
+"""Round-trip budgets for the write paths.
+
+They send T-SQL batches that SQLite can't run, so they go to a recording session
+instead: ``create_applicant``, the bulk import and the scoring worker's claim and
+complete run unchanged, every ``execute`` counts as one round trip under
+``count_queries``, and canned results stand in for what SQL Server returns.
+The GET endpoints are budgeted by ``python -m benchmarks.query_budget``.
+"""
+import asyncio
+import io
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+
+from app.config import settings
+from app.db.connection import count_queries, query_counter
+from app.services import scoring_queue as scoring_queue_module
+from app.services.applicant_service import create_applicant
+from app.services.bulk_import import bulk_import_applicants
+from app.services.resume_upload import StoredResume
+
+# Statements one bulk-import batch sends, whatever its size: create staging, load it
+# (one executemany), two MERGEs, the task INSERT, the id SELECT and drop staging
+BULK_BATCH_STATEMENTS = 7
+
+
+class _Result:
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+
+    def mappings(self):
+        return self
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+    def scalar(self):
+        row = self.fetchone()
+        return None if row is None else next(iter(row.values() if isinstance(row, dict) else row))
+
+
+class RecordingSession:
+    """Stands in for a Session: each ``execute`` is one round trip on the active counter."""
+
+    def __init__(self):
+        self.statements = []
+        self._staged = []
+
+    def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        self.statements.append(sql)
+        counter = query_counter.get()
+        if counter is not None:
+            counter.count += 1
+        return _Result(self._respond(sql, params))
+
+    def _respond(self, sql: str, params):
+        if "INSERT INTO applicants" in sql and "@applicant" in sql:
+            return [{"applicant_id": 1, "application_id": 1, "task_id": 1}]
+        if sql.startswith("INSERT INTO #bulk_applicants"):
+            self._staged = params
+        elif "FROM #bulk_ids ids JOIN #bulk_apps" in sql:
+            return [(row["row_no"], row["row_no"], row["row_no"]) for row in self._staged]
+        elif sql.startswith("SELECT 1 FROM jobs"):
+            return [(1,)]
+        elif sql.startswith("UPDATE t SET status = 'running'"):
+            return [{
+                "application_id": 1, "job_id": 1, "applicant_id": 1, "resume_url": "resume.pdf", "jd": "jd",
+                "key_skills": "python", "additional_skills": "sql", "semantic_weight": None, "high_skill_weight": None,
+            }]
+        return []
+
+    @contextmanager
+    def begin(self):
+        yield self
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class AsyncRecordingSession(RecordingSession):
+    async def execute(self, statement, params=None):
+        return RecordingSession.execute(self, statement, params)
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def enqueued(monkeypatch) -> list:
+    """Task ids handed to the scoring queue; nothing reaches the real workers."""
+    task_ids = []
+    monkeypatch.setattr(scoring_queue_module.scoring_queue, "enqueue", task_ids.append)
+    monkeypatch.setattr(scoring_queue_module.scoring_queue, "_enqueue_later", lambda task_id, delay: None)
+    return task_ids
+
+
+def test_create_applicant_is_one_round_trip(enqueued):
+    with count_queries() as counter:
+        asyncio.run(create_applicant(
+            AsyncRecordingSession(), {"first_name": "A", "last_name": "B", "email": "a@example.com"},
+            StoredResume("resume.pdf", "0" * 64, 1, "pdf", "resume.pdf", False), 1, "test", "applied",
+        ))
+    assert counter.count == 1
+    assert enqueued == [1]
+
+
+def test_bulk_import_is_one_check_plus_fixed_statements_per_batch(enqueued):
+    rows = settings.BULK_IMPORT_BATCH_SIZE * 2 + 1
+    csv_bytes = "first_name,last_name,email\n" + "".join(f"F{i},L{i},u{i}@example.com\n" for i in range(rows))
+    with count_queries() as counter:
+        report = bulk_import_applicants(RecordingSession(), io.BytesIO(csv_bytes.encode()), None, 1, "test", "applied")
+
+    batches = -(-rows // settings.BULK_IMPORT_BATCH_SIZE)
+    assert report["created"] == rows
+    assert counter.count == 1 + batches * BULK_BATCH_STATEMENTS
+
+
+def test_scoring_worker_claims_and_completes_in_two_round_trips(monkeypatch, enqueued):
+    session = RecordingSession()
+    monkeypatch.setattr(scoring_queue_module, "SessionLocal", lambda: session)
+    monkeypatch.setattr(scoring_queue_module, "evaluate_resume_match", lambda **kwargs: {
+        "semantic_similarity": 0.5, "keyword_match_score": 0.5, "high_skill_match": 0.5,
+        "normal_skill_match": 0.5, "resume_overall_score": 0.5, "resume_sha256": None,
+    })
+
+    with count_queries() as counter:
+        scoring_queue_module.scoring_queue._process(1)
+
+    assert counter.count == 2
+    assert session.statements[0].startswith("UPDATE t SET status = 'running'")
+    assert "SET status = 'completed'" in session.statements[1]
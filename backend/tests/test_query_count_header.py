@@ -0,0 +1,30 @@
+# tests/test_query_count_header.py
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.metrics import metrics_registry
+from app.main import create_app
+
+
+@pytest.mark.parametrize("metrics_enabled", [True, False])
+def test_query_count_header_does_not_depend_on_metrics(monkeypatch, metrics_enabled):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", metrics_enabled)
+    monkeypatch.setattr(settings, "DB_QUERY_COUNT_HEADER_ENABLED", True)
+    client = TestClient(create_app())
+
+    response = client.get("/api/v1/applicants/applicants", params={"limit": 1})
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Query-Count"]) >= 1
+    assert (client.get("/metrics").status_code == 200) is metrics_enabled
+
+
+def test_metrics_off_records_nothing(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    client = TestClient(create_app())
+    before = metrics_registry.render({})
+
+    client.get("/api/v1/applicants/applicants", params={"limit": 1})
+
+    assert metrics_registry.render({}) == before
@@ -0,0 +1,57 @@
+# tests/test_vector_index.py
+import hashlib
+import sqlite3
+
+import numpy as np
+import pytest
+
+from app.services import vector_index as vector_index_module
+from app.services.vector_index import VectorIndex
+
+
+class _Store:
+    """Resume store holding the given embeddings; building one fails the test."""
+
+    def __init__(self, embeddings: dict):
+        self.embeddings = embeddings
+
+    def get_embedding(self, sha256: str):
+        return self.embeddings.get(sha256)
+
+    def get_or_build(self, path: str, sha256: str = None):
+        pytest.fail(f"The initial build parsed {path}")
+
+
+@pytest.fixture
+def resume_urls(standin_path, tmp_path):
+    """Resume urls for the first four applicants: three uploads (two stored) and one legacy file (stored)."""
+    stored, missing = hashlib.sha256(b"a").hexdigest(), hashlib.sha256(b"b").hexdigest()
+    legacy = tmp_path / "cv.pdf"
+    legacy.write_bytes(b"legacy resume")
+    urls = [
+        f"uploads/{stored[:2]}/{stored}.pdf",
+        f"uploads/{stored[:2]}/{stored}.docx",
+        f"uploads/{missing[:2]}/{missing}.pdf",
+        str(legacy),
+    ]
+    with sqlite3.connect(standin_path) as conn:
+        ids = [row[0] for row in conn.execute("SELECT applicant_id FROM applicants ORDER BY applicant_id LIMIT 4")]
+        conn.executemany("UPDATE applicants SET resume_url = ? WHERE applicant_id = ?", list(zip(urls, ids)))
+    yield dict(zip(ids, urls)), {stored: np.ones(4), hashlib.sha256(b"legacy resume").hexdigest(): np.zeros(4)}
+    with sqlite3.connect(standin_path) as conn:
+        conn.executemany("UPDATE applicants SET resume_url = NULL WHERE applicant_id = ?", [(i,) for i in ids])
+
+
+def test_build_only_loads_embeddings_already_in_the_resume_store(monkeypatch, resume_urls):
+    urls, embeddings = resume_urls
+    monkeypatch.setattr(vector_index_module, "resume_store", _Store(embeddings))
+    index = VectorIndex()
+
+    index._build()
+
+    assert index.state == "ready"
+    assert len(index) == 3
+    ids = list(urls)
+    assert index.get(ids[2]) is None
+    assert index.get(ids[0]).tolist() == [1.0] * 4
+    assert index.get(ids[3]).tolist() == [0.0] * 4